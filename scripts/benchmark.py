@@ -0,0 +1,444 @@
+#!/usr/bin/env python
+"""
+Client-side benchmarks for TursoPy. No network or credentials are needed: end-to-end
+runs use the sqlite3-backed stand-in server from turso_python.local_server.
+
+Usage:
+  python scripts/benchmark.py                              # run everything
+  python scripts/benchmark.py --only format_args,normalize  # substring filter on names
+  python scripts/benchmark.py --output bench/0.1.8.json     # save results as JSON
+  python scripts/benchmark.py --compare bench/0.1.8.json    # report changes vs a saved run
+  python scripts/benchmark.py --quick                       # fewer iterations, for CI smoke runs
+
+Micro benchmarks report the best mean time per call over several repeats. Throughput
+benchmarks report queries per second for a fixed number of queries. Startup benchmarks
+time an import statement in a fresh interpreter and report the best of --repeat runs.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+# Ensure project root is on sys.path for local imports when running from scripts/
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import anyio  # noqa: E402
+
+from turso_python.async_connection import AsyncTursoConnection  # noqa: E402
+from turso_python.batch import TursoBatch  # noqa: E402
+from turso_python.connection import TursoConnection  # noqa: E402
+from turso_python.local_server import (  # noqa: E402
+    AsyncLocalTransport,
+    HranaSQLiteServer,
+    LocalHranaHTTPServer,
+    LocalTransport,
+)
+from turso_python.response_parser import TursoResponseParser  # noqa: E402
+from turso_python.schema_validator import SchemaValidator  # noqa: E402
+from turso_python.transport import Transport, TransportResponse  # noqa: E402
+from turso_python.turso_vector import TursoVector  # noqa: E402
+
+LOCAL_URL = "http://localhost"
+TOKEN = "bench"
+
+# name -> (kind, factory); factories receive the parsed CLI options
+BENCHMARKS: dict[str, tuple[str, Callable[[argparse.Namespace], Any]]] = {}
+
+
+def micro(name: str):
+    """Register a micro benchmark. The factory returns a zero-argument callable to time."""
+    def deco(factory):
+        BENCHMARKS[name] = ("micro", factory)
+        return factory
+    return deco
+
+
+def throughput(name: str):
+    """Register a throughput benchmark. The factory runs the workload and returns a result dict."""
+    def deco(factory):
+        BENCHMARKS[name] = ("throughput", factory)
+        return factory
+    return deco
+
+
+def startup(name: str):
+    """Register a startup benchmark. The factory returns the import statement to time."""
+    def deco(factory):
+        BENCHMARKS[name] = ("startup", factory)
+        return factory
+    return deco
+
+
+def _time_startup(statement: str, repeat: int) -> dict[str, Any]:
+    # Timed inside the child, so interpreter start-up is excluded
+    code = f"import time; t = time.perf_counter(); {statement}; print(time.perf_counter() - t)"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(PROJECT_ROOT), os.environ.get("PYTHONPATH")]))}
+    timings = []
+    for _ in range(max(repeat, 3)):
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env)
+        timings.append(float(out.stdout))
+    best = min(timings)
+    return {
+        "best_ms": best * 1e3,
+        "mean_ms": sum(timings) / len(timings) * 1e3,
+        "ops_per_sec": 1.0 / best if best else float("inf"),
+        "repeat": len(timings),
+    }
+
+
+def _time_micro(fn: Callable[[], Any], number: int, repeat: int) -> dict[str, Any]:
+    fn()  # warm up
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        timings.append((time.perf_counter() - start) / number)
+    best = min(timings)
+    return {
+        "best_us": best * 1e6,
+        "mean_us": sum(timings) / len(timings) * 1e6,
+        "ops_per_sec": 1.0 / best if best else float("inf"),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def _throughput_result(queries: int, elapsed: float, **extra: Any) -> dict[str, Any]:
+    return {
+        "queries": queries,
+        "elapsed_s": elapsed,
+        "qps": queries / elapsed if elapsed else float("inf"),
+        **extra,
+    }
+
+
+# --- fixtures ---------------------------------------------------------------------------------
+
+SAMPLE_ARGS = ["01K1BH5PW17TWEE1RZV7H6WENF", 42, 3.14159, None, True, "hello world", 10**12, 0.5]
+
+
+def _pipeline_response(n_rows: int, n_cols: int = 5) -> dict[str, Any]:
+    cols = [{"name": f"c{i}", "decltype": None} for i in range(n_cols)]
+    row = [
+        {"type": "integer", "value": "123456"} if i % 2 == 0 else {"type": "text", "value": "value"}
+        for i in range(n_cols)
+    ]
+    return {
+        "baton": None,
+        "base_url": None,
+        "results": [
+            {"type": "ok", "response": {"type": "execute", "result": {
+                "cols": cols, "rows": [list(row) for _ in range(n_rows)],
+                "affected_row_count": 0, "last_insert_rowid": None,
+            }}},
+            {"type": "ok", "response": {"type": "close"}},
+        ],
+    }
+
+
+class _NullTransport(Transport):
+    """Returns a canned response so only client-side work is measured."""
+
+    def __init__(self):
+        self._content = json.dumps(_pipeline_response(0)).encode("utf-8")
+        self.bytes_sent = 0
+
+    def post(self, url, body, headers, timeout=None):
+        self.bytes_sent += len(body)
+        return TransportResponse(200, {"Content-Type": "application/json"}, self._content)
+
+
+def _rows(n: int) -> list[dict[str, Any]]:
+    return [
+        {"id": f"user-{i:08d}", "name": "Jane Smith", "age": 30 + i % 50, "score": i * 0.25, "active": i % 2 == 0}
+        for i in range(n)
+    ]
+
+
+def _setup_table(server: HranaSQLiteServer) -> None:
+    server.execute_pipeline({"requests": [
+        {"type": "execute", "stmt": {"sql": "CREATE TABLE IF NOT EXISTS bench (id INTEGER PRIMARY KEY, name TEXT, age INTEGER)"}},
+        {"type": "execute", "stmt": {"sql": "INSERT INTO bench (name, age) SELECT 'n' || value, value FROM (WITH RECURSIVE s(value) AS (SELECT 1 UNION ALL SELECT value + 1 FROM s WHERE value < 100) SELECT value FROM s)"}},
+    ]})
+
+
+# --- serialization and parsing ----------------------------------------------------------------
+
+@micro("format_args.sync[8 args]")
+def _bench_format_args_sync(opts):
+    return lambda: TursoConnection._format_args(SAMPLE_ARGS)
+
+
+@micro("format_args.async[8 args]")
+def _bench_format_args_async(opts):
+    return lambda: AsyncTursoConnection._format_args(SAMPLE_ARGS)
+
+
+@micro("normalize_response[1 row]")
+def _bench_normalize_small(opts):
+    resp = _pipeline_response(1)
+    return lambda: TursoResponseParser.normalize_response(resp)
+
+
+@micro("normalize_response[1000 rows x 5 cols]")
+def _bench_normalize_large(opts):
+    resp = _pipeline_response(1000)
+    return lambda: TursoResponseParser.normalize_response(resp)
+
+
+@micro("batch_insert.payload[100 rows]")
+def _bench_batch_insert_100(opts):
+    batch = TursoBatch(TursoConnection(LOCAL_URL, TOKEN, transport=_NullTransport()))
+    rows = _rows(100)
+    return lambda: batch.batch_insert("users", rows)
+
+
+@micro("batch_insert.payload[1000 rows]")
+def _bench_batch_insert_1000(opts):
+    batch = TursoBatch(TursoConnection(LOCAL_URL, TOKEN, transport=_NullTransport()))
+    rows = _rows(1000)
+    return lambda: batch.batch_insert("users", rows)
+
+
+USER_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "string"}, "name": {"type": "string"}, "age": {"type": "integer"},
+        "score": {"type": "number"}, "active": {"type": "boolean"},
+    },
+    "required": ["id", "name"],
+}
+
+
+@micro("schema.validate_input[1000 rows]")
+def _bench_validate_per_row(opts):
+    rows = _rows(1000)
+    return lambda: [SchemaValidator.validate_input(row, USER_SCHEMA) for row in rows]
+
+
+@micro("schema.validate_many[1000 rows]")
+def _bench_validate_many(opts):
+    rows = _rows(1000)
+    validator = SchemaValidator.compile(USER_SCHEMA)
+    return lambda: validator.validate_many(rows)
+
+
+# --- vectors ----------------------------------------------------------------------------------
+
+EMBEDDING = [((i * 7919) % 1000) / 1000.0 for i in range(1536)]
+
+
+def _bench_vector_encoding(encoding):
+    vectors = TursoVector(None, "docs", vector_encoding=encoding)  # type: ignore[arg-type]
+
+    def encode():
+        body = json.dumps(TursoConnection._format_args([vectors.encode_vector(EMBEDDING)]))
+        return len(body)
+
+    return encode
+
+
+@micro("vector.encode.json[1536 dims]")
+def _bench_vector_json(opts):
+    return _bench_vector_encoding("json")
+
+
+@micro("vector.encode.blob[1536 dims]")
+def _bench_vector_blob(opts):
+    return _bench_vector_encoding("blob")
+
+
+# --- import time ------------------------------------------------------------------------------
+
+@startup("import.turso_python")
+def bench_import_package(opts):
+    return "import turso_python"
+
+
+@startup("import.TursoConnection")
+def bench_import_connection(opts):
+    return "from turso_python import TursoConnection"
+
+
+@startup("import.AsyncTursoConnection")
+def bench_import_async_connection(opts):
+    return "from turso_python import AsyncTursoConnection"
+
+
+@startup("import.TursoCRUD")
+def bench_import_crud(opts):
+    return "from turso_python import TursoCRUD"
+
+
+# --- end-to-end throughput --------------------------------------------------------------------
+
+def _sync_qps(conn: TursoConnection, queries: int) -> tuple[int, float]:
+    start = time.perf_counter()
+    for i in range(queries):
+        conn.execute_query("SELECT id, name, age FROM bench WHERE id = ?", [i % 100 + 1])
+    return queries, time.perf_counter() - start
+
+
+@throughput("e2e.sync.inprocess")
+def _bench_sync_inprocess(opts):
+    server = HranaSQLiteServer()
+    _setup_table(server)
+    conn = TursoConnection(LOCAL_URL, TOKEN, transport=LocalTransport(server))
+    return _throughput_result(*_sync_qps(conn, opts.queries))
+
+
+@throughput("e2e.sync.http")
+def _bench_sync_http(opts):
+    server = HranaSQLiteServer()
+    _setup_table(server)
+    with LocalHranaHTTPServer(server) as srv, TursoConnection(srv.url, TOKEN) as conn:
+        return _throughput_result(*_sync_qps(conn, opts.queries))
+
+
+async def _async_qps(conn: AsyncTursoConnection, queries: int, concurrency: int) -> tuple[int, float]:
+    per_worker = max(1, queries // concurrency)
+
+    async def worker(offset: int) -> None:
+        for i in range(per_worker):
+            await conn.execute_query("SELECT id, name, age FROM bench WHERE id = ?", [(offset + i) % 100 + 1])
+
+    start = time.perf_counter()
+    async with anyio.create_task_group() as tg:
+        for w in range(concurrency):
+            tg.start_soon(worker, w * per_worker)
+    return per_worker * concurrency, time.perf_counter() - start
+
+
+def _register_async_benchmarks() -> None:
+    for concurrency in (1, 8, 32):
+        def inprocess(opts, concurrency=concurrency):
+            # Simulated latency makes concurrency visible without real sockets
+            server = HranaSQLiteServer(latency=opts.latency)
+            _setup_table(server)
+
+            async def run():
+                transport = AsyncLocalTransport(server)
+                async with AsyncTursoConnection(LOCAL_URL, TOKEN, transport=transport) as conn:
+                    return await _async_qps(conn, opts.queries, concurrency)
+
+            return _throughput_result(
+                *anyio.run(run), concurrency=concurrency, simulated_latency_s=opts.latency
+            )
+
+        def http(opts, concurrency=concurrency):
+            server = HranaSQLiteServer()
+            _setup_table(server)
+
+            async def run(url):
+                async with AsyncTursoConnection(url, TOKEN) as conn:
+                    return await _async_qps(conn, opts.queries, concurrency)
+
+            with LocalHranaHTTPServer(server) as srv:
+                return _throughput_result(*anyio.run(run, srv.url), concurrency=concurrency)
+
+        throughput(f"e2e.async.inprocess[c={concurrency}]")(inprocess)
+        throughput(f"e2e.async.http[c={concurrency}]")(http)
+
+
+_register_async_benchmarks()
+
+
+# --- runner -----------------------------------------------------------------------------------
+
+def _package_version() -> str:
+    try:
+        from importlib.metadata import version
+
+        return version("tursopy")
+    except Exception:
+        return "unknown"
+
+
+def run(opts: argparse.Namespace) -> dict[str, Any]:
+    filters = [f for f in (opts.only or "").split(",") if f]
+    results: dict[str, Any] = {}
+    for name, (kind, factory) in BENCHMARKS.items():
+        if filters and not any(f in name for f in filters):
+            continue
+        if kind == "micro":
+            res = _time_micro(factory(opts), opts.number, opts.repeat)
+            print(f"{name:<45} {res['best_us']:>12.2f} us/op {res['ops_per_sec']:>14.0f} ops/s")
+        elif kind == "startup":
+            res = _time_startup(factory(opts), opts.repeat)
+            print(f"{name:<45} {res['best_ms']:>12.2f} ms")
+        else:
+            res = factory(opts)
+            print(f"{name:<45} {res['qps']:>12.0f} qps")
+        res["kind"] = kind
+        results[name] = res
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "tursopy_version": _package_version(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> int:
+    """Print per-benchmark change vs baseline; return the number of regressions."""
+    regressions = 0
+    print(f"\nComparison against {baseline.get('meta', {}).get('tursopy_version', '?')} "
+          f"(regression threshold {threshold:.0%}):")
+    for name, res in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if not base:
+            continue
+        # Higher is better for all metrics
+        key = "qps" if res["kind"] == "throughput" else "ops_per_sec"
+        change = res[key] / base[key] - 1.0 if base[key] else 0.0
+        flag = ""
+        if change < -threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(f"{name:<45} {change:>+8.1%}{flag}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", help="Comma-separated substrings; run matching benchmarks only")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    parser.add_argument("--compare", help="Baseline JSON file produced by --output")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative slowdown treated as a regression")
+    parser.add_argument("--number", type=int, default=200, help="Calls per repeat for micro benchmarks")
+    parser.add_argument("--repeat", type=int, default=5, help="Repeats for micro benchmarks (best is reported)")
+    parser.add_argument("--queries", type=int, default=2000, help="Queries per throughput benchmark")
+    parser.add_argument("--latency", type=float, default=0.002, help="Simulated latency for in-process async runs")
+    parser.add_argument("--quick", action="store_true", help="Shrink iteration counts for smoke runs")
+    opts = parser.parse_args()
+    if opts.quick:
+        opts.number, opts.repeat, opts.queries = 20, 2, 200
+
+    current = run(opts)
+    if opts.output:
+        out = Path(opts.output)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(json.dumps(current, indent=2))
+        print(f"\nSaved results to {out}")
+    if opts.compare:
+        baseline = json.loads(Path(opts.compare).read_text())
+        return 1 if compare(current, baseline, opts.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+import pytest
+
+from turso_python.async_connection import AsyncTursoConnection
+from turso_python.async_crud import AsyncTursoCRUD
+from turso_python.connection import TursoConnection
+from turso_python.crud import TursoCRUD
+from turso_python.local_server import AsyncLocalTransport, HranaSQLiteServer, LocalTransport
+from turso_python.response_parser import TursoResponseParser
+from turso_python.sql_builder import bulk_update_sql
+
+SCHEMA = 'CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, qty INTEGER)'
+
+
+def _seed(conn):
+    conn.execute_query(SCHEMA)
+    conn.execute_many('INSERT INTO items (id, name, qty) VALUES (?, ?, 0)', [[i, f'n{i}'] for i in range(1, 101)])
+
+
+def _rows(conn, sql):
+    return TursoResponseParser.normalize_response(conn.execute_query(sql))['rows']
+
+
+def test_bulk_update_sql():
+    assert bulk_update_sql('t', 'id', ('a', 'b'), 2) == (
+        'UPDATE t SET a = v.column2, b = v.column3 FROM (VALUES (?, ?, ?), (?, ?, ?)) AS v '
+        'WHERE t.id = v.column1'
+    )
+
+
+def test_bulk_update_and_delete_in_pipelined_chunks():
+    server = HranaSQLiteServer()
+    conn = TursoConnection('http://localhost', 't', transport=LocalTransport(server))
+    crud = TursoCRUD(conn)
+    _seed(conn)
+    before = server.pipeline_count
+
+    updated = crud.bulk_update('items', 'id', ({'id': i, 'qty': i * 10, 'name': f'x{i}'} for i in range(1, 51)),
+                               chunk_size=10, chunks_per_request=3)
+    assert updated == 50
+    assert server.pipeline_count - before == 2  # 5 chunks, 3 per request
+    assert _rows(conn, 'SELECT name, qty FROM items WHERE id IN (7, 70) ORDER BY id') == [['x7', '70'], ['n70', '0']]
+
+    assert crud.bulk_delete('items', 'id', range(1, 1001), chunk_size=400) == 100
+    assert _rows(conn, 'SELECT COUNT(*) FROM items') == [['0']]
+    with pytest.raises(ValueError):
+        crud.bulk_update('items', 'id', [{'qty': 1}])
+
+
+@pytest.mark.anyio
+async def test_async_bulk_update_and_delete():
+    server = HranaSQLiteServer()
+    async with AsyncTursoConnection('http://localhost', 't', transport=AsyncLocalTransport(server)) as conn:
+        crud = AsyncTursoCRUD(conn)
+        await conn.execute_query(SCHEMA)
+        await conn.execute_many('INSERT INTO items (id, name) VALUES (?, ?)', [[1, 'a'], [2, 'b'], [3, 'c']])
+        assert await crud.bulk_update('items', 'id', [{'id': 2, 'qty': 5}, {'id': 9, 'qty': 1}]) == 1
+        assert await crud.bulk_delete('items', 'id', [1, 3]) == 2
+        assert await crud.read_all_rows('items', columns='id, qty') == [['2', '5']]
@@ -0,0 +1,115 @@
+import pytest
+
+from turso_python.async_connection import AsyncTursoConnection
+from turso_python.compression import (
+    ZSTD_AVAILABLE,
+    RequestCompressor,
+    accepts,
+    compress,
+    decompress,
+)
+from turso_python.connection import TursoConnection
+from turso_python.local_server import (
+    AsyncLocalTransport,
+    HranaSQLiteServer,
+    LocalHranaHTTPServer,
+    LocalTransport,
+)
+from turso_python.response_parser import TursoResponseParser
+
+ROWS = [[i, f'user-{i}@example.com'] for i in range(500)]
+
+
+def _insert_rows(conn):
+    conn.execute_query('CREATE TABLE u (id INTEGER, email TEXT)')
+    return conn.execute_many('INSERT INTO u VALUES (?, ?)', ROWS)
+
+
+@pytest.mark.parametrize('encoding', ['gzip', 'deflate'])
+def test_codec_roundtrip(encoding):
+    data = b'{"requests":[]}' * 100
+    assert decompress(compress(data, encoding), encoding) == data
+
+
+def test_accepts_parses_accept_encoding():
+    assert accepts('gzip, deflate', 'gzip')
+    assert accepts('br;q=1.0, *;q=0.5', 'gzip')
+    assert not accepts('gzip;q=0, deflate', 'gzip')
+    assert not accepts(None, 'gzip')
+    assert accepts('*;q=0, gzip', 'gzip')
+    assert not accepts('gzip;q=0, *', 'gzip')
+    assert not accepts('*;q=0, deflate', 'gzip')
+
+
+def test_compressor_threshold_and_validation():
+    c = RequestCompressor('gzip', threshold=1000)
+    assert c.compress(b'x' * 999) is None
+    assert len(c.compress(b'x' * 1000)) < 1000
+    with pytest.raises(ValueError):
+        RequestCompressor('br')
+    if not ZSTD_AVAILABLE:
+        with pytest.raises(ImportError):
+            RequestCompressor('zstd')
+
+
+def test_sync_large_requests_are_compressed():
+    events = []
+    server = HranaSQLiteServer()
+    c = TursoConnection('http://localhost', 't', transport=LocalTransport(server), listeners=[events.append],
+                        compression='gzip', compression_threshold=1024)
+    _insert_rows(c)
+    small, large = events
+    assert small.content_encoding is None and small.request_wire_bytes == small.request_bytes
+    assert large.content_encoding == 'gzip'
+    assert large.request_compression_ratio > 3
+    assert large.as_dict()['request_wire_bytes'] == large.request_wire_bytes
+    assert server.execute_pipeline({'requests': [
+        {'type': 'execute', 'stmt': {'sql': 'SELECT count(*) FROM u'}}
+    ]})['results'][0]['response']['result']['rows'] == [[{'type': 'integer', 'value': '500'}]]
+
+
+def test_sync_falls_back_when_server_refuses_compressed_bodies():
+    events = []
+    server = HranaSQLiteServer(compressed_requests=False)
+    c = TursoConnection('http://localhost', 't', transport=LocalTransport(server), listeners=[events.append],
+                        compression='deflate', compression_threshold=0)
+    _insert_rows(c)
+    assert c.compression is None
+    assert all(e.content_encoding is None and e.retries == 0 for e in events)
+    assert server.pipeline_count == 2
+
+
+def test_compressed_responses_over_http():
+    events = []
+    with LocalHranaHTTPServer(HranaSQLiteServer(compress_responses_above=512)) as srv:
+        with TursoConnection(srv.url, 't', listeners=[events.append], compression='gzip') as c:
+            _insert_rows(c)
+            resp = c.execute_query('SELECT id, email FROM u')
+    assert len(TursoResponseParser.normalize_response(resp)['rows']) == 500
+    ev = events[-1]
+    assert ev.response_wire_bytes < ev.response_bytes
+    assert ev.response_compression_ratio > 3
+
+
+def test_accept_compressed_false_requests_identity():
+    events = []
+    server = HranaSQLiteServer(compress_responses_above=0)
+    c = TursoConnection('http://localhost', 't', transport=LocalTransport(server), listeners=[events.append],
+                        accept_compressed=False)
+    c.execute_query('SELECT 1')
+    assert events[0].response_wire_bytes == events[0].response_bytes
+
+
+@pytest.mark.anyio
+async def test_async_compression_roundtrip():
+    events = []
+    server = HranaSQLiteServer(compress_responses_above=512)
+    async with AsyncTursoConnection('http://localhost', 't', transport=AsyncLocalTransport(server),
+                                    listeners=[events.append], compression='gzip',
+                                    compression_threshold=1024) as c:
+        await c.execute_query('CREATE TABLE u (id INTEGER, email TEXT)')
+        await c.execute_many('INSERT INTO u VALUES (?, ?)', ROWS)
+        resp = await c.execute_query('SELECT id, email FROM u')
+    assert len(TursoResponseParser.normalize_response(resp)['rows']) == 500
+    assert events[1].content_encoding == 'gzip' and events[1].request_compression_ratio > 3
+    assert events[2].response_compression_ratio > 3
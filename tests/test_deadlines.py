@@ -0,0 +1,103 @@
+import time
+
+import anyio
+import pytest
+
+from turso_python.async_connection import AsyncTursoConnection
+from turso_python.connection import TursoConnection
+from turso_python.deadlines import deadline
+from turso_python.exceptions import TursoConnectionError, TursoTimeoutError
+from turso_python.transport import AsyncTransport, Transport, TransportResponse
+
+
+class HangingTransport(Transport):
+    """Waits out the socket timeout it is given, then fails like a timed-out request."""
+
+    def __init__(self):
+        self.timeouts = []
+
+    def post(self, url, body, headers, timeout=None):
+        self.timeouts.append(timeout)
+        time.sleep(min(timeout, 5))
+        raise TursoConnectionError('read timed out')
+
+
+class RateLimitedTransport(Transport):
+    def __init__(self):
+        self.calls = 0
+
+    def post(self, url, body, headers, timeout=None):
+        self.calls += 1
+        return TransportResponse(429, {'Retry-After': '10'}, b'{"error": "slow down"}')
+
+
+class AsyncHangingTransport(AsyncTransport):
+    def __init__(self):
+        self.timeouts = []
+        self.cancelled = False
+
+    async def post(self, url, body, headers, timeout=None):
+        self.timeouts.append(timeout)
+        try:
+            await anyio.sleep(5)
+        except anyio.get_cancelled_exc_class():
+            self.cancelled = True
+            raise
+        raise TursoConnectionError('unreachable')
+
+
+def test_sync_call_timeout_covers_retries():
+    transport = HangingTransport()
+    c = TursoConnection('http://localhost', 't', transport=transport, retries=5, backoff_base=0, call_timeout=0.2)
+    start = time.monotonic()
+    with pytest.raises(TursoTimeoutError):
+        c.execute_query('SELECT 1')
+    assert time.monotonic() - start < 1
+    assert len(transport.timeouts) == 1
+    assert 0 < transport.timeouts[0] <= 0.2
+
+
+def test_nested_deadlines_only_shrink():
+    transport = HangingTransport()
+    c = TursoConnection('http://localhost', 't', transport=transport)
+    with deadline(5), deadline(0.1), deadline(10):
+        with pytest.raises(TursoTimeoutError):
+            c.execute_query('SELECT 1')
+    assert transport.timeouts[0] <= 0.1
+
+
+def test_sync_backoff_that_would_miss_the_deadline_fails_fast():
+    transport = RateLimitedTransport()
+    c = TursoConnection('http://localhost', 't', transport=transport, retries=3)
+    start = time.monotonic()
+    with deadline(1), pytest.raises(TursoTimeoutError):
+        c.execute_query('SELECT 1')
+    assert time.monotonic() - start < 0.5
+    assert transport.calls == 1
+
+
+def test_timeout_error_is_a_builtin_timeout():
+    assert issubclass(TursoTimeoutError, TimeoutError)
+
+
+@pytest.mark.anyio
+async def test_async_call_timeout_cancels_in_flight_request():
+    transport = AsyncHangingTransport()
+    c = AsyncTursoConnection('http://localhost', 't', transport=transport, retries=3, call_timeout=0.1)
+    start = time.monotonic()
+    with pytest.raises(TursoTimeoutError):
+        await c.execute_query('SELECT 1')
+    assert time.monotonic() - start < 1
+    assert transport.cancelled
+    assert transport.timeouts[0] <= 0.1
+
+
+@pytest.mark.anyio
+async def test_async_caller_cancel_scope_bounds_socket_timeout():
+    transport = AsyncHangingTransport()
+    c = AsyncTursoConnection('http://localhost', 't', transport=transport)
+    with anyio.move_on_after(0.1) as scope:
+        await c.execute_query('SELECT 1')
+    assert scope.cancelled_caught
+    assert transport.cancelled
+    assert transport.timeouts[0] <= 0.1
@@ -0,0 +1,73 @@
+import enum
+import json
+import threading
+
+import pytest
+
+from turso_python.async_connection import AsyncTursoConnection
+from turso_python.connection import TursoConnection
+from turso_python.encoding import PipelineEncoder, _execute_prefix, encode_pipeline
+
+ARGS = ['text', 'ünï', 3, -2.5, None, True, b'\x00\xff']
+
+
+def _payload(sql='INSERT INTO t VALUES (?, ?, ?, ?, ?, ?, ?)'):
+    return {'requests': [
+        {'type': 'store_sql', 'sql_id': 1, 'sql': 'SELECT ?'},
+        {'type': 'execute', 'stmt': {'sql': sql, 'args': TursoConnection._format_args(ARGS)}},
+        {'type': 'execute', 'stmt': {'sql_id': 1, 'args': AsyncTursoConnection._format_args(ARGS)}},
+        {'type': 'execute', 'stmt': {'sql': 'SELECT 1', 'args': [], 'want_rows': False}},
+        {'type': 'close'},
+    ]}
+
+
+def test_encoded_body_matches_json():
+    payload = _payload()
+    assert json.loads(encode_pipeline(payload)) == payload
+    assert json.loads(encode_pipeline({'baton': 'b', 'requests': []})) == {'baton': 'b', 'requests': []}
+
+
+def test_statement_prefix_is_encoded_once():
+    sql = 'SELECT "quoted" FROM t WHERE a = ?'
+    _execute_prefix.cache_clear()
+    for _ in range(3):
+        encode_pipeline(_payload(sql))
+    # the sql and sql_id prefixes are built once; the want_rows statement is encoded generically
+    assert _execute_prefix.cache_info().misses == 2
+    assert _execute_prefix.cache_info().hits == 4
+
+
+def test_encoder_is_thread_safe():
+    encoder = PipelineEncoder()
+    errors = []
+
+    def work(n):
+        payload = _payload(f'SELECT {n}')
+        for _ in range(200):
+            if json.loads(encoder.encode(payload)) != payload:
+                errors.append(n)
+
+    threads = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+
+
+class Color(str, enum.Enum):
+    RED = 'red'
+
+
+class Tag(str):
+    def __str__(self):
+        return 'not-the-value'
+
+
+@pytest.mark.parametrize('conn_cls', [TursoConnection, AsyncTursoConnection])
+def test_str_subclass_args_send_their_text(conn_cls):
+    expected = [{'type': 'text', 'value': 'red'}, {'type': 'text', 'value': 'v1'}]
+    assert conn_cls._format_args([Color.RED, Tag('v1')]) == expected
+    assert json.loads(encode_pipeline({'requests': [
+        {'type': 'execute', 'stmt': {'sql': 'SELECT ?, ?', 'args': conn_cls._format_args([Color.RED, Tag('v1')])}},
+    ]}))['requests'][0]['stmt']['args'] == expected
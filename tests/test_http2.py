@@ -0,0 +1,53 @@
+import anyio
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("h2")
+
+from turso_python.async_connection import AsyncTursoConnection  # noqa: E402
+from turso_python.connection import TursoConnection  # noqa: E402
+from turso_python.exceptions import TursoHTTPError  # noqa: E402
+from turso_python.local_server import HranaSQLiteServer, LocalHranaHTTPServer  # noqa: E402
+from turso_python.response_parser import TursoResponseParser  # noqa: E402
+from turso_python.transport import AsyncHttpxTransport, HttpxTransport  # noqa: E402
+
+
+def test_sync_httpx_transport_roundtrip():
+    with LocalHranaHTTPServer() as srv:
+        with TursoConnection(srv.url, 't', http2=True) as c:
+            assert isinstance(c.transport, HttpxTransport)
+            resp = c.execute_query('SELECT ?', [42])
+    assert TursoResponseParser.normalize_response(resp)['rows'] == [['42']]
+
+
+def test_httpx_network_errors_become_connection_errors():
+    with LocalHranaHTTPServer() as srv:
+        url = srv.url
+    c = TursoConnection(url, 't', transport=HttpxTransport(http2=False))
+    with pytest.raises(TursoHTTPError) as exc:
+        c.execute_query('SELECT 1')
+    assert exc.value.status == -1
+
+
+def test_http2_conflicts_with_explicit_transport():
+    with pytest.raises(ValueError):
+        TursoConnection('http://localhost', 't', http2=True, transport=HttpxTransport())
+    with pytest.raises(ValueError):
+        AsyncTursoConnection('http://localhost', 't', http2=True, transport=AsyncHttpxTransport())
+
+
+@pytest.mark.anyio
+async def test_async_httpx_transport_concurrent_pipelines():
+    results = {}
+    with LocalHranaHTTPServer(HranaSQLiteServer(compress_responses_above=0)) as srv:
+        async with AsyncTursoConnection(srv.url, 't', http2=True) as c:
+            assert isinstance(c.transport, AsyncHttpxTransport)
+
+            async def query(i):
+                resp = await c.execute_query('SELECT ?', [i])
+                results[i] = TursoResponseParser.normalize_response(resp)['rows']
+
+            async with anyio.create_task_group() as tg:
+                for i in range(20):
+                    tg.start_soon(query, i)
+    assert results == {i: [[str(i)]] for i in range(20)}
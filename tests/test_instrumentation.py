@@ -0,0 +1,67 @@
+import pytest
+import requests_mock
+
+from turso_python.async_connection import AsyncTursoConnection
+from turso_python.connection import TursoConnection
+from turso_python.instrumentation import RequestListener
+from turso_python.local_server import AsyncLocalTransport, HranaSQLiteServer, LocalTransport
+
+
+def test_sync_listener_receives_request_event():
+    events = []
+    c = TursoConnection('http://localhost', 't', transport=LocalTransport(), listeners=[events.append])
+    c.batch([
+        {'sql': 'CREATE TABLE t (v INTEGER)'},
+        {'sql': 'INSERT INTO t VALUES (?)', 'args': [1]},
+        {'sql': 'SELECT v FROM t'},
+    ])
+    assert len(events) == 1
+    ev = events[0]
+    assert ev.step_count == 3
+    assert ev.statements[1] == 'INSERT INTO t VALUES (?)'
+    assert ev.row_count == 1
+    assert ev.status == 200
+    assert ev.request_bytes > 0 and ev.response_bytes > 0
+    assert ev.server_ms is not None
+    assert ev.total_s >= ev.network_s >= 0
+    assert ev.error is None
+
+
+def test_sync_rate_limit_wait_is_reported():
+    events = []
+    with requests_mock.Mocker() as m:
+        m.post('https://example.test/v2/pipeline', [
+            {'status_code': 429, 'json': {'error': 'slow down'}, 'headers': {'Retry-After': '0.01'}},
+            {'status_code': 200, 'json': {'results': []}},
+        ])
+        c = TursoConnection('https://example.test', 't', retries=1, backoff_base=0, listeners=[events.append])
+        c.execute_query('SELECT 1')
+    ev = events[0]
+    assert ev.retries == 1
+    assert ev.rate_limit_wait_s == pytest.approx(0.01)
+
+
+def test_listener_errors_do_not_fail_queries():
+    class Broken(RequestListener):
+        def request_started(self, event):
+            raise RuntimeError('boom')
+
+    seen = []
+    c = TursoConnection('http://localhost', 't', transport=LocalTransport(), listeners=[Broken()])
+    c.add_listener(seen.append)
+    c.execute_query('SELECT 1')
+    c.remove_listener(seen.append)
+    c.execute_query('SELECT 1')
+    assert len(seen) == 1
+
+
+@pytest.mark.anyio
+async def test_async_listener_reports_errors():
+    events = []
+    server = HranaSQLiteServer(auth_token='secret')
+    transport = AsyncLocalTransport(server)
+    async with AsyncTursoConnection('http://localhost', 'wrong', transport=transport, listeners=[events.append]) as c:
+        with pytest.raises(Exception):
+            await c.execute_query('SELECT 1')
+    assert events[0].status == 401
+    assert events[0].error is not None
@@ -0,0 +1,126 @@
+import json
+
+import anyio
+import pytest
+
+from turso_python.async_connection import AsyncTursoConnection
+from turso_python.exceptions import TursoLaneFullError
+from turso_python.lanes import Lane, LaneScheduler, use_lane
+from turso_python.transport import AsyncTransport, TransportResponse
+
+OK = json.dumps({'results': [{'type': 'ok', 'response': {'type': 'close'}}]}).encode()
+
+
+class GateTransport(AsyncTransport):
+    """Holds every request until `release` is set; records concurrency and arrival order."""
+
+    def __init__(self):
+        self.release = anyio.Event()
+        self.active = 0
+        self.max_active = 0
+        self.order = []
+
+    async def post(self, url, body, headers, timeout=None):
+        self.order.append(json.loads(body)['requests'][0]['stmt']['sql'])
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await self.release.wait()
+        finally:
+            self.active -= 1
+        return TransportResponse(200, {}, OK)
+
+
+def _conn(transport, scheduler, **kwargs):
+    return AsyncTursoConnection('http://localhost', 't', transport=transport, lanes=scheduler, **kwargs)
+
+
+async def _in_lane(conn, lane, sql):
+    with use_lane(lane):
+        await conn.execute_query(sql)
+
+
+@pytest.mark.anyio
+async def test_lane_budget_caps_concurrency():
+    transport = GateTransport()
+    scheduler = LaneScheduler([Lane('interactive', 4), Lane('bulk', 2)])
+    conn = _conn(transport, scheduler)
+    async with anyio.create_task_group() as tg:
+        for i in range(6):
+            tg.start_soon(_in_lane, conn, 'bulk', f'SELECT {i}')
+        tg.start_soon(_in_lane, conn, 'interactive', 'SELECT 99')
+        await anyio.wait_all_tasks_blocked()
+        stats = scheduler.stats()
+        assert stats['bulk']['in_flight'] == 2 and stats['bulk']['waiting'] == 4
+        assert stats['interactive']['in_flight'] == 1
+        transport.release.set()
+    assert transport.max_active == 3
+    assert scheduler.stats()['bulk']['completed'] == 6
+
+
+@pytest.mark.anyio
+async def test_full_lane_fails_fast_or_queues_boundedly():
+    transport = GateTransport()
+    scheduler = LaneScheduler([Lane('bulk', 1, max_queue=1), Lane('strict', 1, max_queue=0)])
+    conn = _conn(transport, scheduler)
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(_in_lane, conn, 'bulk', 'SELECT 1')
+        tg.start_soon(_in_lane, conn, 'bulk', 'SELECT 2')
+        tg.start_soon(_in_lane, conn, 'strict', 'SELECT 3')
+        await anyio.wait_all_tasks_blocked()
+        with pytest.raises(TursoLaneFullError):
+            await _in_lane(conn, 'bulk', 'SELECT 4')
+        with pytest.raises(TursoLaneFullError):
+            await _in_lane(conn, 'strict', 'SELECT 5')
+        transport.release.set()
+    stats = scheduler.stats()
+    assert stats['bulk']['rejected'] == 1 and stats['bulk']['completed'] == 2
+    assert stats['strict']['rejected'] == 1
+
+
+@pytest.mark.anyio
+async def test_freed_slots_go_to_higher_priority_lane():
+    transport = GateTransport()
+    scheduler = LaneScheduler(
+        [Lane('bulk', 4, priority=0), Lane('interactive', 4, priority=10)], max_concurrency=1
+    )
+    conn = _conn(transport, scheduler)
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(_in_lane, conn, 'bulk', 'bulk 1')
+        await anyio.wait_all_tasks_blocked()
+        tg.start_soon(_in_lane, conn, 'bulk', 'bulk 2')
+        await anyio.wait_all_tasks_blocked()
+        tg.start_soon(_in_lane, conn, 'interactive', 'interactive')
+        await anyio.wait_all_tasks_blocked()
+        transport.release.set()
+    assert transport.order == ['bulk 1', 'interactive', 'bulk 2']
+
+
+@pytest.mark.anyio
+async def test_cancelled_waiter_leaves_queue_and_events_report_lane():
+    transport = GateTransport()
+    events = []
+    scheduler = LaneScheduler([Lane('default', 1)])
+    conn = _conn(transport, scheduler, listeners=[events.append])
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(conn.execute_query, 'SELECT 1')
+        await anyio.wait_all_tasks_blocked()
+        with anyio.move_on_after(0.01):
+            await conn.execute_query('SELECT 2')
+        assert scheduler.stats()['default']['waiting'] == 0
+        tg.start_soon(conn.execute_query, 'SELECT 3')
+        await anyio.wait_all_tasks_blocked()
+        transport.release.set()
+    assert transport.order == ['SELECT 1', 'SELECT 3']
+    assert all(e.lane == 'default' for e in events)
+    assert events[-1].queue_s > 0
+    assert scheduler.in_flight == 0
+
+
+def test_scheduler_validation():
+    with pytest.raises(ValueError):
+        LaneScheduler([])
+    with pytest.raises(ValueError):
+        LaneScheduler([Lane('a', 1), Lane('a', 2)])
+    with pytest.raises(ValueError):
+        LaneScheduler([Lane('a', 1)]).lane('missing')
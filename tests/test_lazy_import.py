@@ -0,0 +1,34 @@
+import subprocess
+import sys
+
+import turso_python
+
+
+def _run(code):
+    return subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout.split()
+
+
+def test_package_import_defers_heavy_dependencies():
+    loaded = _run(
+        'import logging, sys, turso_python\n'
+        'print(*[m for m in ("requests", "aiohttp", "msgspec", "numpy") if m in sys.modules])\n'
+        'print("root_handlers=%d" % len(logging.getLogger().handlers))'
+    )
+    assert loaded == ['root_handlers=0']
+
+
+def test_connection_import_does_not_load_clients():
+    loaded = _run(
+        'import sys\n'
+        'from turso_python import AsyncTursoConnection, TursoConnection\n'
+        'print(*[m for m in ("requests", "aiohttp", "msgspec") if m in sys.modules])'
+    )
+    assert loaded == []
+
+
+def test_lazy_exports_resolve():
+    from turso_python.connection import TursoConnection
+
+    assert turso_python.TursoConnection is TursoConnection
+    assert 'TursoVector' in dir(turso_python)
+    assert set(turso_python.__all__) <= set(dir(turso_python))
@@ -0,0 +1,51 @@
+import anyio
+import msgspec
+import pytest
+
+from turso_python.async_connection import AsyncTursoConnection
+from turso_python.loader import Loader
+from turso_python.local_server import AsyncLocalTransport, HranaSQLiteServer
+
+pytestmark = pytest.mark.anyio
+
+
+class User(msgspec.Struct):
+    id: int
+    name: str
+
+
+async def _setup(conn):
+    await conn.execute_query('CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)')
+    await conn.execute_query("INSERT INTO users (id, name) VALUES (1, 'a'), (2, 'b'), (3, 'c')")
+
+
+async def test_loads_in_the_same_tick_share_one_query():
+    server = HranaSQLiteServer()
+    async with AsyncTursoConnection('http://localhost', 't', transport=AsyncLocalTransport(server)) as conn:
+        await _setup(conn)
+        loader = Loader(conn, 'users', 'id', max_batch_size=2)
+        before = server.pipeline_count
+        results = {}
+
+        async def resolve(key):
+            results[key] = await loader.load(key)
+
+        async with anyio.create_task_group() as tg:
+            for key in (3, 1, 99, 2, 1):
+                tg.start_soon(resolve, key)
+
+        assert server.pipeline_count - before == 1
+        assert results[1] == {'id': '1', 'name': 'a'}
+        assert results[3]['name'] == 'c' and results[99] is None
+
+        # memoized: no new request
+        assert (await loader.load(2))['name'] == 'b'
+        assert server.pipeline_count - before == 1
+
+
+async def test_load_many_with_as_type():
+    server = HranaSQLiteServer()
+    async with AsyncTursoConnection('http://localhost', 't', transport=AsyncLocalTransport(server)) as conn:
+        await _setup(conn)
+        loader = Loader(conn, 'users', 'id', columns='id, name', as_type=User, cache=False)
+        assert await loader.load_many([2, 5, 1]) == [User(2, 'b'), None, User(1, 'a')]
@@ -0,0 +1,74 @@
+import pytest
+
+from turso_python.async_connection import AsyncTursoConnection
+from turso_python.connection import TursoConnection
+from turso_python.exceptions import TursoHTTPError, TursoQueryError
+from turso_python.local_server import (
+    AsyncLocalTransport,
+    HranaSQLiteServer,
+    LocalHranaHTTPServer,
+    LocalTransport,
+)
+from turso_python.response_parser import TursoResponseParser
+
+
+def test_local_transport_roundtrip():
+    c = TursoConnection('http://localhost', 't', transport=LocalTransport())
+    c.execute_query('CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT, score REAL)')
+    c.batch([
+        {'sql': 'INSERT INTO t (name, score) VALUES (?, ?)', 'args': ['a', 1.5]},
+        {'sql': 'INSERT INTO t (name, score) VALUES (?, ?)', 'args': ['b', 2.0]},
+    ])
+    res = TursoResponseParser.normalize_response(c.execute_query('SELECT name, score FROM t ORDER BY id'))
+    assert res['columns'] == ['name', 'score']
+    assert res['rows'] == [['a', 1.5], ['b', 2.0]]
+
+
+def test_local_server_reports_sql_errors():
+    c = TursoConnection('http://localhost', 't', transport=LocalTransport())
+    resp = c.execute_query('SELECT * FROM missing_table')
+    assert resp['results'][0]['type'] == 'error'
+    assert 'no such table' in resp['results'][0]['error']['message']
+    with pytest.raises(TursoQueryError, match='no such table: missing_table'):
+        TursoResponseParser.normalize_response(resp)
+
+
+def test_local_server_checks_auth_token():
+    server = HranaSQLiteServer(auth_token='secret')
+    c = TursoConnection('http://localhost', 'wrong', transport=LocalTransport(server))
+    with pytest.raises(TursoHTTPError) as excinfo:
+        c.execute_query('SELECT 1')
+    assert excinfo.value.status == 401
+
+
+def test_local_server_batch_conditions():
+    server = HranaSQLiteServer()
+    resp = server.execute_pipeline({'requests': [{
+        'type': 'batch',
+        'batch': {'steps': [
+            {'stmt': {'sql': 'SELECT * FROM missing_table'}},
+            {'stmt': {'sql': 'SELECT 1'}, 'condition': {'type': 'ok', 'step': 0}},
+            {'stmt': {'sql': 'SELECT 2'}, 'condition': {'type': 'error', 'step': 0}},
+        ]},
+    }]})
+    result = resp['results'][0]['response']['result']
+    assert result['step_errors'][0] is not None
+    assert result['step_results'][1] is None
+    assert result['step_results'][2]['rows'] == [[{'type': 'integer', 'value': '2'}]]
+
+
+def test_local_http_server_with_requests_transport():
+    with LocalHranaHTTPServer() as srv:
+        with TursoConnection(srv.url, 't') as c:
+            resp = c.execute_query('SELECT ?', [42])
+    assert TursoResponseParser.normalize_response(resp)['rows'] == [['42']]
+
+
+@pytest.mark.anyio
+async def test_async_local_transport_roundtrip():
+    transport = AsyncLocalTransport()
+    async with AsyncTursoConnection('http://localhost', 't', transport=transport) as c:
+        await c.execute_query('CREATE TABLE t (v TEXT)')
+        await c.execute_query('INSERT INTO t VALUES (?)', ['x'])
+        resp = await c.execute_query('SELECT v FROM t')
+    assert TursoResponseParser.normalize_response(resp)['rows'] == [['x']]
@@ -0,0 +1,58 @@
+import pytest
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry.sdk.metrics import MeterProvider  # noqa: E402
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader  # noqa: E402
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter  # noqa: E402
+from opentelemetry.trace import StatusCode  # noqa: E402
+
+from turso_python.connection import TursoConnection  # noqa: E402
+from turso_python.local_server import LocalTransport  # noqa: E402
+from turso_python.otel import instrument  # noqa: E402
+
+
+@pytest.fixture
+def otel():
+    exporter = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+    reader = InMemoryMetricReader()
+    meter_provider = MeterProvider(metric_readers=[reader])
+    return exporter, reader, {'tracer_provider': tracer_provider, 'meter_provider': meter_provider}
+
+
+def test_span_and_histograms_per_pipeline(otel):
+    exporter, reader, providers = otel
+    c = TursoConnection('http://localhost', 't', transport=LocalTransport())
+    instrument(c, **providers)
+    c.batch([{'sql': 'SELECT ?', 'args': [1]}, {'sql': 'SELECT ?', 'args': [2]}])
+
+    (span,) = exporter.get_finished_spans()
+    assert span.name == 'turso.pipeline'
+    assert span.attributes['db.statement'] == 'SELECT ?'
+    assert span.attributes['db.turso.step_count'] == 2
+    assert span.attributes['db.turso.retry_count'] == 0
+    assert span.attributes['server.address'] == 'localhost'
+
+    names = {
+        m.name
+        for rm in reader.get_metrics_data().resource_metrics
+        for sm in rm.scope_metrics
+        for m in sm.metrics
+    }
+    assert {'turso.client.duration', 'turso.client.request.size', 'turso.client.response.size'} <= names
+
+
+def test_failed_request_marks_span_as_error(otel):
+    exporter, _, providers = otel
+    c = TursoConnection('http://localhost', 't', transport=LocalTransport())
+    instrument(c, **providers)
+    c.transport.server.auth_token = 'secret'
+    with pytest.raises(Exception):
+        c.execute_query('SELECT 1')
+    span = exporter.get_finished_spans()[-1]
+    assert span.status.status_code == StatusCode.ERROR
+    assert span.attributes['http.response.status_code'] == 401
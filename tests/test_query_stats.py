@@ -0,0 +1,46 @@
+import logging
+
+from turso_python.connection import TursoConnection
+from turso_python.local_server import HranaSQLiteServer, LocalTransport
+from turso_python.query_stats import QueryStats, fingerprint
+
+
+def test_fingerprint_normalizes_literals_and_whitespace():
+    assert fingerprint("SELECT *  FROM t1\n WHERE id = 5 AND name = 'bob' -- note") == \
+        "SELECT * FROM t1 WHERE id = ? AND name = ?"
+    assert fingerprint("SELECT * FROM t WHERE id IN (?, ?, ?)") == "SELECT * FROM t WHERE id IN (?, ...)"
+    assert fingerprint("INSERT INTO t (a, b) VALUES (?, ?), (?, ?);") == "INSERT INTO t (a, b) VALUES (?, ...), ..."
+
+
+def test_query_stats_aggregates_per_fingerprint():
+    stats = QueryStats(slow_threshold_s=None)
+    c = TursoConnection('http://localhost', 't', transport=LocalTransport(), listeners=[stats])
+    c.execute_query('CREATE TABLE t (v INTEGER)')
+    for i in range(3):
+        c.execute_query(f'INSERT INTO t VALUES ({i})')
+    c.execute_query('SELECT v FROM t')
+
+    insert = stats.get('INSERT INTO t VALUES (42)')
+    assert insert['calls'] == 3
+    assert insert['p95_s'] >= insert['min_s'] > 0
+    assert stats.get('SELECT v FROM t')['rows'] == 3
+    assert stats.snapshot(sort_by='calls', limit=1)[0]['fingerprint'] == 'INSERT INTO t VALUES (?)'
+
+
+def test_query_stats_is_bounded():
+    stats = QueryStats(slow_threshold_s=None, max_entries=2)
+    c = TursoConnection('http://localhost', 't', transport=LocalTransport(), listeners=[stats])
+    for table in ('a', 'b', 'c'):
+        c.execute_query(f'SELECT 1 AS {table}')
+    assert len(stats) == 2
+    assert stats.get('SELECT 1 AS a') is None
+
+
+def test_slow_queries_are_logged_with_redacted_args(caplog):
+    stats = QueryStats(slow_threshold_s=0.0)
+    c = TursoConnection('http://localhost', 't', transport=LocalTransport(HranaSQLiteServer()), listeners=[stats])
+    with caplog.at_level(logging.WARNING, logger='turso_python.slow_query'):
+        c.execute_query('SELECT ?', ['super-secret'])
+    assert 'SELECT ?' in caplog.text
+    assert '1 args redacted' in caplog.text
+    assert 'super-secret' not in caplog.text
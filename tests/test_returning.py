@@ -0,0 +1,40 @@
+import pytest
+
+from turso_python.async_connection import AsyncTursoConnection
+from turso_python.async_crud import AsyncTursoCRUD
+from turso_python.connection import TursoConnection
+from turso_python.crud import TursoCRUD
+from turso_python.local_server import AsyncLocalTransport, HranaSQLiteServer, LocalTransport
+from turso_python.response_parser import TursoResponseParser
+
+SCHEMA = "CREATE TABLE notes (id INTEGER PRIMARY KEY, body TEXT, state TEXT DEFAULT 'new')"
+
+
+def test_normalize_response_surfaces_write_info():
+    conn = TursoConnection('http://localhost', 't', transport=LocalTransport())
+    crud = TursoCRUD(conn)
+    conn.execute_query(SCHEMA)
+    res = TursoResponseParser.normalize_response(crud.create('notes', {'body': 'a'}))
+    assert (res['affected_row_count'], res['last_insert_rowid'], res['rows']) == (1, 1, [])
+
+    res = TursoResponseParser.normalize_response(crud.create('notes', {'body': 'b'}, returning=['id', 'state']))
+    assert res['rows'] == [['2', 'new']] and res['last_insert_rowid'] == 2
+
+    res = TursoResponseParser.normalize_response(crud.delete('notes', 'id > ?', [0], returning='body'))
+    assert res['affected_row_count'] == 2
+    assert sorted(r[0] for r in res['rows']) == ['a', 'b']
+
+
+@pytest.mark.anyio
+async def test_async_create_and_update_returning():
+    server = HranaSQLiteServer()
+    async with AsyncTursoConnection('http://localhost', 't', transport=AsyncLocalTransport(server)) as conn:
+        crud = AsyncTursoCRUD(conn)
+        await conn.execute_query(SCHEMA)
+        before = server.pipeline_count
+        created = await crud.create('notes', {'body': 'x'}, returning='*')
+        assert created['rows'] == [['1', 'x', 'new']]
+        assert created['columns'] == ['id', 'body', 'state']
+        updated = await crud.update('notes', {'state': 'done'}, 'id = ?', [1], returning=['state'])
+        assert updated['rows'] == [['done']] and updated['affected_row_count'] == 1
+        assert server.pipeline_count - before == 2
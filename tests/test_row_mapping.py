@@ -0,0 +1,53 @@
+import dataclasses
+import datetime
+
+import msgspec
+import pytest
+
+from turso_python.async_connection import AsyncTursoConnection
+from turso_python.async_crud import AsyncTursoCRUD
+from turso_python.connection import TursoConnection
+from turso_python.crud import TursoCRUD
+from turso_python.local_server import AsyncLocalTransport, HranaSQLiteServer, LocalTransport
+from turso_python.row_mapping import map_rows, row_decoder
+
+
+class User(msgspec.Struct):
+    id: int
+    name: str
+    score: float | None = None
+    active: bool = True
+
+
+@dataclasses.dataclass
+class Event:
+    id: int
+    day: datetime.date
+    note: str = ''
+
+
+def test_row_decoder_is_compiled_once_and_converts_cells():
+    decoder = row_decoder(User, ('name', 'id', 'score', 'active', 'extra'))
+    assert row_decoder(User, ('name', 'id', 'score', 'active', 'extra')) is decoder
+    assert decoder(['ann', '7', 1.5, '0', 'x']) == User(id=7, name='ann', score=1.5, active=False)
+    assert map_rows(Event, ['id', 'day'], [['1', '2024-05-01']]) == [Event(1, datetime.date(2024, 5, 1))]
+    with pytest.raises(ValueError, match='name'):
+        row_decoder(User, ('id',))
+
+
+def test_sync_read_as_type():
+    crud = TursoCRUD(TursoConnection('http://localhost', 't', transport=LocalTransport()))
+    crud.connection.execute_query('CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, score REAL)')
+    crud.create('users', {'name': 'ann', 'score': None})
+    assert crud.read('users', as_type=User) == [User(id=1, name='ann', score=None)]
+
+
+@pytest.mark.anyio
+async def test_async_read_as_type():
+    server = HranaSQLiteServer()
+    async with AsyncTursoConnection('http://localhost', 't', transport=AsyncLocalTransport(server)) as conn:
+        crud = AsyncTursoCRUD(conn)
+        await conn.execute_query('CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, active INTEGER)')
+        await crud.create('users', {'name': 'bob', 'active': 0})
+        users = await crud.read('users', where='id = ?', args=[1], as_type=User)
+    assert users == [User(id=1, name='bob', active=False)]
@@ -0,0 +1,40 @@
+import msgspec
+import pytest
+
+from turso_python.schema_validator import SchemaValidator
+
+SCHEMA = {
+    'type': 'object',
+    'properties': {'name': {'type': 'string'}, 'age': {'type': 'integer'}, 'meta': {'type': 'any'}},
+    'required': ['name'],
+}
+
+
+class Row(msgspec.Struct):
+    name: str
+    age: int = 0
+
+
+def test_compile_is_cached_by_schema_identity():
+    compiled = SchemaValidator.compile(SCHEMA)
+    assert SchemaValidator.compile(SCHEMA) is compiled
+    assert SchemaValidator.compile(dict(SCHEMA)) is not compiled
+    assert compiled.validate({'name': 'a', 'age': 3, 'meta': object()})
+    with pytest.raises(ValueError, match='Missing required field'):
+        compiled.validate({'age': 3})
+    with pytest.raises(ValueError, match="Field 'age' expected type integer, got str"):
+        SchemaValidator.validate_input({'name': 'a', 'age': '3'}, SCHEMA)
+
+
+def test_validate_many_reports_the_failing_row():
+    rows = [{'name': 'a'}, {'name': 'b', 'age': 2}, {'name': 3}]
+    assert SchemaValidator.validate_many(rows[:2], SCHEMA)
+    with pytest.raises(ValueError, match='Row 2: Field'):
+        SchemaValidator.validate_many(rows, SCHEMA)
+
+
+def test_msgspec_types_validate_in_one_pass():
+    assert SchemaValidator.validate_input({'name': 'a'}, Row)
+    assert SchemaValidator.compile(Row).validate_many([{'name': 'a'}, {'name': 'b', 'age': 1}])
+    with pytest.raises(ValueError, match=r'Schema validation error: .*\$\[1\]\.age'):
+        SchemaValidator.validate_many([{'name': 'a'}, {'name': 'b', 'age': 'x'}], Row)
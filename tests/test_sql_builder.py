@@ -0,0 +1,34 @@
+import pytest
+
+from turso_python.batch import TursoBatch
+from turso_python.connection import TursoConnection
+from turso_python.local_server import HranaSQLiteServer, LocalTransport
+from turso_python.query_stats import QueryStats
+from turso_python.response_parser import TursoResponseParser
+from turso_python.sql_builder import build_statement, insert_sql, select_sql, update_sql
+
+
+def test_statements_are_cached_and_interned():
+    sql, count = build_statement('insert', 'users', ('name', 'age'))
+    assert (sql, count) == ('INSERT INTO users (name, age) VALUES (?, ?)', 2)
+    assert insert_sql('users', {'name': 1, 'age': 2}) is sql
+    assert update_sql('users', ['age'], 'id = ?') == 'UPDATE users SET age = ? WHERE id = ?'
+    assert select_sql('users', 'id', 'age > ?', ['JOIN t ON t.id = users.id']) == \
+        'SELECT id FROM users JOIN t ON t.id = users.id WHERE age > ?'
+    with pytest.raises(ValueError):
+        build_statement('upsert', 'users', ())
+
+
+def test_batch_insert_sends_sql_once():
+    server = HranaSQLiteServer()
+    stats = QueryStats(slow_threshold_s=None)
+    conn = TursoConnection('http://localhost', 't', transport=LocalTransport(server), listeners=[stats])
+    conn.execute_query('CREATE TABLE users (name TEXT, age INTEGER)')
+
+    resp = TursoBatch(conn).batch_insert('users', [{'name': f'u{i}', 'age': i} for i in range(5)])
+
+    assert len(resp['results']) == 6  # one per row, then close
+    assert resp['results'][0]['response']['type'] == 'execute'
+    assert stats.get('INSERT INTO users (name, age) VALUES (?, ?)')['calls'] == 1
+    res = TursoResponseParser.normalize_response(conn.execute_query('SELECT COUNT(*) FROM users'))
+    assert res['rows'] == [['5']]
@@ -0,0 +1,52 @@
+import pytest
+
+from turso_python.async_connection import AsyncTursoConnection
+from turso_python.async_crud import AsyncTursoCRUD
+from turso_python.connection import TursoConnection
+from turso_python.crud import TursoCRUD
+from turso_python.local_server import AsyncLocalTransport, HranaSQLiteServer, LocalTransport
+from turso_python.response_parser import TursoResponseParser
+from turso_python.sql_builder import upsert_sql
+
+SCHEMA = 'CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, visits INTEGER DEFAULT 0)'
+
+
+def _rows(conn):
+    res = conn.execute_query('SELECT id, name, visits FROM users ORDER BY id')
+    return TursoResponseParser.normalize_response(res)['rows']
+
+
+def test_upsert_sql():
+    assert upsert_sql('t', ('id', 'v'), ('id',), ('v',), 2) == \
+        'INSERT INTO t (id, v) VALUES (?, ?), (?, ?) ON CONFLICT (id) DO UPDATE SET v = excluded.v'
+    assert upsert_sql('t', ('id',), ('id',), ()).endswith('ON CONFLICT (id) DO NOTHING')
+
+
+def test_upsert_and_bulk_upsert():
+    server = HranaSQLiteServer()
+    conn = TursoConnection('http://localhost', 't', transport=LocalTransport(server))
+    crud = TursoCRUD(conn)
+    conn.execute_query(SCHEMA)
+    crud.upsert('users', {'id': 1, 'name': 'a', 'visits': 1}, ['id'])
+    crud.upsert('users', {'id': 1, 'name': 'b', 'visits': 5}, ['id'], update_columns=['visits'])
+    assert _rows(conn) == [['1', 'a', '5']]
+
+    before = server.pipeline_count
+    rows = ({'id': i, 'name': f'n{i}', 'visits': i} for i in range(1, 251))
+    assert crud.bulk_upsert('users', rows, ['id'], chunk_size=100) == 250
+    assert server.pipeline_count - before == 3
+    assert _rows(conn)[0] == ['1', 'n1', '1']
+    assert len(_rows(conn)) == 250
+    with pytest.raises(ValueError):
+        crud.upsert('users', {'name': 'x'}, ['id'])
+
+
+@pytest.mark.anyio
+async def test_async_upsert():
+    server = HranaSQLiteServer()
+    async with AsyncTursoConnection('http://localhost', 't', transport=AsyncLocalTransport(server)) as conn:
+        crud = AsyncTursoCRUD(conn)
+        await conn.execute_query(SCHEMA)
+        await crud.upsert('users', {'id': 7, 'name': 'a'}, ['id'])
+        assert await crud.bulk_upsert('users', [{'id': 7, 'name': 'z'}, {'id': 8, 'name': 'y'}], ['id']) == 2
+        assert await crud.read_all_rows('users', columns='name') == [['z'], ['y']]
@@ -0,0 +1,81 @@
+import base64
+import struct
+from array import array
+
+import pytest
+
+from turso_python.async_connection import AsyncTursoConnection
+from turso_python.connection import TursoConnection
+from turso_python.local_server import HranaSQLiteServer, LocalTransport
+from turso_python.response_parser import TursoResponseParser
+from turso_python.turso_vector import TursoVector, decode_vector, pack_vector
+
+
+def test_pack_vector_accepts_lists_arrays_and_numpy():
+    expected = struct.pack('<3f', 0.5, -1.0, 2.0)
+    assert pack_vector([0.5, -1.0, 2]) == expected
+    assert pack_vector(array('f', [0.5, -1.0, 2.0])) == expected
+    assert pack_vector(array('d', [0.5, -1.0, 2.0])) == expected
+    np = pytest.importorskip('numpy')
+    assert pack_vector(np.array([0.5, -1.0, 2.0])) == expected
+
+
+def test_format_args_sends_blobs():
+    blob = b'\x00\x01\xff'
+    expected = {'type': 'blob', 'base64': base64.b64encode(blob).decode('ascii')}
+    assert TursoConnection._format_args([blob]) == [expected]
+    assert AsyncTursoConnection._format_args([memoryview(blob)]) == [expected]
+    assert TursoConnection._format_args([True]) == [{'type': 'integer', 'value': '1'}]
+
+
+def test_parser_decodes_null_and_blob_cells():
+    resp = {'results': [{'type': 'ok', 'response': {'type': 'execute', 'result': {
+        'cols': [{'name': 'a'}, {'name': 'b'}],
+        'rows': [[{'type': 'null'}, {'type': 'blob', 'base64': 'AAE'}]],
+    }}}]}
+    assert TursoResponseParser.normalize_response(resp)['rows'] == [[None, b'\x00\x01']]
+
+
+def test_blob_embeddings_roundtrip_through_vector32():
+    conn = TursoConnection('http://localhost', 't', transport=LocalTransport())
+    vectors = TursoVector(conn, 'movies')
+    vectors.create_table('emb', 'F32_BLOB', 3)
+    vectors.insert_embedding('a', 2001, 'emb', [1.0, 0.0, 0.0])
+    vectors.insert_embedding('b', 2002, 'emb', array('f', [0.0, 1.0, 0.0]))
+    vectors.update_embedding('emb', 2, [0.0, 0.5, 0.5])
+
+    res = TursoResponseParser.normalize_response(vectors.extract_vector('emb', 2))
+    assert res['rows'] == [['[0,0.5,0.5]']]
+    res = TursoResponseParser.normalize_response(vectors.vector_distance_cos('emb', [1.0, 0.0, 0.0]))
+    assert [row[0] for row in res['rows']] == ['a', 'b']
+
+
+def test_extract_vectors_decodes_in_one_request():
+    server = HranaSQLiteServer()
+    vectors = TursoVector(TursoConnection('http://localhost', 't', transport=LocalTransport(server)), 'movies')
+    vectors.create_table('emb', 'F32_BLOB', 2)
+    vectors.bulk_insert_embeddings('emb', [({'title': t, 'year': 2000}, v)
+                                           for t, v in [('a', [1.0, 0.0]), ('b', [0.5, 0.5]), ('c', [0.0, 2.0])]])
+    before = server.pipeline_count
+
+    got = vectors.extract_vectors('emb', [3, 1, 42])
+    assert server.pipeline_count - before == 1
+    assert list(got) == [3, 1]
+    assert got[3] == array('f', [0.0, 2.0])
+    assert vectors.get_vector('emb', 2, output='list') == [0.5, 0.5]
+    assert vectors.get_vector('emb', 99) is None
+    assert decode_vector('[0.5,1]', 'list') == [0.5, 1.0]
+    np = pytest.importorskip('numpy')
+    assert vectors.get_vector('emb', 1, output='numpy').dtype == np.float32
+
+    res = TursoResponseParser.normalize_response(vectors.vector_distance_cos('emb', [0.0, 1.0], limit=2))
+    assert [row[0] for row in res['rows']] == ['c', 'b']
+    assert res['columns'][2] == 'distance'
+
+
+def test_extract_vectors_converts_non_f32_columns():
+    conn = TursoConnection('http://localhost', 't', transport=LocalTransport())
+    vectors = TursoVector(conn, 'movies')
+    vectors.create_table('emb', 'F64_BLOB', 3)
+    conn.execute_query("INSERT INTO movies (title, year, emb) VALUES ('a', 2000, vector64('[0.5, -1.25, 3]'))")
+    assert vectors.get_vector('emb', 1, output='list') == [0.5, -1.25, 3.0]
@@ -0,0 +1,109 @@
+import pytest
+
+from turso_python.async_connection import AsyncTursoConnection
+from turso_python.async_turso_vector import AsyncTursoVector
+from turso_python.connection import TursoConnection
+from turso_python.exceptions import TursoQueryError
+from turso_python.local_server import AsyncLocalTransport, HranaSQLiteServer, LocalTransport
+from turso_python.response_parser import TursoResponseParser
+from turso_python.turso_vector import TursoVector
+
+
+def _items(n):
+    for i in range(n):
+        yield {'title': f'doc-{i}', 'year': 2000 + i % 20}, [float(i), 1.0, 0.0]
+
+
+def _count(server, sql='SELECT COUNT(*) FROM docs'):
+    resp = server.execute_pipeline({'requests': [{'type': 'execute', 'stmt': {'sql': sql}}]})
+    return TursoResponseParser.normalize_response(resp)['rows'][0][0]
+
+
+@pytest.mark.parametrize('concurrency', [1, 3])
+def test_bulk_insert_embeddings_in_chunks(concurrency):
+    server = HranaSQLiteServer()
+    vectors = TursoVector(TursoConnection('http://localhost', 't', transport=LocalTransport(server)), 'docs')
+    vectors.create_table('emb', 'F32_BLOB', 3)
+    before = server.pipeline_count
+
+    inserted = vectors.bulk_insert_embeddings('emb', _items(250), chunk_size=100, concurrency=concurrency)
+
+    assert inserted == 250
+    assert server.pipeline_count - before == 3
+    assert _count(server) == '250'
+
+
+def test_bulk_insert_defers_index_creation():
+    server = HranaSQLiteServer()
+    vectors = TursoVector(TursoConnection('http://localhost', 't', transport=LocalTransport(server)), 'docs')
+    vectors.create_table('emb', 'F32_BLOB', 3)
+    vectors.create_index('emb')
+    vectors.bulk_insert_embeddings('emb', _items(10), chunk_size=4, defer_index=True)
+    assert _count(server, "SELECT COUNT(*) FROM sqlite_master WHERE name = 'docs_idx'") == '1'
+
+
+def test_deferred_index_keeps_definition_and_survives_failures():
+    server = HranaSQLiteServer()
+    conn = TursoConnection('http://localhost', 't', transport=LocalTransport(server))
+    TursoVector(conn, 'docs', metric='l2').create_table('emb', 'F32_BLOB', 3)
+    TursoVector(conn, 'docs', metric='l2').create_index('emb', compress_neighbors='float8', max_neighbors=16)
+    index_sql = _count(server, "SELECT sql FROM sqlite_master WHERE name = 'docs_idx'")
+
+    # A fresh instance that never called create_index rebuilds the same index
+    vectors = TursoVector(conn, 'docs')
+    vectors.bulk_insert_embeddings('emb', _items(10), chunk_size=4, defer_index=True)
+    assert _count(server, "SELECT sql FROM sqlite_master WHERE name = 'docs_idx'") == index_sql
+
+    bad = [*_items(5), ({'title': 'odd'}, [0.0, 0.0, 1.0])]
+    with pytest.raises(ValueError, match="expected \\['title', 'year'\\]"):
+        vectors.bulk_insert_embeddings('emb', bad, chunk_size=2, defer_index=True)
+    assert _count(server, "SELECT sql FROM sqlite_master WHERE name = 'docs_idx'") == index_sql
+    assert _count(server) == '14'
+
+
+@pytest.mark.anyio
+async def test_async_bulk_insert_accepts_async_iterables():
+    server = HranaSQLiteServer()
+
+    async def aitems():
+        for item in _items(120):
+            yield item
+
+    async with AsyncTursoConnection('http://localhost', 't', transport=AsyncLocalTransport(server)) as conn:
+        vectors = AsyncTursoVector(conn, 'docs')
+        await vectors.create_table('emb', 'F32_BLOB', 3)
+        inserted = await vectors.bulk_insert_embeddings('emb', aitems(), chunk_size=50, concurrency=2)
+    assert inserted == 120
+    assert _count(server) == '120'
+
+
+@pytest.mark.anyio
+async def test_async_deferred_index_untouched_by_empty_load():
+    server = HranaSQLiteServer()
+
+    async def aitems():
+        return
+        yield
+
+    async with AsyncTursoConnection('http://localhost', 't', transport=AsyncLocalTransport(server)) as conn:
+        vectors = AsyncTursoVector(conn, 'docs')
+        await vectors.create_table('emb', 'F32_BLOB', 3)
+        await vectors.create_index('emb')
+        assert await vectors.bulk_insert_embeddings('emb', aitems(), defer_index=True) == 0
+        with pytest.raises(ValueError):
+            await vectors.bulk_insert_embeddings('emb', [*_items(3), ({}, [0.0, 0.0, 1.0])], defer_index=True)
+    assert _count(server, "SELECT COUNT(*) FROM sqlite_master WHERE name = 'docs_idx'") == '1'
+
+
+@pytest.mark.anyio
+async def test_async_bulk_insert_raises_the_failing_batch_error():
+    server = HranaSQLiteServer()
+    async with AsyncTursoConnection('http://localhost', 't', transport=AsyncLocalTransport(server)) as conn:
+        vectors = AsyncTursoVector(conn, 'docs')
+        await vectors.create_table('emb', 'F32_BLOB', 3)
+        await vectors.create_index('emb')
+        await conn.execute_query('CREATE UNIQUE INDEX docs_title ON docs (title)')
+        items = [*_items(6), ({'title': 'doc-1', 'year': 2000}, [0.0, 0.0, 1.0])]
+        with pytest.raises(TursoQueryError, match='UNIQUE constraint failed'):
+            await vectors.bulk_insert_embeddings('emb', items, chunk_size=2, concurrency=2, defer_index=True)
+    assert _count(server, "SELECT COUNT(*) FROM sqlite_master WHERE name = 'docs_idx'") == '1'
@@ -0,0 +1,70 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from turso_python.async_connection import AsyncTursoConnection  # noqa: E402
+from turso_python.async_turso_vector import AsyncTursoVector  # noqa: E402
+from turso_python.connection import TursoConnection  # noqa: E402
+from turso_python.local_server import AsyncLocalTransport, HranaSQLiteServer, LocalTransport  # noqa: E402
+from turso_python.turso_vector import TursoVector  # noqa: E402
+
+
+def _docs(start, n, dims=4, seed=0):
+    rng = np.random.default_rng(seed)
+    for i in range(start, start + n):
+        yield {'title': f'd{i}', 'year': 2000}, rng.standard_normal(dims).astype('f4')
+
+
+@pytest.mark.parametrize('metric', ['cosine', 'l2'])
+def test_cache_search_matches_server_distances(metric):
+    server = HranaSQLiteServer()
+    vectors = TursoVector(TursoConnection('http://localhost', 't', transport=LocalTransport(server)),
+                          'docs', metric=metric)
+    vectors.create_table('emb', 'F32_BLOB', 4)
+    vectors.create_index('emb')
+    vectors.bulk_insert_embeddings('emb', _docs(0, 40))
+
+    cache = vectors.vector_cache('emb', page_size=16)
+    assert cache.refresh() == 40
+    query = [0.5, -0.2, 0.1, 0.9]
+    local = cache.search(query, top_k=5)
+    remote = vectors.batch_similarity_search('emb', [query], top_k=5)[0]['rows']
+    assert [i for i, _ in local] == [int(r[0]) for r in remote]
+    assert [d for _, d in local] == pytest.approx([r[3] for r in remote], abs=1e-5)
+    assert cache.rerank_search(query, top_k=5, candidates=10) == local
+
+
+def test_incremental_refresh_uses_rowid_watermark():
+    server = HranaSQLiteServer()
+    vectors = TursoVector(TursoConnection('http://localhost', 't', transport=LocalTransport(server)), 'docs')
+    vectors.create_table('emb', 'F32_BLOB', 4)
+    vectors.bulk_insert_embeddings('emb', _docs(0, 10))
+    cache = vectors.vector_cache('emb')
+    cache.refresh()
+    vectors.bulk_insert_embeddings('emb', _docs(10, 3, seed=1))
+
+    assert cache.refresh() == 3
+    assert cache.watermark == 13 and len(cache) == 13
+    assert cache.rerank([1, 0, 0, 0], [13, 2, 99], top_k=5)[0][0] in (2, 13)
+
+
+@pytest.mark.anyio
+async def test_async_vector_cache():
+    server = HranaSQLiteServer()
+    async with AsyncTursoConnection('http://localhost', 't', transport=AsyncLocalTransport(server)) as conn:
+        vectors = AsyncTursoVector(conn, 'docs')
+        await vectors.create_table('emb', 'F32_BLOB', 4)
+        await vectors.bulk_insert_embeddings('emb', _docs(0, 8))
+        cache = vectors.vector_cache('emb')
+        assert await cache.refresh() == 8
+    assert len(cache.search([1, 1, 1, 1], top_k=3)) == 3
+
+
+def test_cache_converts_non_f32_columns():
+    conn = TursoConnection('http://localhost', 't', transport=LocalTransport())
+    vectors = TursoVector(conn, 'docs', metric='l2')
+    vectors.create_table('emb', 'F64_BLOB', 3)
+    conn.execute_query("INSERT INTO docs (title, year, emb) VALUES ('a', 2000, vector64('[0.5, -1.25, 3]'))")
+    cache = vectors.vector_cache('emb')
+    assert cache.refresh() == 1
+    np.testing.assert_array_equal(cache.matrix, [[0.5, -1.25, 3.0]])
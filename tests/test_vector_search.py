@@ -0,0 +1,92 @@
+import pytest
+
+from turso_python.async_connection import AsyncTursoConnection
+from turso_python.async_turso_vector import AsyncTursoVector
+from turso_python.connection import TursoConnection
+from turso_python.local_server import AsyncLocalTransport, HranaSQLiteServer, LocalTransport
+from turso_python.response_parser import TursoResponseParser
+from turso_python.turso_vector import TursoVector
+
+_DOCS = [
+    ({'title': 'x', 'year': 2001}, [1.0, 0.0, 0.0]),
+    ({'title': 'y', 'year': 2002}, [0.0, 1.0, 0.0]),
+    ({'title': 'xy', 'year': 2003}, [1.0, 1.0, 0.0]),
+]
+
+
+def test_batch_similarity_search_uses_one_pipeline():
+    server = HranaSQLiteServer()
+    vectors = TursoVector(TursoConnection('http://localhost', 't', transport=LocalTransport(server)), 'docs')
+    vectors.create_table('emb', 'F32_BLOB', 3)
+    vectors.create_index('emb')
+    vectors.bulk_insert_embeddings('emb', _DOCS)
+    before = server.pipeline_count
+
+    results = vectors.batch_similarity_search('emb', [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], top_k=2)
+
+    assert server.pipeline_count - before == 1
+    assert [r['columns'] for r in results] == [['_rowid', 'title', 'year', 'distance']] * 2
+    assert [[row[1] for row in r['rows']] for r in results] == [['x', 'xy'], ['y', 'xy']]
+    assert results[0]['rows'][0][3] == pytest.approx(0.0, abs=1e-6)
+    assert results[0]['rows'][1][3] == pytest.approx(1 - 2 ** -0.5, abs=1e-6)
+    assert vectors.batch_similarity_search('emb', []) == []
+
+
+@pytest.mark.anyio
+async def test_async_batch_similarity_search():
+    server = HranaSQLiteServer()
+    async with AsyncTursoConnection('http://localhost', 't', transport=AsyncLocalTransport(server)) as conn:
+        vectors = AsyncTursoVector(conn, 'docs')
+        await vectors.create_table('emb', 'F32_BLOB', 3)
+        await vectors.create_index('emb')
+        await vectors.bulk_insert_embeddings('emb', _DOCS)
+        results = await vectors.batch_similarity_search('emb', [[0.0, 1.0, 0.0]] * 3, top_k=1)
+    assert [r['rows'][0][1] for r in results] == ['y'] * 3
+
+
+def test_custom_schema_metric_and_filtered_search():
+    server = HranaSQLiteServer()
+    conn = TursoConnection('http://localhost', 't', transport=LocalTransport(server))
+    vectors = TursoVector(conn, 'items', metadata_columns={'name': 'TEXT', 'kind': 'TEXT'},
+                          index_name='items_vec', metric='l2')
+    vectors.create_table('emb', 'F32_BLOB', 2)
+    vectors.create_index('emb', compress_neighbors='float8', max_neighbors=16)
+    for i in range(10):
+        vectors.insert_row('emb', {'name': f'n{i}', 'kind': 'even' if i % 2 == 0 else 'odd'}, [float(i), 0.0])
+
+    res = TursoResponseParser.normalize_response(
+        vectors.search('emb', [3.2, 0.0], top_k=2, where='items.kind = ?', where_args=['even'], candidates=10)
+    )
+    assert res['columns'] == ['_rowid', 'name', 'kind', 'distance']
+    assert [row[1] for row in res['rows']] == ['n4', 'n2']
+    assert res['rows'][0][3] == pytest.approx(0.8, abs=1e-5)
+
+    index_sql = server.execute_pipeline({'requests': [{'type': 'execute', 'stmt': {
+        'sql': "SELECT sql FROM sqlite_master WHERE name = 'items_vec'"}}]})
+    assert "'metric=l2', 'compress_neighbors=float8', 'max_neighbors=16'" in \
+        TursoResponseParser.normalize_response(index_sql)['rows'][0][0]
+    with pytest.raises(ValueError):
+        vectors.create_index('emb', compress_neighbors='float7')
+
+
+def test_table_id_column_does_not_clash_with_index_ids():
+    conn = TursoConnection('http://localhost', 't', transport=LocalTransport())
+    vectors = TursoVector(conn, 'docs', metadata_columns={'id': 'INTEGER', 'body': 'TEXT'})
+    vectors.create_table('emb', 'F32_BLOB', 2)
+    vectors.create_index('emb')
+    vectors.bulk_insert_embeddings('emb', [({'id': 100 + i, 'body': f'b{i}'}, [1.0, float(i)]) for i in range(5)])
+
+    res = TursoResponseParser.normalize_response(
+        vectors.search('emb', [1.0, 0.0], top_k=2, where='id >= ?', where_args=[102], candidates=5)
+    )
+    assert res['columns'] == ['_rowid', 'id', 'body', 'distance']
+    assert [row[:3] for row in res['rows']] == [['3', '102', 'b2'], ['4', '103', 'b3']]
+    rows = TursoResponseParser.normalize_response(vectors.vector_similarity_search('emb', [1.0, 0.0], top_k=1))
+    assert rows['columns'] == ['id', 'body'] and rows['rows'] == [['100', 'b0']]
+
+    with pytest.raises(ValueError, match='use insert_row'):
+        vectors.insert_embedding('t', 2000, 'emb', [0.0, 1.0])
+    with pytest.raises(ValueError, match='missing: title'):
+        vectors.vector_distance_cos('emb', [0.0, 1.0])
+    with pytest.raises(ValueError, match='missing: year'):
+        vectors.create_partial_index('emb', 2000)
@@ -0,0 +1,73 @@
+import time
+
+import anyio
+import pytest
+
+from turso_python.async_connection import AsyncTursoConnection
+from turso_python.connection import TursoConnection
+from turso_python.local_server import (
+    AsyncLocalTransport,
+    HranaSQLiteServer,
+    LocalHranaHTTPServer,
+    LocalTransport,
+)
+
+
+def test_sync_warmup_opens_pooled_connections():
+    server = HranaSQLiteServer(latency=0.05)
+    events = []
+    with LocalHranaHTTPServer(server) as srv:
+        with TursoConnection(srv.url, 't', listeners=[events.append]) as c:
+            c.warmup(4)
+            pools = c.session.get_adapter(srv.url).poolmanager.pools
+            (key,) = pools.keys()
+            assert pools[key].num_connections == 4
+    assert server.pipeline_count == 4
+    assert events == []
+
+
+def test_sync_warmup_without_query():
+    server = HranaSQLiteServer()
+    c = TursoConnection('http://localhost', 't', transport=LocalTransport(server))
+    c.warmup(run_query=False)
+    assert server.pipeline_count == 1
+    with pytest.raises(ValueError):
+        c.warmup(0)
+
+
+def test_sync_keepalive_pings_until_stopped():
+    server = HranaSQLiteServer()
+    c = TursoConnection('http://localhost', 't', transport=LocalTransport(server))
+    c.start_keepalive(0.01, n_connections=2)
+    deadline = time.monotonic() + 2
+    while server.pipeline_count < 4 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    c.close()
+    count = server.pipeline_count
+    assert count >= 4
+    time.sleep(0.05)
+    assert server.pipeline_count == count
+
+
+@pytest.mark.anyio
+async def test_async_warmup_and_keepalive():
+    server = HranaSQLiteServer()
+    events = []
+    async with AsyncTursoConnection('http://localhost', 't', transport=AsyncLocalTransport(server),
+                                    listeners=[events.append]) as c:
+        await c.warmup(3)
+        assert server.pipeline_count == 3
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(c.keepalive, 0.01)
+            while server.pipeline_count < 5:
+                await anyio.sleep(0.01)
+            tg.cancel_scope.cancel()
+    assert events == []
+
+
+@pytest.mark.anyio
+async def test_async_warmup_raises_first_error():
+    with LocalHranaHTTPServer(HranaSQLiteServer(auth_token='secret')) as srv:
+        async with AsyncTursoConnection(srv.url, 'wrong', transport=None) as c:
+            with pytest.raises(Exception, match='401'):
+                await c.warmup(2)
@@ -1,28 +1,118 @@
 # Package exports
-from .advanced_queries import TursoAdvancedQueries
-from .batch import TursoBatch
-from .connection import TursoConnection
-from .crud import (
-    TursoClient,
-    TursoCRUD,
-    TursoDataManager,
-    TursoSchemaManager,
-)
-from .exceptions import TursoError, TursoHTTPError, TursoRateLimitError
-from .logger import TursoLogger
-from .result import Result
-from .schema_validator import SchemaValidator
-from .turso_vector import TursoVector
-
-# Optional async exports; do not hard-fail if aiohttp is not installed yet
-try:
-    from .async_connection import AsyncTursoConnection  # type: ignore
-    from .async_crud import AsyncTursoCRUD  # type: ignore
-    _ASYNC_AVAILABLE = True
-except Exception:  # ImportError or runtime issues
-    AsyncTursoConnection = None  # type: ignore
-    AsyncTursoCRUD = None  # type: ignore
-    _ASYNC_AVAILABLE = False
+# Submodules are imported on first attribute access (PEP 562), so `import turso_python` stays
+# cheap and requests, aiohttp, msgspec and the optional subsystems load only when used.
+from __future__ import annotations
+
+import importlib
+import importlib.util
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .advanced_queries import TursoAdvancedQueries
+    from .async_connection import AsyncTursoConnection
+    from .async_crud import AsyncTursoCRUD
+    from .async_turso_vector import AsyncTursoVector
+    from .batch import TursoBatch
+    from .connection import TursoConnection
+    from .crud import (
+        TursoClient,
+        TursoCRUD,
+        TursoDataManager,
+        TursoSchemaManager,
+    )
+    from .deadlines import deadline
+    from .exceptions import (
+        TursoConnectionError,
+        TursoError,
+        TursoHTTPError,
+        TursoLaneFullError,
+        TursoQueryError,
+        TursoRateLimitError,
+        TursoTimeoutError,
+    )
+    from .instrumentation import LoggingListener, RequestEvent, RequestListener
+    from .lanes import Lane, LaneScheduler, use_lane
+    from .loader import Loader
+    from .local_server import (
+        AsyncLocalTransport,
+        HranaSQLiteServer,
+        LocalHranaHTTPServer,
+        LocalTransport,
+    )
+    from .logger import TursoLogger
+    from .query_stats import QueryStats
+    from .result import Result
+    from .schema_validator import SchemaValidator
+    from .transport import AsyncTransport, Transport, TransportResponse
+    from .turso_vector import TursoVector
+    from .vector_cache import AsyncVectorCache, VectorCache
+
+# export name -> submodule
+_EXPORTS = {
+    "TursoAdvancedQueries": ".advanced_queries",
+    "TursoBatch": ".batch",
+    "TursoConnection": ".connection",
+    "TursoClient": ".crud",
+    "TursoCRUD": ".crud",
+    "TursoDataManager": ".crud",
+    "TursoSchemaManager": ".crud",
+    "TursoConnectionError": ".exceptions",
+    "TursoError": ".exceptions",
+    "TursoHTTPError": ".exceptions",
+    "TursoQueryError": ".exceptions",
+    "TursoRateLimitError": ".exceptions",
+    "TursoTimeoutError": ".exceptions",
+    "TursoLaneFullError": ".exceptions",
+    "deadline": ".deadlines",
+    "LoggingListener": ".instrumentation",
+    "RequestEvent": ".instrumentation",
+    "RequestListener": ".instrumentation",
+    "AsyncLocalTransport": ".local_server",
+    "HranaSQLiteServer": ".local_server",
+    "LocalHranaHTTPServer": ".local_server",
+    "LocalTransport": ".local_server",
+    "TursoLogger": ".logger",
+    "QueryStats": ".query_stats",
+    "Result": ".result",
+    "SchemaValidator": ".schema_validator",
+    "AsyncTransport": ".transport",
+    "Transport": ".transport",
+    "TransportResponse": ".transport",
+    "TursoVector": ".turso_vector",
+    "AsyncVectorCache": ".vector_cache",
+    "VectorCache": ".vector_cache",
+}
+
+# Optional async exports; they resolve to None instead of failing if anyio is not installed
+_ASYNC_EXPORTS = {
+    "AsyncTursoConnection": ".async_connection",
+    "AsyncTursoCRUD": ".async_crud",
+    "AsyncTursoVector": ".async_turso_vector",
+    "Loader": ".loader",
+    "Lane": ".lanes",
+    "LaneScheduler": ".lanes",
+    "use_lane": ".lanes",
+}
+_ASYNC_AVAILABLE = importlib.util.find_spec("anyio") is not None
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    elif name in _ASYNC_EXPORTS:
+        try:
+            value = getattr(importlib.import_module(_ASYNC_EXPORTS[name], __name__), name)
+        except Exception:  # ImportError or runtime issues
+            value = None
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "TursoAdvancedQueries",
@@ -34,15 +124,40 @@ __all__ = [
     "SchemaValidator",
     "TursoLogger",
     "TursoVector",
+    "VectorCache",
+    "AsyncVectorCache",
     "TursoConnection",
+    # Transports and the local stand-in server
+    "Transport",
+    "AsyncTransport",
+    "TransportResponse",
+    "LocalTransport",
+    "AsyncLocalTransport",
+    "HranaSQLiteServer",
+    "LocalHranaHTTPServer",
+    # Instrumentation
+    "RequestEvent",
+    "RequestListener",
+    "LoggingListener",
+    "QueryStats",
     # Exceptions and result types
     "TursoError",
     "TursoHTTPError",
+    "TursoQueryError",
     "TursoRateLimitError",
+    "TursoConnectionError",
+    "TursoTimeoutError",
+    "TursoLaneFullError",
     "Result",
+    "deadline",
 ]
 if _ASYNC_AVAILABLE:
     __all__ += [
         "AsyncTursoConnection",
         "AsyncTursoCRUD",
+        "AsyncTursoVector",
+        "Loader",
+        "Lane",
+        "LaneScheduler",
+        "use_lane",
     ]
@@ -3,13 +3,42 @@
 
 from __future__ import annotations
 
+import base64
+import logging
+import math
 import os
 import random
-from typing import Any
+import time
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any
 
-import aiohttp
+import anyio
 
-from .exceptions import TursoHTTPError, TursoRateLimitError
+from .compression import ACCEPT_ENCODING, DEFAULT_COMPRESSION_THRESHOLD, RequestCompressor
+from .deadlines import deadline_at, remaining
+from .encoding import encode_pipeline
+from .exceptions import TursoConnectionError, TursoHTTPError, TursoRateLimitError, TursoTimeoutError
+from .instrumentation import (
+    LoggingListener,
+    RequestEvent,
+    RequestListener,
+    as_listener,
+    emit_finished,
+    emit_started,
+    remove_listener,
+)
+from .lanes import LaneScheduler, current_lane
+from .response_parser import strip_stored_sql_results
+from .transport import AiohttpTransport, AsyncHttpxTransport, AsyncTransport
+
+if TYPE_CHECKING:
+    import aiohttp
+
+logger = logging.getLogger("turso_python")
+
+# Warm-up/keepalive pipelines: an empty stream (connection setup only) or a trivial query
+_OPEN_PIPELINE = {"requests": [{"type": "close"}]}
+_PING_PIPELINE = {"requests": [{"type": "execute", "stmt": {"sql": "SELECT 1", "args": []}}, {"type": "close"}]}
 
 
 def _normalize_database_url(url: str) -> str:
@@ -28,6 +57,15 @@ class AsyncTursoConnection:
         session: aiohttp.ClientSession | None = None,
         retries: int = 0,
         backoff_base: float = 0.2,
+        transport: AsyncTransport | None = None,
+        listeners: list[RequestListener | Callable[[RequestEvent], Any]] | None = None,
+        debug_sql: bool = False,
+        compression: str | None = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        accept_compressed: bool = True,
+        http2: bool = False,
+        call_timeout: float | None = None,
+        lanes: LaneScheduler | None = None,
 ) -> None:
         env_url = os.getenv("TURSO_DATABASE_URL")
         env_token = os.getenv("TURSO_AUTH_TOKEN")
@@ -35,36 +73,112 @@ class AsyncTursoConnection:
             raise ValueError("database_url not provided and TURSO_DATABASE_URL is not set")
         if not (auth_token or env_token):
             raise ValueError("auth_token not provided and TURSO_AUTH_TOKEN is not set")
+        if transport is not None and session is not None:
+            raise ValueError("Pass either session or transport, not both")
+        if http2 and (transport is not None or session is not None):
+            raise ValueError("http2=True builds its own transport; do not pass session or transport")
 
         self.database_url = _normalize_database_url(database_url or env_url)  # type: ignore[arg-type]
         self.auth_token = auth_token or env_token  # type: ignore[assignment]
-        # More precise timeouts by phase
-        self._timeout = aiohttp.ClientTimeout(total=None, connect=timeout, sock_connect=timeout, sock_read=timeout)
-        self._external_session = session is not None
-        self._session = session
+        self._timeout = None
+        if http2:
+            # One multiplexed HTTP/2 connection instead of an HTTP/1.1 connection per in-flight request
+            transport = AsyncHttpxTransport(timeout=timeout)
+        elif transport is None:
+            # aiohttp is imported here rather than at module level: it dominates import time
+            import aiohttp
+
+            # More precise timeouts by phase
+            self._timeout = aiohttp.ClientTimeout(total=None, connect=timeout, sock_connect=timeout, sock_read=timeout)
+            transport = AiohttpTransport(session, timeout=self._timeout)
+        self._transport = transport
         self._headers = {
             "Authorization": f"Bearer {self.auth_token}",
             "Content-Type": "application/json",
+            "Accept-Encoding": ACCEPT_ENCODING if accept_compressed else "identity",
         }
+        # Opt-in: request bodies of at least compression_threshold bytes are sent compressed
+        self._compressor = RequestCompressor(compression, compression_threshold) if compression else None
         self._retries = max(0, int(retries))
         self._backoff_base = float(backoff_base)
+        self._request_timeout = timeout
+        # Budget for a whole call including retries and backoff; deadlines.deadline() can shorten it
+        self._call_timeout = call_timeout
+        # Optional admission control: per-lane concurrency budgets (see lanes.py)
+        self._lanes = lanes
+        self._listeners: list[RequestListener] = [as_listener(li) for li in listeners or []]
+        if debug_sql:
+            self._listeners.append(LoggingListener())
 
     async def __aenter__(self) -> AsyncTursoConnection:
-        if self._session is None:
-            self._session = aiohttp.ClientSession(timeout=self._timeout)
+        await self._transport.open()
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:
-        if self._session and not self._external_session:
-            await self._session.close()
-            self._session = None
+        await self._transport.close()
+
+    @property
+    def transport(self) -> AsyncTransport:
+        return self._transport
+
+    @property
+    def lanes(self) -> LaneScheduler | None:
+        return self._lanes
+
+    async def warmup(self, n_connections: int = 1, *, run_query: bool = True) -> None:
+        """Create the client session and open up to ``n_connections`` pooled connections.
+
+        Sends ``n_connections`` pipelines concurrently, so session creation and DNS, TCP and
+        TLS setup happen now instead of on the first query. Each runs ``SELECT 1``
+        (``run_query=True``) or is an empty pipeline that only sets up the connection.
+        Warm-up requests are not reported to listeners.
+        """
+        if n_connections < 1:
+            raise ValueError("n_connections must be at least 1")
+        await self._transport.open()
+        payload = _PING_PIPELINE if run_query else _OPEN_PIPELINE
+        errors: list[Exception] = []
+
+        async def open_one() -> None:
+            try:
+                await self._send(payload, None)
+            except Exception as e:
+                errors.append(e)
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(n_connections):
+                tg.start_soon(open_one)
+        if errors:
+            raise errors[0]
+
+    async def keepalive(self, interval: float = 10.0, n_connections: int = 1, *, run_query: bool = False) -> None:
+        """Ping the server every ``interval`` seconds until cancelled.
+
+        Run it in a task group next to the application (``tg.start_soon(conn.keepalive)``)
+        to keep up to ``n_connections`` idle connections from being closed by proxies, load
+        balancers or aiohttp's 15 s keep-alive timeout. Failed pings are logged and retried
+        at the next interval.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        while True:
+            await anyio.sleep(interval)
+            try:
+                await self.warmup(n_connections, run_query=run_query)
+            except Exception as e:
+                logger.warning("Turso keepalive ping failed: %s", e)
+
+    def add_listener(self, listener: RequestListener | Callable[[RequestEvent], Any]) -> None:
+        """Register a listener notified with a RequestEvent for every pipeline request."""
+        self._listeners.append(as_listener(listener))
+
+    def remove_listener(self, listener: RequestListener | Callable[[RequestEvent], Any]) -> None:
+        remove_listener(self._listeners, listener)
 
     @property
     def session(self) -> aiohttp.ClientSession:
-        if self._session is None:
-            # Allow ad-hoc usage without context manager, but ensure session exists
-            self._session = aiohttp.ClientSession(timeout=self._timeout)
-        return self._session
+        # Only meaningful for the default aiohttp transport
+        return self._transport.session  # type: ignore[attr-defined]
 
     async def execute_query(self, sql: str, args: list[Any] | None = None) -> dict[str, Any]:
         payload = {
@@ -79,76 +193,191 @@ class AsyncTursoConnection:
                 {"type": "close"},
             ]
         }
-        attempt = 0
-        while True:
-            try:
-                async with self.session.post(
-                    f"{self.database_url}/v2/pipeline", json=payload, headers=self._headers
-                ) as resp:
-                    if resp.status == 200:
-                        return await resp.json()
-                    retry_after = None
-                    if resp.status == 429:
-                        ra = resp.headers.get('Retry-After')
-                        try:
-                            retry_after = float(ra) if ra else None
-                        except Exception:
-                            retry_after = None
-                    text = await resp.text()
-                    if resp.status == 429:
-                        raise TursoRateLimitError(resp.status, text, retry_after)
-                    raise TursoHTTPError(resp.status, text)
-            except (aiohttp.ClientError, TursoHTTPError):
-                if attempt >= self._retries:
-                    raise
-            # backoff with jitter
-            delay = self._backoff_base * (2 ** attempt) + random.uniform(0, self._backoff_base)
-            import anyio
-            await anyio.sleep(delay)
-            attempt += 1
+        return await self._post(payload)
+
+    async def batch(self, queries: list[dict[str, Any]]) -> dict[str, Any]:
+        """Execute multiple SQL statements in one pipeline request.
+
+        Args:
+            queries: List of dicts with 'sql' and optional 'args'.
+        """
+        reqs: list[dict[str, Any]] = [
+            {
+                "type": "execute",
+                "stmt": {"sql": q["sql"], "args": self._format_args(q.get("args") or [])},
+            }
+            for q in queries
+        ]
+        reqs.append({"type": "close"})
+        return await self._post({"requests": reqs})
+
+    async def execute_many(self, sql: str, args_list: Iterable[list[Any] | tuple]) -> dict[str, Any]:
+        """Execute one statement once per argument list in a single pipeline.
+
+        The SQL text is sent once (Hrana store_sql); see TursoConnection.execute_many.
+        """
+        reqs: list[dict[str, Any]] = [{"type": "store_sql", "sql_id": 1, "sql": sql}]
+        reqs.extend(
+            {"type": "execute", "stmt": {"sql_id": 1, "args": self._format_args(args)}}
+            for args in args_list
+        )
+        reqs.append({"type": "close_sql", "sql_id": 1})
+        reqs.append({"type": "close"})
+        return strip_stored_sql_results(await self._post({"requests": reqs}), len(reqs) - 3)
 
     async def execute_pipeline(self, queries: list[dict[str, Any]]) -> dict[str, Any]:
         payload = {"requests": queries + [{"type": "close"}]}
+        return await self._post(payload)
+
+    async def _post(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Send a pipeline payload through the transport with retries and backoff."""
+        if not self._listeners:
+            return await self._send(payload, None)
+        event = RequestEvent.from_payload(payload)
+        emit_started(self._listeners, event)
+        try:
+            result = await self._send(payload, event)
+        except BaseException as e:
+            event.finish(e)
+            emit_finished(self._listeners, event)
+            raise
+        event.record_result(result)
+        event.finish()
+        emit_finished(self._listeners, event)
+        return result
+
+    async def _send(self, payload: dict[str, Any], event: RequestEvent | None) -> dict[str, Any]:
+        at = deadline_at(self._call_timeout)
+        if at is None:
+            return await self._admit(payload, event, None)
+        # The cancel scope also interrupts a queued or in-flight request or a backoff sleep
+        try:
+            with anyio.fail_after(max(remaining(at), 0.0)):
+                return await self._admit(payload, event, at)
+        except TimeoutError as e:
+            if isinstance(e, TursoTimeoutError):
+                raise
+            raise TursoTimeoutError("Request exceeded its deadline") from e
+
+    async def _admit(self, payload: dict[str, Any], event: RequestEvent | None, at: float | None) -> dict[str, Any]:
+        if self._lanes is None:
+            return await self._attempts(payload, event, at)
+        lane = current_lane() or self._lanes.default_lane
+        if event is not None:
+            event.lane = lane
+        async with self._lanes.slot(lane) as waited:
+            if event is not None:
+                event.queue_s = waited
+            return await self._attempts(payload, event, at)
+
+    async def _attempts(self, payload: dict[str, Any], event: RequestEvent | None, at: float | None) -> dict[str, Any]:
+        t0 = time.perf_counter()
+        raw = encode_pipeline(payload)
+        body, headers = self._compress(raw)
+        if event is not None:
+            event.serialize_s = time.perf_counter() - t0
+            event.record_body(len(raw), len(body), headers.get("Content-Encoding"))
         attempt = 0
         while True:
+            retry_after = None
+            rate_limited = False
+            # Any enclosing anyio deadline (ours or the caller's) caps the socket timeout
+            timeout = None
+            scope_deadline = anyio.current_effective_deadline()
+            if scope_deadline != math.inf:
+                timeout = min(self._request_timeout, max(scope_deadline - anyio.current_time(), 0.0))
             try:
-                async with self.session.post(
-                    f"{self.database_url}/v2/pipeline", json=payload, headers=self._headers
-                ) as resp:
-                    if resp.status == 200:
-                        return await resp.json()
-                    retry_after = None
-                    if resp.status == 429:
-                        ra = resp.headers.get('Retry-After')
-                        try:
-                            retry_after = float(ra) if ra else None
-                        except Exception:
-                            retry_after = None
-                    text = await resp.text()
-                    if resp.status == 429:
-                        raise TursoRateLimitError(resp.status, text, retry_after)
-                    raise TursoHTTPError(resp.status, text)
-            except (aiohttp.ClientError, TursoHTTPError):
+                t0 = time.perf_counter()
+                try:
+                    resp = await self._transport.post(
+                        f"{self.database_url}/v2/pipeline", body, headers, timeout
+                    )
+                finally:
+                    if event is not None:
+                        event.network_s += time.perf_counter() - t0
+                if event is not None:
+                    event.record_response(len(resp.content), resp.wire_bytes)
+                    event.status = resp.status_code
+                if resp.status_code == 415 and body is not raw:
+                    # The server does not take compressed bodies: stop compressing and resend
+                    self._compressor = None
+                    body, headers = raw, self._headers
+                    if event is not None:
+                        event.record_body(len(raw), len(raw), None)
+                    continue
+                if resp.status_code == 200:
+                    return resp.json()
+                if resp.status_code == 429:
+                    ra = resp.headers.get('Retry-After')
+                    try:
+                        retry_after = float(ra) if ra else None
+                    except Exception:
+                        retry_after = None
+                    raise TursoRateLimitError(resp.status_code, resp.text, retry_after)
+                raise TursoHTTPError(resp.status_code, resp.text)
+            except TursoRateLimitError:
                 if attempt >= self._retries:
                     raise
-            import anyio
+                rate_limited = True
+            except (TursoConnectionError, TursoHTTPError) as e:
+                if at is not None and remaining(at) <= 0:
+                    raise TursoTimeoutError(f"Request exceeded its deadline: {e}") from e
+                if attempt >= self._retries:
+                    raise
+            # backoff with jitter; honour Retry-After when rate limited
             delay = self._backoff_base * (2 ** attempt) + random.uniform(0, self._backoff_base)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+            if at is not None and delay >= remaining(at):
+                # Sleeping would use up the budget; fail now rather than at the deadline
+                raise TursoTimeoutError(f"Request cannot retry within its deadline (backoff {delay:.3f}s)")
+            if event is not None:
+                event.retries += 1
+                event.backoff_s += delay
+                if rate_limited:
+                    event.rate_limit_wait_s += delay
             await anyio.sleep(delay)
             attempt += 1
 
+    @property
+    def compression(self) -> str | None:
+        """Request body encoding in use; None when disabled or after the server refused it."""
+        return self._compressor.encoding if self._compressor is not None else None
+
+    def _compress(self, body: bytes) -> tuple[bytes, dict[str, str]]:
+        if self._compressor is not None:
+            compressed = self._compressor.compress(body)
+            if compressed is not None:
+                return compressed, {**self._headers, "Content-Encoding": self._compressor.encoding}
+        return body, self._headers
+
     @staticmethod
     def _format_args(args: list[Any]) -> list[dict[str, str]]:
         formatted: list[dict[str, str]] = []
+        append = formatted.append
         for a in args:
-            if a is None:
-                formatted.append({"type": "null", "value": "null"})
+            # Exact-type checks first: the common cases skip the isinstance chain
+            t = type(a)
+            if t is str:
+                append({"type": "text", "value": a})
+            elif t is int:
+                append({"type": "integer", "value": str(a)})
+            elif t is float:
+                append({"type": "float", "value": str(a)})
+            elif a is None:
+                append({"type": "null", "value": "null"})
             elif isinstance(a, bool):
-                formatted.append({"type": "integer", "value": "1" if a else "0"})
+                append({"type": "integer", "value": "1" if a else "0"})
+            elif isinstance(a, str):
+                # str.__str__ gives the raw text; str() of a str Enum member is 'Cls.NAME'
+                append({"type": "text", "value": str.__str__(a)})
             elif isinstance(a, int):
-                formatted.append({"type": "integer", "value": str(a)})
+                append({"type": "integer", "value": str(int(a))})
             elif isinstance(a, float):
-                formatted.append({"type": "float", "value": str(a)})
+                append({"type": "float", "value": str(float(a))})
+            elif isinstance(a, bytes | bytearray | memoryview):
+                append({"type": "blob", "base64": base64.b64encode(a).decode("ascii")})
             else:
-                formatted.append({"type": "text", "value": str(a)})
+                append({"type": "text", "value": str(a)})
         return formatted
 
@@ -1,10 +1,24 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from contextlib import asynccontextmanager
 from typing import Any
 
 from .async_connection import AsyncTursoConnection
 from .response_parser import TursoResponseParser
+from .row_mapping import map_result
+from .sql_builder import (
+    bulk_delete_statements,
+    bulk_update_statements,
+    delete_sql,
+    insert_sql,
+    pipelined,
+    select_sql,
+    update_sql,
+    upsert_plan,
+    upsert_sql,
+    upsert_statements,
+)
 
 
 class AsyncTursoCRUD:
@@ -31,12 +45,17 @@ class AsyncTursoCRUD:
             await self.connection.__aexit__(None, None, None)
             self.connection = None
     
-    async def create(self, table: str, data: dict[str, Any]) -> dict[str, Any]:
-        """Create a new record in the table"""
-        columns = ", ".join(data.keys())
-        placeholders = ", ".join(["?" for _ in data])
-        sql = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+    async def create(self, table: str, data: dict[str, Any],
+                     returning: str | list[str] | None = None) -> dict[str, Any]:
+        """
+        Create a new record in the table.
         
+        The normalized result carries last_insert_rowid and affected_row_count; with
+        returning (e.g. "*" or ["id", "created_at"]) its rows hold the inserted values,
+        defaults included, so no follow-up read is needed.
+        """
+        sql = insert_sql(table, data, returning)
+
         raw_result = await self.connection.execute_query(sql, list(data.values()))
         return TursoResponseParser.normalize_response(raw_result)
     
@@ -44,7 +63,8 @@ class AsyncTursoCRUD:
                   where: str | None = None,
                   args: list[Any] | None = None,
                   columns: str = "*",
-                  joins: list[str] | None = None) -> dict[str, Any]:
+                  joins: list[str] | None = None,
+                  as_type: type | None = None) -> dict[str, Any] | list[Any]:
         """
         Read records from the table, with optional JOINs.
         
@@ -54,36 +74,109 @@ class AsyncTursoCRUD:
             'columns': ['uid'],
             'count': 2
         }
-        """
-        sql = f"SELECT {columns} FROM {table}"
-        if joins:
-            sql += " " + " ".join(joins)
-        if where:
-            sql += f" WHERE {where}"
         
+        With as_type (a msgspec Struct or dataclass), returns a list of instances instead,
+        built by a decoder compiled once per type and column list.
+        """
+        sql = select_sql(table, columns, where, joins)
         raw_result = await self.connection.execute_query(sql, args or [])
-        return TursoResponseParser.normalize_response(raw_result)
+        result = TursoResponseParser.normalize_response(raw_result)
+        return map_result(as_type, result) if as_type is not None else result
     
     async def update(self, table: str,
                     data: dict[str, Any],
                     where: str,
-                    where_args: list[Any]) -> dict[str, Any]:
-        """Update records in the table"""
-        set_clause = ", ".join([f"{k} = ?" for k in data])
-        sql = f"UPDATE {table} SET {set_clause} WHERE {where}"
-        
+                    where_args: list[Any],
+                    returning: str | list[str] | None = None) -> dict[str, Any]:
+        """Update records in the table; with returning, rows hold the updated values"""
+        sql = update_sql(table, data, where, returning)
+
         raw_result = await self.connection.execute_query(
             sql, 
             list(data.values()) + where_args
         )
         return TursoResponseParser.normalize_response(raw_result)
     
-    async def delete(self, table: str, where: str, args: list[Any]) -> dict[str, Any]:
-        """Delete records from the table"""
-        sql = f"DELETE FROM {table} WHERE {where}"
+    async def delete(self, table: str, where: str, args: list[Any],
+                     returning: str | list[str] | None = None) -> dict[str, Any]:
+        """Delete records from the table; with returning, rows hold the deleted values"""
+        sql = delete_sql(table, where, returning)
         raw_result = await self.connection.execute_query(sql, args)
         return TursoResponseParser.normalize_response(raw_result)
     
+    async def upsert(self, table: str,
+                     data: dict[str, Any],
+                     conflict_columns: list[str],
+                     update_columns: list[str] | None = None) -> dict[str, Any]:
+        """
+        Insert a record, or update the existing one on a conflict (INSERT ... ON CONFLICT DO UPDATE).
+        
+        update_columns defaults to every column in data except conflict_columns; pass an
+        empty list to leave existing rows untouched (DO NOTHING).
+        """
+        columns, conflict, update = upsert_plan(data, conflict_columns, update_columns)
+        sql = upsert_sql(table, columns, conflict, update)
+        raw_result = await self.connection.execute_query(sql, list(data.values()))
+        return TursoResponseParser.normalize_response(raw_result)
+    
+    async def bulk_upsert(self, table: str,
+                          rows: Iterable[dict[str, Any]],
+                          conflict_columns: list[str],
+                          update_columns: list[str] | None = None,
+                          *,
+                          chunk_size: int = 500) -> int:
+        """
+        Upsert many records with multi-row ON CONFLICT statements, one request per chunk.
+        
+        Rows are read lazily, chunk_size at a time (capped by the SQL parameter limit);
+        all rows must have the same keys. Returns the number of affected rows.
+        """
+        affected = 0
+        for sql, args in upsert_statements(table, rows, conflict_columns, update_columns, chunk_size):
+            raw_result = await self.connection.execute_query(sql, args)
+            TursoResponseParser._raise_if_error(raw_result)
+            affected += TursoResponseParser.affected_row_count(raw_result)
+        return affected
+    
+    async def _run_pipelined(self, statements, chunks_per_request: int) -> int:
+        affected = 0
+        for queries in pipelined(statements, chunks_per_request):
+            raw_result = await self.connection.batch(queries)
+            TursoResponseParser._raise_if_error(raw_result)
+            affected += TursoResponseParser.affected_row_count(raw_result)
+        return affected
+    
+    async def bulk_delete(self, table: str,
+                          key_column: str,
+                          keys: Iterable[Any],
+                          *,
+                          chunk_size: int = 1000,
+                          chunks_per_request: int = 10) -> int:
+        """
+        Delete every row whose key_column is in keys.
+        
+        Keys are split into DELETE ... WHERE key IN (...) statements of chunk_size keys,
+        sent chunks_per_request statements per pipeline. Returns the number of deleted rows.
+        """
+        statements = bulk_delete_statements(table, key_column, keys, chunk_size)
+        return await self._run_pipelined(statements, chunks_per_request)
+    
+    async def bulk_update(self, table: str,
+                          key_column: str,
+                          rows: Iterable[dict[str, Any]],
+                          *,
+                          chunk_size: int = 500,
+                          chunks_per_request: int = 10) -> int:
+        """
+        Update many rows by key, each with its own values.
+        
+        rows are dicts holding key_column plus the columns to set (the same keys in every
+        row). They are sent as UPDATE ... FROM (VALUES ...) statements of chunk_size rows,
+        chunks_per_request statements per pipeline. Returns the number of updated rows.
+        """
+        statements = bulk_update_statements(table, key_column, rows, chunk_size)
+        return await self._run_pipelined(statements, chunks_per_request)
+    
     async def set_foreign_key_checks(self, enable: bool) -> None:
         """Enable or disable foreign key constraint checks for the current connection."""
         state = "ON" if enable else "OFF"
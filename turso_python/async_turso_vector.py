@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import itertools
+import sys
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from typing import Any
+
+import anyio
+
+from .async_connection import AsyncTursoConnection
+from .response_parser import TursoResponseParser
+from .turso_vector import _VECTOR_OUTPUTS, TursoVector
+
+if sys.version_info < (3, 11):
+    from exceptiongroup import BaseExceptionGroup  # installed with anyio on 3.10
+
+
+def _leaf_errors(group: BaseExceptionGroup) -> list[BaseException]:
+    leaves: list[BaseException] = []
+    for exc in group.exceptions:
+        leaves.extend(_leaf_errors(exc) if isinstance(exc, BaseExceptionGroup) else [exc])
+    return leaves
+
+
+async def _achunked(
+    items: Iterable[Any] | AsyncIterable[Any], size: int
+) -> AsyncIterator[list[Any]]:
+    if isinstance(items, AsyncIterable):
+        chunk: list[Any] = []
+        async for item in items:
+            chunk.append(item)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+        return
+    it = iter(items)
+    while chunk := list(itertools.islice(it, size)):
+        yield chunk
+
+
+class AsyncTursoVector(TursoVector):
+    """TursoVector for AsyncTursoConnection.
+
+    Single-statement helpers inherited from TursoVector (create_table, insert_embedding,
+    vector_similarity_search, ...) return the connection's coroutine, so ``await`` them.
+    Multi-statement operations such as batch_similarity_search and bulk_insert_embeddings
+    are overridden here.
+    """
+
+    def __init__(self, connection: AsyncTursoConnection, table_name: str, **kwargs: Any):
+        super().__init__(connection, table_name, **kwargs)  # type: ignore[arg-type]
+
+    async def batch_similarity_search(  # type: ignore[override]
+        self,
+        vector_column: str,
+        query_vectors: Iterable[Any],
+        top_k: int = 5,
+        *,
+        where: str | None = None,
+        where_args: Iterable[Any] = (),
+        candidates: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Async counterpart of TursoVector.batch_similarity_search."""
+        statements = self._batch_search_statements(vector_column, query_vectors, top_k, where, where_args, candidates)
+        if not statements:
+            return []
+        return TursoResponseParser.normalize_results(await self.connection.batch(statements))
+
+    async def get_vector(self, vector_column: str, row_id: int, output: str = 'array'):  # type: ignore[override]
+        """Async counterpart of TursoVector.get_vector."""
+        return (await self.extract_vectors(vector_column, [row_id], output=output)).get(row_id)
+
+    async def extract_vectors(  # type: ignore[override]
+        self, vector_column: str, row_ids: Iterable[int], output: str = 'array'
+    ) -> dict[int, Any]:
+        """Async counterpart of TursoVector.extract_vectors."""
+        row_ids = [int(r) for r in row_ids]
+        if output not in _VECTOR_OUTPUTS:
+            raise ValueError(f"output must be one of {_VECTOR_OUTPUTS}")
+        if not row_ids:
+            return {}
+        response = await self.connection.batch(self._extract_vectors_statements(vector_column, row_ids))
+        return self._decode_extracted(row_ids, response, output)
+
+    def vector_cache(self, vector_column: str, *, page_size: int = 5000):
+        """Returns an AsyncVectorCache, whose refresh() and rerank_search() must be awaited."""
+        from .vector_cache import AsyncVectorCache
+
+        return AsyncVectorCache(self, vector_column, page_size=page_size)
+
+    async def _insert_chunk(self, vector_column: str, columns: tuple[str, ...], chunk: list) -> int:  # type: ignore[override]
+        statements = self._bulk_insert_statements(vector_column, columns, chunk)
+        TursoResponseParser._raise_if_error(await self.connection.batch(statements))
+        return len(chunk)
+
+    async def bulk_insert_embeddings(  # type: ignore[override]
+        self,
+        vector_column: str,
+        items: Iterable[tuple[dict[str, Any], Any]] | AsyncIterable[tuple[dict[str, Any], Any]],
+        *,
+        chunk_size: int = 500,
+        concurrency: int = 4,
+        defer_index: bool = False,
+    ) -> int:
+        """Async counterpart of TursoVector.bulk_insert_embeddings.
+
+        ``items`` may be a regular or an async iterable. Chunks are handed to ``concurrency``
+        worker tasks through a bounded stream, so building the next chunk overlaps with the
+        requests already in flight while memory stays bounded. A deferred index is dropped
+        only once the first chunk is ready and is recreated even if the load fails or is
+        cancelled.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        concurrency = max(1, concurrency)
+        total = 0
+
+        async def worker(receive) -> None:
+            nonlocal total
+            async with receive:
+                async for columns, chunk in receive:
+                    total += await self._insert_chunk(vector_column, columns, chunk)
+
+        send, receive = anyio.create_memory_object_stream(concurrency)
+        columns: tuple[str, ...] | None = None
+        index_sql = None
+        try:
+            async with anyio.create_task_group() as tg:
+                async with receive:
+                    for _ in range(concurrency):
+                        tg.start_soon(worker, receive.clone())
+                async with send:
+                    async for chunk in _achunked(items, chunk_size):
+                        if columns is None:
+                            columns = tuple(chunk[0][0].keys())
+                            if defer_index:
+                                response = await self.connection.batch(self._drop_index_statements())
+                                index_sql = self._dropped_index_sql(response)
+                        self._check_metadata(columns, chunk)
+                        await send.send((columns, chunk))
+        except BaseExceptionGroup as group:
+            # Raise the failing chunk's own error (TursoQueryError, TursoHTTPError, ValueError...)
+            # like the sync version does; concurrent failures stay attached as the cause
+            errors = _leaf_errors(group)
+            raise errors[0] from (group if len(errors) > 1 else None)
+        finally:
+            if index_sql is not None:
+                with anyio.CancelScope(shield=True):
+                    await self.connection.execute_query(index_sql)
+        return total
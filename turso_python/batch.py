@@ -1,5 +1,5 @@
 #Handles batch operations.
-from turso_python.crud import TursoCRUD
+from turso_python.sql_builder import insert_sql
 
 
 class TursoBatch:
@@ -8,24 +8,21 @@ class TursoBatch:
 
     def batch_insert(self, table, data_list):
         """Insert multiple rows into a table.
-        Uses the connection.batch helper so argument typing/serialization is consistent
+        Uses the connection's argument formatting so typing/serialization is consistent
         with single-statement execute_query. This avoids float-as-string issues.
+        The INSERT text comes from the statement cache and is sent once per pipeline
+        (execute_many) when the connection supports it.
         """
         if not data_list:
             return
 
         # Ensure consistent column order across rows
         keys = list(data_list[0].keys())
-        columns = ', '.join(keys)
-        placeholders = ', '.join(['?' for _ in keys])
-
-        queries = [
-            {
-                'sql': f"INSERT INTO {table} ({columns}) VALUES ({placeholders})",
-                'args': [row[k] for k in keys],
-            }
-            for row in data_list
-        ]
+        sql = insert_sql(table, keys)
+        args_list = [[row[k] for k in keys] for row in data_list]
 
+        execute_many = getattr(self.connection, 'execute_many', None)
+        if execute_many is not None:
+            return execute_many(sql, args_list)
         # Delegate to connection.batch which formats args appropriately
-        return self.connection.batch(queries)
\ No newline at end of file
+        return self.connection.batch([{'sql': sql, 'args': args} for args in args_list])
\ No newline at end of file
@@ -0,0 +1,130 @@
+# HTTP body compression for large pipelines.
+# Request bodies are compressed only when a connection opts in and the serialized pipeline is at
+# least `threshold` bytes. gzip and deflate use zlib; zstd needs Python 3.14's compression.zstd
+# or the `zstandard` package (install with `pip install tursopy[zstd]`).
+
+from __future__ import annotations
+
+import zlib
+
+try:
+    from compression import zstd as _zstd  # Python 3.14+
+
+    def _zstd_compress(data: bytes, level: int) -> bytes:
+        return _zstd.compress(data, level)
+
+    def _zstd_decompress(data: bytes) -> bytes:
+        return _zstd.decompress(data)
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    try:
+        import zstandard as _zstandard
+
+        def _zstd_compress(data: bytes, level: int) -> bytes:
+            return _zstandard.ZstdCompressor(level=level).compress(data)
+
+        def _zstd_decompress(data: bytes) -> bytes:
+            # decompressobj also handles frames that do not record their content size
+            return _zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+        ZSTD_AVAILABLE = True
+    except ImportError:  # pragma: no cover - exercised only without the optional dependency
+        ZSTD_AVAILABLE = False
+
+ENCODINGS = ('gzip', 'deflate', 'zstd')
+DEFAULT_COMPRESSION_THRESHOLD = 32 * 1024
+
+# Bodies are compressed on the request path, so favour speed; JSON still shrinks ~5-10x
+_DEFAULT_LEVELS = {'gzip': 1, 'deflate': 1, 'zstd': 3}
+
+# Response encodings every transport can decode (requests and aiohttp do it transparently)
+ACCEPT_ENCODING = 'gzip, deflate'
+
+
+def compress(data: bytes, encoding: str, level: int | None = None) -> bytes:
+    """Compress ``data`` for the given HTTP ``Content-Encoding``."""
+    if level is None:
+        level = _DEFAULT_LEVELS.get(encoding, 1)
+    if encoding == 'gzip':
+        c = zlib.compressobj(level, zlib.DEFLATED, 31)
+        return c.compress(data) + c.flush()
+    if encoding == 'deflate':
+        # HTTP "deflate" is the zlib format, not a raw deflate stream
+        return zlib.compress(data, level)
+    if encoding == 'zstd':
+        if not ZSTD_AVAILABLE:
+            raise ImportError("zstd compression requires the zstandard package; pip install tursopy[zstd]")
+        return _zstd_compress(data, level)
+    raise ValueError(f"Unsupported content encoding: {encoding!r}")
+
+
+def decompress(data: bytes, encoding: str) -> bytes:
+    """Decode a body sent with the given HTTP ``Content-Encoding``."""
+    encoding = encoding.strip().lower()
+    if encoding in ('', 'identity'):
+        return data
+    if encoding in ('gzip', 'x-gzip'):
+        return zlib.decompress(data, 47)  # 32 + 15: gzip or zlib header
+    if encoding == 'deflate':
+        try:
+            return zlib.decompress(data)
+        except zlib.error:
+            # Some servers send raw deflate without the zlib wrapper
+            return zlib.decompress(data, -15)
+    if encoding == 'zstd':
+        if not ZSTD_AVAILABLE:
+            raise ImportError("zstd decoding requires the zstandard package; pip install tursopy[zstd]")
+        return _zstd_decompress(data)
+    raise ValueError(f"Unsupported content encoding: {encoding!r}")
+
+
+def accepts(accept_encoding: str | None, encoding: str) -> bool:
+    """Whether an ``Accept-Encoding`` header value allows ``encoding`` (q=0 excludes it).
+
+    An entry naming ``encoding`` takes precedence over ``*`` wherever either appears.
+    """
+    wildcard = None
+    for part in (accept_encoding or '').split(','):
+        name, _, params = part.strip().partition(';')
+        name = name.strip().lower()
+        if name == encoding:
+            return _q_allows(params)
+        if name == '*' and wildcard is None:
+            wildcard = _q_allows(params)
+    return bool(wildcard)
+
+
+def _q_allows(params: str) -> bool:
+    q = params.strip()
+    if not q.startswith('q='):
+        return True
+    try:
+        return float(q[2:]) > 0
+    except ValueError:
+        return True
+
+
+class RequestCompressor:
+    """Compresses pipeline bodies of at least ``threshold`` bytes with one encoding.
+
+    ``compress`` returns None when the body is below the threshold or would not shrink, in
+    which case it is sent as is.
+    """
+
+    def __init__(self, encoding: str, threshold: int = DEFAULT_COMPRESSION_THRESHOLD, level: int | None = None):
+        if encoding not in ENCODINGS:
+            raise ValueError(f"compression must be one of {', '.join(ENCODINGS)}; got {encoding!r}")
+        if encoding == 'zstd' and not ZSTD_AVAILABLE:
+            raise ImportError("zstd compression requires the zstandard package; pip install tursopy[zstd]")
+        if threshold < 0:
+            raise ValueError("compression_threshold must be non-negative")
+        self.encoding = encoding
+        self.threshold = threshold
+        self.level = level
+
+    def compress(self, body: bytes) -> bytes | None:
+        if len(body) < self.threshold:
+            return None
+        compressed = compress(body, self.encoding, self.level)
+        return compressed if len(compressed) < len(body) else None
@@ -3,15 +3,40 @@
 # This module intentionally does not use python-dotenv. Provide credentials via
 # environment variables or pass them explicitly.
 
+import base64
+import logging
 import os
 import random
+import threading
 import time
+from collections.abc import Callable, Iterable
 from typing import Any
 from urllib.parse import urlparse
 
-import requests
+from .compression import ACCEPT_ENCODING, DEFAULT_COMPRESSION_THRESHOLD, RequestCompressor
+from .deadlines import deadline_at, remaining
+from .encoding import encode_pipeline
+from .exceptions import TursoConnectionError, TursoHTTPError, TursoRateLimitError, TursoTimeoutError
+from .instrumentation import (
+    LoggingListener,
+    RequestEvent,
+    RequestListener,
+    as_listener,
+    emit_finished,
+    emit_started,
+    remove_listener,
+)
+from .response_parser import strip_stored_sql_results
+from .transport import HttpxTransport, RequestsTransport, Transport, TransportResponse
 
-from .exceptions import TursoHTTPError, TursoRateLimitError
+logger = logging.getLogger('turso_python')
+
+# Plain http is only accepted for loopback hosts (e.g. the local stand-in server)
+_LOOPBACK_HOSTS = {'localhost', '127.0.0.1', '::1'}
+
+# Warm-up/keepalive pipelines: an empty stream (connection setup only) or a trivial query
+_OPEN_PIPELINE = {'requests': [{'type': 'close'}]}
+_PING_PIPELINE = {'requests': [{'type': 'execute', 'stmt': {'sql': 'SELECT 1', 'args': []}}, {'type': 'close'}]}
 
 
 def _normalize_url(url: str) -> str:
@@ -23,6 +48,8 @@ def _normalize_url(url: str) -> str:
     parsed = urlparse(url)
     if not parsed.scheme or not parsed.netloc:
         raise ValueError(f"Invalid database URL: {url}")
+    if parsed.scheme == 'http' and parsed.hostname in _LOOPBACK_HOSTS:
+        return url
     if parsed.scheme != 'https':
         raise ValueError("Only https scheme is supported after normalization")
     return url
@@ -38,6 +65,13 @@ class TursoConnection:
         retries: int = 0,
         backoff_base: float = 0.2,
         debug_sql: bool = False,
+        transport: Transport | None = None,
+        listeners: list[RequestListener | Callable[[RequestEvent], Any]] | None = None,
+        compression: str | None = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        accept_compressed: bool = True,
+        http2: bool = False,
+        call_timeout: float | None = None,
     ):
         env_url = os.getenv("TURSO_DATABASE_URL")
         env_token = os.getenv("TURSO_AUTH_TOKEN")
@@ -49,21 +83,44 @@ class TursoConnection:
             raise ValueError(
                 "auth_token not provided and TURSO_AUTH_TOKEN is not set"
             )
+        if http2 and transport is not None:
+            raise ValueError("Pass either http2=True or transport, not both")
 
         self.database_url = _normalize_url(
             database_url or env_url
         )  # type: ignore[arg-type]
         self.auth_token = auth_token or env_token  # type: ignore[assignment]
         self.timeout = timeout
+        # Budget for a whole call including retries and backoff; deadlines.deadline() can shorten it
+        self.call_timeout = call_timeout
         self.retries = max(0, int(retries))
         self.backoff_base = float(backoff_base)
         self.debug_sql = bool(debug_sql)
         self.headers = {
             'Authorization': f'Bearer {self.auth_token}',
             'Content-Type': 'application/json',
+            'Accept-Encoding': ACCEPT_ENCODING if accept_compressed else 'identity',
         }
-        # Use a persistent session for connection reuse and performance
-        self.session = requests.Session()
+        # Opt-in: request bodies of at least compression_threshold bytes are sent compressed
+        self.compression = compression
+        self._compressor = RequestCompressor(compression, compression_threshold) if compression else None
+        # Default to a persistent requests session for connection reuse and performance
+        if transport is None:
+            transport = HttpxTransport(timeout=timeout) if http2 else RequestsTransport()
+        self.transport = transport
+        self.session = getattr(transport, 'session', None)
+        self._listeners: list[RequestListener] = [as_listener(li) for li in listeners or []]
+        if self.debug_sql:
+            self._listeners.append(LoggingListener())
+        self._keepalive_stop: threading.Event | None = None
+        self._keepalive_thread: threading.Thread | None = None
+
+    def add_listener(self, listener: RequestListener | Callable[[RequestEvent], Any]) -> None:
+        """Register a listener notified with a RequestEvent for every pipeline request."""
+        self._listeners.append(as_listener(listener))
+
+    def remove_listener(self, listener: RequestListener | Callable[[RequestEvent], Any]) -> None:
+        remove_listener(self._listeners, listener)
 
     def execute_query(
         self, sql: str, args: list[Any] | tuple | None = None
@@ -78,23 +135,7 @@ class TursoConnection:
                 {'type': 'close'},
             ]
         }
-        attempt = 0
-        while True:
-            try:
-                response = self.session.post(
-                    f'{self.database_url}/v2/pipeline',
-                    json=payload,
-                    headers=self.headers,
-                    timeout=self.timeout,
-                )
-                return self._handle_response(response)
-            except requests.exceptions.RequestException as e:
-                if attempt >= self.retries:
-                    raise TursoHTTPError(-1, f"Request failed: {str(e)}")
-            # backoff with jitter
-            delay = self.backoff_base * (2 ** attempt) + random.uniform(0, self.backoff_base)
-            time.sleep(delay)
-            attempt += 1
+        return self._post(payload, "Request")
 
     def batch(self, queries: list[dict[str, Any]]) -> dict[str, Any]:
         """Execute multiple SQL statements in a single transaction.
@@ -114,36 +155,176 @@ class TursoConnection:
                 }
             )
         reqs.append({'type': 'close'})
+        return self._post({'requests': reqs}, "Batch request")
+
+    def execute_many(self, sql: str, args_list: Iterable[list[Any] | tuple]) -> dict[str, Any]:
+        """Execute one statement once per argument list in a single pipeline.
+
+        The SQL text is sent once (Hrana store_sql) and each execution references it by id.
+        The store/close steps are removed from the returned response, so its results line
+        up with batch(): one per argument list, then the close result.
+        """
+        reqs: list[dict[str, Any]] = [{'type': 'store_sql', 'sql_id': 1, 'sql': sql}]
+        reqs.extend(
+            {'type': 'execute', 'stmt': {'sql_id': 1, 'args': self._format_args(args)}}
+            for args in args_list
+        )
+        reqs.append({'type': 'close_sql', 'sql_id': 1})
+        reqs.append({'type': 'close'})
+        return strip_stored_sql_results(self._post({'requests': reqs}, "Batch request"), len(reqs) - 3)
+
+    def execute_pipeline(self, queries: list[dict[str, Any]]) -> dict[str, Any]:
+        """Execute a series of SQL statements (pre-built request objects)."""
+        payload = {'requests': queries + [{'type': 'close'}]}
+        return self._post(payload, "Pipeline request")
+
+    def warmup(self, n_connections: int = 1, *, run_query: bool = True) -> None:
+        """Open up to ``n_connections`` pooled connections ahead of the first real query.
+
+        Sends ``n_connections`` pipelines concurrently, so DNS, TCP and TLS setup happen now
+        instead of on the first query. Each runs ``SELECT 1`` (``run_query=True``) or is an
+        empty pipeline that only sets up the connection. Warm-up requests are not reported to
+        listeners. The requests transport keeps at most 10 idle connections per host.
+        """
+        if n_connections < 1:
+            raise ValueError("n_connections must be at least 1")
+        payload = _PING_PIPELINE if run_query else _OPEN_PIPELINE
+        if n_connections == 1:
+            self._send(payload, "Warmup request", None)
+            return
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=n_connections) as pool:
+            futures = [pool.submit(self._send, payload, "Warmup request", None) for _ in range(n_connections)]
+            for f in futures:
+                f.result()
+
+    def start_keepalive(
+        self, interval: float = 10.0, n_connections: int = 1, *, run_query: bool = False
+    ) -> None:
+        """Ping the server every ``interval`` seconds from a daemon thread.
+
+        Keeps up to ``n_connections`` idle connections from being closed by proxies and load
+        balancers. Failed pings are logged and retried at the next interval. Stopped by
+        stop_keepalive() or close().
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.stop_keepalive()
+        stop = self._keepalive_stop = threading.Event()
+
+        def run() -> None:
+            while not stop.wait(interval):
+                try:
+                    self.warmup(n_connections, run_query=run_query)
+                except Exception as e:
+                    logger.warning("Turso keepalive ping failed: %s", e)
+
+        self._keepalive_thread = threading.Thread(target=run, name='turso-keepalive', daemon=True)
+        self._keepalive_thread.start()
+
+    def stop_keepalive(self) -> None:
+        if self._keepalive_stop is not None:
+            self._keepalive_stop.set()
+            if self._keepalive_thread is not None and self._keepalive_thread is not threading.current_thread():
+                self._keepalive_thread.join()
+        self._keepalive_stop = None
+        self._keepalive_thread = None
+
+    def _post(self, payload: dict[str, Any], label: str) -> dict[str, Any]:
+        """Send a pipeline payload through the transport, retrying network failures and 429s."""
+        if not self._listeners:
+            return self._send(payload, label, None)
+        event = RequestEvent.from_payload(payload)
+        emit_started(self._listeners, event)
+        try:
+            result = self._send(payload, label, event)
+        except BaseException as e:
+            event.finish(e)
+            emit_finished(self._listeners, event)
+            raise
+        event.record_result(result)
+        event.finish()
+        emit_finished(self._listeners, event)
+        return result
+
+    def _send(self, payload: dict[str, Any], label: str, event: RequestEvent | None) -> dict[str, Any]:
+        t0 = time.perf_counter()
+        raw = encode_pipeline(payload)
+        body, headers = self._compress(raw)
+        if event is not None:
+            event.serialize_s = time.perf_counter() - t0
+            event.record_body(len(raw), len(body), headers.get('Content-Encoding'))
         attempt = 0
+        at = deadline_at(self.call_timeout)
         while True:
+            rate_limited = False
+            retry_after = None
+            timeout = self.timeout
+            if at is not None:
+                left = remaining(at)
+                if left <= 0:
+                    raise TursoTimeoutError(f"{label} exceeded its deadline after {attempt} attempt(s)")
+                # The remaining budget becomes the socket timeout for this attempt
+                timeout = min(timeout, left) if timeout else left
             try:
-                response = self.session.post(
-                    f'{self.database_url}/v2/pipeline',
-                    json={'requests': reqs},
-                    headers=self.headers,
-                    timeout=self.timeout,
-                )
+                t0 = time.perf_counter()
+                try:
+                    response = self.transport.post(
+                        f'{self.database_url}/v2/pipeline',
+                        body,
+                        headers,
+                        timeout,
+                    )
+                finally:
+                    if event is not None:
+                        event.network_s += time.perf_counter() - t0
+                if event is not None:
+                    event.record_response(len(response.content), response.wire_bytes)
+                    event.status = response.status_code
+                if response.status_code == 415 and body is not raw:
+                    # The server does not take compressed bodies: stop compressing and resend
+                    self.compression = self._compressor = None
+                    body, headers = raw, self.headers
+                    if event is not None:
+                        event.record_body(len(raw), len(raw), None)
+                    continue
                 return self._handle_response(response)
-            except requests.exceptions.RequestException as e:
+            except TursoConnectionError as e:
+                if at is not None and remaining(at) <= 0:
+                    raise TursoTimeoutError(f"{label} exceeded its deadline: {e}") from e
+                if attempt >= self.retries:
+                    raise TursoHTTPError(-1, f"{label} failed: {str(e)}")
+            except TursoRateLimitError as e:
                 if attempt >= self.retries:
-                    raise TursoHTTPError(-1, f"Batch request failed: {str(e)}")
+                    raise
+                rate_limited = True
+                retry_after = e.retry_after
+            # backoff with jitter; honour Retry-After when rate limited
             delay = self.backoff_base * (2 ** attempt) + random.uniform(0, self.backoff_base)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+            if at is not None and delay >= remaining(at):
+                # Sleeping would use up the budget; fail now rather than at the deadline
+                raise TursoTimeoutError(f"{label} cannot retry within its deadline (backoff {delay:.3f}s)")
+            if event is not None:
+                event.retries += 1
+                event.backoff_s += delay
+                if rate_limited:
+                    event.rate_limit_wait_s += delay
             time.sleep(delay)
             attempt += 1
 
-    def execute_pipeline(self, queries: list[dict[str, Any]]) -> dict[str, Any]:
-        """Execute a series of SQL statements (pre-built request objects)."""
-        payload = {'requests': queries + [{'type': 'close'}]}
-        response = self.session.post(
-            f'{self.database_url}/v2/pipeline',
-            json=payload,
-            headers=self.headers,
-            timeout=self.timeout,
-        )
-        return self._handle_response(response)
+    def _compress(self, body: bytes) -> tuple[bytes, dict[str, str]]:
+        """Return the body to send and its headers, compressed when the connection opts in."""
+        if self._compressor is not None:
+            compressed = self._compressor.compress(body)
+            if compressed is not None:
+                return compressed, {**self.headers, 'Content-Encoding': self._compressor.encoding}
+        return body, self.headers
 
     @staticmethod
-    def _handle_response(response: requests.Response) -> dict[str, Any]:
+    def _handle_response(response: TransportResponse) -> dict[str, Any]:
         """Process API response and handle errors."""
         if response.status_code == 200:
             return response.json()
@@ -168,25 +349,38 @@ class TursoConnection:
         if not args:
             return []
         formatted: list[dict[str, Any]] = []
+        append = formatted.append
         for a in args:
-            if isinstance(a, str):
-                formatted.append({"type": "text", "value": a})
-            elif isinstance(a, int):
-                formatted.append({"type": "integer", "value": str(a)})
-            elif isinstance(a, float):
-                formatted.append({"type": "float", "value": str(a)})
+            # Exact-type checks first: the common cases skip the isinstance chain
+            t = type(a)
+            if t is str:
+                append({'type': 'text', 'value': a})
+            elif t is int:
+                append({'type': 'integer', 'value': str(a)})
+            elif t is float:
+                append({'type': 'float', 'value': str(a)})
             elif a is None:
-                formatted.append({"type": "null"})
+                append({'type': 'null'})
             elif isinstance(a, bool):
-                formatted.append({"type": "integer", "value": "1" if a else "0"})
+                append({'type': 'integer', 'value': '1' if a else '0'})
+            elif isinstance(a, str):
+                # str.__str__ gives the raw text; str() of a str Enum member is 'Cls.NAME'
+                append({'type': 'text', 'value': str.__str__(a)})
+            elif isinstance(a, int):
+                append({'type': 'integer', 'value': str(int(a))})
+            elif isinstance(a, float):
+                append({'type': 'float', 'value': str(float(a))})
+            elif isinstance(a, bytes | bytearray | memoryview):
+                append({'type': 'blob', 'base64': base64.b64encode(a).decode('ascii')})
             else:
                 raise ValueError(f"Unsupported argument type: {type(a)}")
         return formatted
 
     def close(self) -> None:
-        """Close the HTTP session."""
+        """Stop keepalive pings and close the underlying transport."""
+        self.stop_keepalive()
         try:
-            self.session.close()
+            self.transport.close()
         except Exception:
             pass
 
@@ -195,10 +389,7 @@ class TursoConnection:
         return self
 
     def __exit__(self, exc_type, exc, tb):
-        try:
-            self.session.close()
-        except Exception:
-            pass
+        self.close()
         return False
 
 # # Example usage
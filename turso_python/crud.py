@@ -2,10 +2,23 @@
 # New asynchronous equivalents are provided in async_connection.py and async_crud.py
 # This module intentionally does not use python-dotenv.
 
+import base64
 import json
 import os
 
-import requests
+from turso_python.response_parser import TursoResponseParser
+from turso_python.row_mapping import map_result
+from turso_python.sql_builder import (
+    bulk_delete_statements,
+    bulk_update_statements,
+    delete_sql,
+    insert_sql,
+    pipelined,
+    update_sql,
+    upsert_plan,
+    upsert_sql,
+    upsert_statements,
+)
 
 
 def _normalize_database_url(url: str) -> str:
@@ -42,6 +55,8 @@ class TursoClient:
             "group": group_name
         }
     
+        import requests  # deferred: only these legacy helpers use it directly
+
         response = requests.post(url, headers=headers, data=json.dumps(data))
     
         if response.status_code == 201:
@@ -72,6 +87,8 @@ class TursoClient:
             ]
         }
 
+        import requests
+
         response = requests.post(
             f"{self.database_url}/v2/pipeline", json=payload, headers=self.headers, timeout=self.timeout
         )
@@ -99,6 +116,8 @@ class TursoClient:
             ] + [{'type': 'close'}]
         }
 
+        import requests
+
         response = requests.post(
             f"{self.database_url}/v2/pipeline", json=payload, headers=self.headers, timeout=self.timeout
         )
@@ -126,6 +145,8 @@ class TursoClient:
                 formatted.append({"type": "integer", "value": str(arg)})
             elif isinstance(arg, float):
                 formatted.append({"type": "float", "value": str(arg)})
+            elif isinstance(arg, bytes | bytearray | memoryview):
+                formatted.append({"type": "blob", "base64": base64.b64encode(arg).decode('ascii')})
             else:
                 formatted.append({"type": "text", "value": str(arg)})
         return formatted
@@ -156,9 +177,7 @@ class TursoDataManager(TursoClient):
         :param table_name: Name of the table
         :param data: Dictionary of column-value pairs
         """
-        columns = ', '.join(data.keys())
-        placeholders = ', '.join(['?' for _ in data.values()])
-        sql = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
+        sql = insert_sql(table_name, data)
         return self.execute_query(sql, list(data.values()))
 
     def fetch_all(self, table_name, conditions=None):
@@ -207,34 +226,92 @@ class TursoCRUD:
     def __init__(self, connection):
         self.connection = connection
 
-    def create(self, table, data):
-        """Insert a record into a table."""
-        columns = ', '.join(data.keys())
-        placeholders = ', '.join(['?' for _ in data])
+    def create(self, table, data, returning=None):
+        """Insert a record into a table.
+
+        returning (e.g. '*' or ['id', 'created_at']) appends a RETURNING clause, so the
+        response rows hold the inserted values, defaults included.
+        """
         args = list(data.values())  # Pass plain values
-        sql = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+        sql = insert_sql(table, data, returning)
         return self.connection.execute_query(sql, args)
 
-    def read(self, table, where=None, args=None):
-        """Retrieve records from a table with optional filters."""
+    def read(self, table, where=None, args=None, as_type=None):
+        """Retrieve records from a table with optional filters.
+
+        Returns the raw response, or with as_type (a msgspec Struct or dataclass) a list
+        of instances built by a cached, compiled row decoder.
+        """
         sql = f"SELECT * FROM {table}"
         if where:
             sql += f" WHERE {where}"
-        return self.connection.execute_query(sql, args)
+        response = self.connection.execute_query(sql, args)
+        if as_type is None:
+            return response
+        return map_result(as_type, TursoResponseParser.normalize_response(response))
 
-    def update(self, table, data, where, args):
-        """Update records in a table."""
-        set_clause = ', '.join([f"{key} = ?" for key in data])
+    def update(self, table, data, where, args, returning=None):
+        """Update records in a table (returning as in create)."""
         update_args = list(data.values())  # Use plain values
-        sql = f"UPDATE {table} SET {set_clause} WHERE {where}"
+        sql = update_sql(table, data, where, returning)
         return self.connection.execute_query(sql, update_args + [arg['value'] for arg in args])  # Flatten args
 
 
-    def delete(self, table, where, args):
-        """Delete records from a table."""
-        sql = f"DELETE FROM {table} WHERE {where}"
+    def delete(self, table, where, args, returning=None):
+        """Delete records from a table (returning as in create)."""
+        sql = delete_sql(table, where, returning)
         return self.connection.execute_query(sql, args)
 
+    def upsert(self, table, data, conflict_columns, update_columns=None):
+        """Insert a record, or update the existing one on a conflict (INSERT ... ON CONFLICT DO UPDATE).
+
+        update_columns defaults to every column in data except conflict_columns; pass an
+        empty list to leave existing rows untouched (DO NOTHING).
+        """
+        columns, conflict, update = upsert_plan(data, conflict_columns, update_columns)
+        sql = upsert_sql(table, columns, conflict, update)
+        return self.connection.execute_query(sql, list(data.values()))
+
+    def bulk_upsert(self, table, rows, conflict_columns, update_columns=None, *, chunk_size=500):
+        """Upsert many records with multi-row ON CONFLICT statements, one request per chunk.
+
+        Rows are read lazily, chunk_size at a time (capped by the SQL parameter limit);
+        all rows must have the same keys. Returns the number of affected rows.
+        """
+        affected = 0
+        for sql, args in upsert_statements(table, rows, conflict_columns, update_columns, chunk_size):
+            response = self.connection.execute_query(sql, args)
+            TursoResponseParser._raise_if_error(response)
+            affected += TursoResponseParser.affected_row_count(response)
+        return affected
+
+    def _run_pipelined(self, statements, chunks_per_request):
+        affected = 0
+        for queries in pipelined(statements, chunks_per_request):
+            response = self.connection.batch(queries)
+            TursoResponseParser._raise_if_error(response)
+            affected += TursoResponseParser.affected_row_count(response)
+        return affected
+
+    def bulk_delete(self, table, key_column, keys, *, chunk_size=1000, chunks_per_request=10):
+        """Delete every row whose key_column is in keys.
+
+        Keys are split into DELETE ... WHERE key IN (...) statements of chunk_size keys,
+        sent chunks_per_request statements per pipeline. Returns the number of deleted rows.
+        """
+        statements = bulk_delete_statements(table, key_column, keys, chunk_size)
+        return self._run_pipelined(statements, chunks_per_request)
+
+    def bulk_update(self, table, key_column, rows, *, chunk_size=500, chunks_per_request=10):
+        """Update many rows by key, each with its own values.
+
+        rows are dicts holding key_column plus the columns to set (the same keys in every
+        row). They are sent as UPDATE ... FROM (VALUES ...) statements of chunk_size rows,
+        chunks_per_request statements per pipeline. Returns the number of updated rows.
+        """
+        statements = bulk_update_statements(table, key_column, rows, chunk_size)
+        return self._run_pipelined(statements, chunks_per_request)
+
     @staticmethod
     def _infer_type(value):
         if isinstance(value, int):
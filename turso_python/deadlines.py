@@ -0,0 +1,47 @@
+# Per-call deadlines shared by TursoConnection and AsyncTursoConnection.
+# A deadline bounds a whole call, retries and backoff sleeps included, and each attempt gets the
+# remaining budget as its socket timeout. The deadline lives in a ContextVar, so it also covers
+# requests made by helpers (CRUD, Loader, vectors) and by tasks started inside the block.
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Absolute time.monotonic() value, or None when no deadline is active
+_DEADLINE: ContextVar[float | None] = ContextVar('turso_python_deadline', default=None)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """Bound every Turso request made inside the block to ``seconds`` from now.
+
+    Nested blocks can only shorten the deadline. Requests that run out of time raise
+    TursoTimeoutError instead of retrying or sleeping past it.
+    """
+    at = time.monotonic() + seconds
+    outer = _DEADLINE.get()
+    if outer is not None:
+        at = min(at, outer)
+    token = _DEADLINE.set(at)
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(token)
+
+
+def deadline_at(call_timeout: float | None = None) -> float | None:
+    """Monotonic deadline for a call starting now: the active deadline() block, capped by
+    ``call_timeout`` (a connection's per-call budget). None means unbounded."""
+    at = _DEADLINE.get()
+    if call_timeout is not None:
+        own = time.monotonic() + call_timeout
+        at = own if at is None else min(at, own)
+    return at
+
+
+def remaining(at: float | None) -> float | None:
+    """Seconds left until ``at`` (may be negative), or None without a deadline."""
+    return None if at is None else at - time.monotonic()
@@ -0,0 +1,79 @@
+# Pipeline body serialization with msgspec.
+# Bodies are written into a reused per-thread bytearray. For execute requests the constant part
+# ({"type":"execute","stmt":{"sql":"...","args":) is encoded once per distinct statement and
+# cached, so a call only serializes its argument values. msgspec is imported on first use.
+
+from __future__ import annotations
+
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import msgspec
+
+# Buffers that grew past this are dropped after use instead of being kept per thread
+_MAX_RETAINED_BUFFER = 4 * 1024 * 1024
+
+_STMT_KEYS = ({'sql', 'args'}, {'sql_id', 'args'})
+
+
+@lru_cache(maxsize=512)
+def _execute_prefix(field: str, value: Any) -> bytes:
+    import msgspec
+
+    return b'{"type":"execute","stmt":{"' + field.encode() + b'":' + msgspec.json.encode(value) + b',"args":'
+
+
+class PipelineEncoder:
+    """Serializes Hrana pipeline payloads to JSON bytes.
+
+    Produces the same JSON document as ``json.dumps(payload)`` (modulo whitespace and
+    non-ASCII escaping). Safe to share between threads: each thread has its own encoder
+    and buffer.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+
+    def _state(self) -> tuple[msgspec.json.Encoder, bytearray]:
+        local = self._local
+        try:
+            return local.encoder, local.buffer
+        except AttributeError:
+            import msgspec
+
+            local.encoder = msgspec.json.Encoder()
+            local.buffer = bytearray()
+            return local.encoder, local.buffer
+
+    def encode(self, payload: dict[str, Any]) -> bytes:
+        encoder, buf = self._state()
+        requests = payload.get('requests')
+        if len(payload) != 1 or not isinstance(requests, list):
+            return encoder.encode(payload)
+        buf[:] = b'{"requests":['
+        for i, req in enumerate(requests):
+            if i:
+                buf += b','
+            stmt = req.get('stmt') if req.get('type') == 'execute' and len(req) == 2 else None
+            if isinstance(stmt, dict) and stmt.keys() in _STMT_KEYS:
+                field = 'sql' if 'sql' in stmt else 'sql_id'
+                buf += _execute_prefix(field, stmt[field])
+                encoder.encode_into(stmt['args'], buf, -1)
+                buf += b'}}'
+            else:
+                encoder.encode_into(req, buf, -1)
+        buf += b']}'
+        body = bytes(buf)
+        if len(buf) > _MAX_RETAINED_BUFFER:
+            self._local.buffer = bytearray()
+        return body
+
+
+PIPELINE_ENCODER = PipelineEncoder()
+
+
+def encode_pipeline(payload: dict[str, Any]) -> bytes:
+    """Serialize a pipeline payload with the shared PipelineEncoder."""
+    return PIPELINE_ENCODER.encode(payload)
@@ -14,3 +14,25 @@ class TursoRateLimitError(TursoHTTPError):
         super().__init__(status, message)
         self.retry_after = retry_after
 
+
+
+class TursoQueryError(TursoError):
+    """Raised when the server reports an error for a statement in the pipeline (bad SQL, constraint...)."""
+
+
+class TursoConnectionError(TursoError):
+    """Raised by a transport when the request could not be delivered (DNS, socket, TLS...)."""
+
+
+class TursoTimeoutError(TursoError, TimeoutError):
+    """Raised when a call runs out of its deadline (see deadlines.deadline and call_timeout)."""
+
+
+class TursoLaneFullError(TursoError):
+    """Raised when a request lane is at its concurrency limit and its wait queue is full."""
+
+    def __init__(self, lane: str, in_flight: int, waiting: int):
+        super().__init__(f"Lane {lane!r} is full ({in_flight} in flight, {waiting} waiting)")
+        self.lane = lane
+        self.in_flight = in_flight
+        self.waiting = waiting
@@ -0,0 +1,228 @@
+# Per-request instrumentation for TursoConnection and AsyncTursoConnection.
+# Every pipeline sent to the server produces one RequestEvent. Listeners registered on a
+# connection are notified when the request starts and when it finishes (successfully or not).
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+logger = logging.getLogger("turso_python")
+
+
+class RequestEvent:
+    """Timing and size information for one pipeline request.
+
+    Durations are in seconds except ``server_ms``, which is what the server reported
+    (sum of ``query_duration_ms`` over all statements, or None if not reported).
+
+    ``request_bytes``/``response_bytes`` are the uncompressed JSON sizes and
+    ``request_wire_bytes``/``response_wire_bytes`` what crossed the network; they differ
+    when a body was compressed (``content_encoding`` names the request's encoding).
+    """
+
+    __slots__ = (
+        'statements', 'step_count', 'arg_count', 'started_at', 'total_s', 'serialize_s', 'network_s',
+        'server_ms', 'request_bytes', 'response_bytes', 'request_wire_bytes', 'response_wire_bytes',
+        'content_encoding', 'row_count', 'retries', 'backoff_s', 'rate_limit_wait_s', 'lane',
+        'queue_s', 'status', 'error', 'extra', '_t0',
+    )
+
+    def __init__(self, statements: list[str], step_count: int, arg_count: int = 0):
+        self.statements = statements
+        self.step_count = step_count
+        self.arg_count = arg_count
+        self.started_at = time.time()
+        self.total_s = 0.0
+        self.serialize_s = 0.0
+        self.network_s = 0.0
+        self.server_ms: float | None = None
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.request_wire_bytes = 0
+        self.response_wire_bytes = 0
+        self.content_encoding: str | None = None
+        self.row_count = 0
+        self.retries = 0
+        self.backoff_s = 0.0
+        self.rate_limit_wait_s = 0.0
+        # Set when the connection schedules requests through lanes
+        self.lane: str | None = None
+        self.queue_s = 0.0
+        self.status: int | None = None
+        self.error: BaseException | None = None
+        # Free-form slot for listeners that need to carry state between start and finish
+        self.extra: dict[str, Any] = {}
+        self._t0 = time.perf_counter()
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> RequestEvent:
+        stmts: list[dict[str, Any]] = []
+        stored: dict[Any, str] = {}
+        for req in payload.get('requests', []):
+            rtype = req.get('type')
+            if rtype == 'store_sql':
+                stored[req.get('sql_id')] = req.get('sql') or ''
+            elif rtype == 'execute':
+                stmts.append(req.get('stmt') or {})
+            elif rtype == 'batch':
+                stmts.extend(step.get('stmt') or {} for step in req.get('batch', {}).get('steps', []))
+        statements = [s.get('sql') or stored.get(s.get('sql_id'), '') for s in stmts]
+        arg_count = sum(len(s.get('args') or ()) for s in stmts)
+        return cls(statements, len(stmts), arg_count)
+
+    @property
+    def sql(self) -> str:
+        """The statements of this request joined into one string (for logs and span attributes)."""
+        return '; '.join(self.statements)
+
+    @property
+    def request_compression_ratio(self) -> float | None:
+        """Uncompressed / on-the-wire request size (1.0 when not compressed)."""
+        return self.request_bytes / self.request_wire_bytes if self.request_wire_bytes else None
+
+    @property
+    def response_compression_ratio(self) -> float | None:
+        """Decoded / on-the-wire response size (1.0 when not compressed)."""
+        return self.response_bytes / self.response_wire_bytes if self.response_wire_bytes else None
+
+    def record_body(self, body_bytes: int, wire_bytes: int, content_encoding: str | None) -> None:
+        """Record the request body as sent: its JSON size, its size on the wire and its encoding."""
+        self.request_bytes = body_bytes
+        self.request_wire_bytes = wire_bytes
+        self.content_encoding = content_encoding
+
+    def record_response(self, content_bytes: int, wire_bytes: int | None) -> None:
+        self.response_bytes += content_bytes
+        self.response_wire_bytes += content_bytes if wire_bytes is None else wire_bytes
+
+    def record_result(self, result: dict[str, Any]) -> None:
+        """Fill row count and server-reported time from a decoded pipeline response."""
+        rows = 0
+        server_ms = None
+        for item in result.get('results', []) if isinstance(result, dict) else []:
+            resp = item.get('response') if isinstance(item, dict) else None
+            if not isinstance(resp, dict):
+                continue
+            if resp.get('type') == 'batch':
+                stmt_results = resp.get('result', {}).get('step_results', [])
+            else:
+                stmt_results = [resp.get('result')]
+            for r in stmt_results:
+                if not isinstance(r, dict):
+                    continue
+                rows += len(r.get('rows') or [])
+                ms = r.get('query_duration_ms')
+                if ms is not None:
+                    server_ms = (server_ms or 0.0) + float(ms)
+        self.row_count = rows
+        self.server_ms = server_ms
+
+    def finish(self, error: BaseException | None = None) -> None:
+        self.total_s = time.perf_counter() - self._t0
+        self.error = error
+
+    def as_dict(self) -> dict[str, Any]:
+        """Plain-dict view, convenient for metrics pipelines and structured logs."""
+        return {
+            'statements': self.statements,
+            'step_count': self.step_count,
+            'arg_count': self.arg_count,
+            'started_at': self.started_at,
+            'total_s': self.total_s,
+            'serialize_s': self.serialize_s,
+            'network_s': self.network_s,
+            'server_ms': self.server_ms,
+            'request_bytes': self.request_bytes,
+            'response_bytes': self.response_bytes,
+            'request_wire_bytes': self.request_wire_bytes,
+            'response_wire_bytes': self.response_wire_bytes,
+            'content_encoding': self.content_encoding,
+            'request_compression_ratio': self.request_compression_ratio,
+            'response_compression_ratio': self.response_compression_ratio,
+            'row_count': self.row_count,
+            'retries': self.retries,
+            'backoff_s': self.backoff_s,
+            'rate_limit_wait_s': self.rate_limit_wait_s,
+            'lane': self.lane,
+            'queue_s': self.queue_s,
+            'status': self.status,
+            'error': repr(self.error) if self.error is not None else None,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestEvent(steps={self.step_count}, total_s={self.total_s:.6f}, "
+            f"network_s={self.network_s:.6f}, rows={self.row_count}, retries={self.retries}, "
+            f"status={self.status})"
+        )
+
+
+class RequestListener:
+    """Base class for connection listeners. Override either or both hooks.
+
+    Hooks run inline on the calling thread/task, so keep them cheap. Exceptions raised by a
+    listener are logged and swallowed; they never fail the query.
+    """
+
+    def request_started(self, event: RequestEvent) -> None:
+        pass
+
+    def request_finished(self, event: RequestEvent) -> None:
+        pass
+
+
+class _CallableListener(RequestListener):
+    def __init__(self, fn: Callable[[RequestEvent], Any]):
+        self.fn = fn
+
+    def request_finished(self, event: RequestEvent) -> None:
+        self.fn(event)
+
+
+class LoggingListener(RequestListener):
+    """Logs every finished request at DEBUG level on the ``turso_python`` logger."""
+
+    def request_finished(self, event: RequestEvent) -> None:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "SQL %s | total=%.2fms network=%.2fms server=%s rows=%d retries=%d status=%s",
+                event.sql, event.total_s * 1000, event.network_s * 1000,
+                f"{event.server_ms:.2f}ms" if event.server_ms is not None else "n/a",
+                event.row_count, event.retries, event.status,
+            )
+
+
+def as_listener(listener: RequestListener | Callable[[RequestEvent], Any]) -> RequestListener:
+    """Accept a RequestListener or a plain callable (called when the request finishes)."""
+    if isinstance(listener, RequestListener):
+        return listener
+    if callable(listener):
+        return _CallableListener(listener)
+    raise TypeError(f"Listener must be a RequestListener or callable, got {type(listener)}")
+
+
+def remove_listener(listeners: list[RequestListener], listener: Any) -> None:
+    for i, registered in enumerate(listeners):
+        if registered is listener or (isinstance(registered, _CallableListener) and registered.fn == listener):
+            del listeners[i]
+            return
+    raise ValueError("Listener is not registered")
+
+
+def emit_started(listeners: Iterable[RequestListener], event: RequestEvent) -> None:
+    for listener in listeners:
+        try:
+            listener.request_started(event)
+        except Exception:
+            logger.exception("Turso request listener failed in request_started")
+
+
+def emit_finished(listeners: Iterable[RequestListener], event: RequestEvent) -> None:
+    for listener in listeners:
+        try:
+            listener.request_finished(event)
+        except Exception:
+            logger.exception("Turso request listener failed in request_finished")
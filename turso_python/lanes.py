@@ -0,0 +1,167 @@
+# Priority lanes and backpressure for AsyncTursoConnection.
+# Each lane has its own concurrency budget, so background bulk work cannot take the capacity
+# that interactive queries need. When the connection-wide limit is reached, a freed slot goes
+# to the highest-priority lane with waiting requests. A full lane queues callers up to
+# `max_queue` and rejects the rest with TursoLaneFullError. The lane for a call is chosen
+# with use_lane(), a ContextVar like deadlines.deadline(), so it also reaches CRUD helpers.
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+import anyio
+
+from .exceptions import TursoLaneFullError
+
+_LANE: ContextVar[str | None] = ContextVar('turso_python_lane', default=None)
+
+
+@contextmanager
+def use_lane(name: str) -> Iterator[None]:
+    """Send every request made inside the block through lane ``name``."""
+    token = _LANE.set(name)
+    try:
+        yield
+    finally:
+        _LANE.reset(token)
+
+
+def current_lane() -> str | None:
+    return _LANE.get()
+
+
+class Lane:
+    """A request class with its own concurrency budget.
+
+    Args:
+        name: Lane name used with use_lane().
+        max_concurrency: Requests from this lane that may be in flight at once.
+        max_queue: Callers allowed to wait for a slot; more are rejected. 0 fails fast,
+            None queues without bound.
+        priority: Higher lanes get freed connection-wide slots first.
+    """
+
+    def __init__(self, name: str, max_concurrency: int, *, max_queue: int | None = None, priority: int = 0):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if max_queue is not None and max_queue < 0:
+            raise ValueError("max_queue must be non-negative or None")
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.priority = priority
+        self.in_flight = 0
+        self.rejected = 0
+        self.completed = 0
+        self._waiters: deque[anyio.Event] = deque()
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    def __repr__(self) -> str:
+        return (
+            f"Lane({self.name!r}, max_concurrency={self.max_concurrency}, max_queue={self.max_queue}, "
+            f"priority={self.priority})"
+        )
+
+
+class LaneScheduler:
+    """Admits requests per lane; pass it to ``AsyncTursoConnection(lanes=...)``.
+
+    ``max_concurrency`` optionally caps requests in flight across all lanes. Calls made
+    outside use_lane() go to ``default_lane`` (the first lane unless given). A scheduler
+    belongs to one event loop; it is not thread-safe.
+    """
+
+    def __init__(self, lanes: Iterable[Lane], *, max_concurrency: int | None = None, default_lane: str | None = None):
+        self.lanes: dict[str, Lane] = {}
+        for lane in lanes:
+            if lane.name in self.lanes:
+                raise ValueError(f"Duplicate lane name: {lane.name!r}")
+            self.lanes[lane.name] = lane
+        if not self.lanes:
+            raise ValueError("LaneScheduler needs at least one lane")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.default_lane = default_lane if default_lane is not None else next(iter(self.lanes))
+        if self.default_lane not in self.lanes:
+            raise ValueError(f"Unknown default lane: {self.default_lane!r}")
+        self.in_flight = 0
+        # Dispatch order for freed slots: highest priority first
+        self._by_priority = sorted(self.lanes.values(), key=lambda lane: -lane.priority)
+
+    def lane(self, name: str | None = None) -> Lane:
+        try:
+            return self.lanes[name if name is not None else self.default_lane]
+        except KeyError:
+            raise ValueError(f"Unknown lane: {name!r}") from None
+
+    def _can_run(self, lane: Lane) -> bool:
+        if lane.in_flight >= lane.max_concurrency:
+            return False
+        return self.max_concurrency is None or self.in_flight < self.max_concurrency
+
+    def _take(self, lane: Lane) -> None:
+        lane.in_flight += 1
+        self.in_flight += 1
+
+    def _release(self, lane: Lane) -> None:
+        lane.in_flight -= 1
+        self.in_flight -= 1
+        # Hand freed capacity to waiters, highest-priority lane first
+        for candidate in self._by_priority:
+            while candidate._waiters and self._can_run(candidate):
+                self._take(candidate)
+                candidate._waiters.popleft().set()
+
+    @asynccontextmanager
+    async def slot(self, name: str | None = None) -> AsyncIterator[float]:
+        """Hold one slot of lane ``name`` for the duration of the block; yields the queue wait."""
+        lane = self.lane(name)
+        waited = 0.0
+        if not lane._waiters and self._can_run(lane):
+            self._take(lane)
+        else:
+            if lane.max_queue is not None and lane.waiting >= lane.max_queue:
+                lane.rejected += 1
+                raise TursoLaneFullError(lane.name, lane.in_flight, lane.waiting)
+            waiter = anyio.Event()
+            lane._waiters.append(waiter)
+            t0 = time.perf_counter()
+            try:
+                await waiter.wait()
+            except BaseException:
+                if waiter.is_set():
+                    # Granted just as we were cancelled: pass the slot on
+                    self._release(lane)
+                else:
+                    lane._waiters.remove(waiter)
+                raise
+            waited = time.perf_counter() - t0
+        try:
+            yield waited
+        finally:
+            lane.completed += 1
+            self._release(lane)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Per-lane counters: in_flight, waiting, completed, rejected and the configured limits."""
+        return {
+            lane.name: {
+                'in_flight': lane.in_flight,
+                'waiting': lane.waiting,
+                'completed': lane.completed,
+                'rejected': lane.rejected,
+                'max_concurrency': lane.max_concurrency,
+                'max_queue': lane.max_queue,
+                'priority': lane.priority,
+            }
+            for lane in self.lanes.values()
+        }
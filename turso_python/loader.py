@@ -0,0 +1,143 @@
+# DataLoader-style batching of primary-key lookups for async code (e.g. GraphQL resolvers).
+# load(key) calls made by tasks that run in the same scheduler pass are collected and fetched
+# with one `WHERE key IN (...)` query; results are memoized for the Loader's lifetime, so create
+# one Loader per request.
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any
+
+import anyio
+
+from .async_connection import AsyncTursoConnection
+from .response_parser import TursoResponseParser
+from .row_mapping import row_decoder
+from .sql_builder import MAX_SQL_PARAMETERS, select_sql
+
+
+@lru_cache(maxsize=128)
+def _in_placeholders(n: int) -> str:
+    return ", ".join(["?"] * n)
+
+
+def _norm_key(key: Any) -> Any:
+    # Integer cells come back as strings on the wire
+    if isinstance(key, int) and not isinstance(key, bool):
+        return str(key)
+    return key
+
+
+class _Batch:
+    __slots__ = ("keys", "done", "results", "error")
+
+    def __init__(self) -> None:
+        self.keys: dict[Any, None] = {}
+        self.done = anyio.Event()
+        self.results: dict[Any, Any] = {}
+        self.error: BaseException | None = None
+
+
+class Loader:
+    """Batches ``load(key)`` calls into chunked ``IN`` queries.
+
+    The first ``load`` of a batch yields to the scheduler once, so every other task that is
+    ready to run can add its key; then one pipeline with one ``SELECT ... WHERE key IN (...)``
+    per ``max_batch_size`` keys is sent and each caller receives its row. Rows are dicts
+    keyed by column name, or instances of ``as_type`` (a msgspec Struct or dataclass).
+    Missing keys load as None. With ``cache=True`` results, including misses, are memoized.
+    """
+
+    def __init__(
+        self,
+        connection: AsyncTursoConnection,
+        table: str,
+        key_column: str,
+        *,
+        columns: str = "*",
+        as_type: type | None = None,
+        max_batch_size: int = 1000,
+        cache: bool = True,
+    ):
+        if not 1 <= max_batch_size <= MAX_SQL_PARAMETERS:
+            raise ValueError(f"max_batch_size must be between 1 and {MAX_SQL_PARAMETERS}")
+        self.connection = connection
+        self.table = table
+        self.key_column = key_column
+        self.columns = columns
+        self.as_type = as_type
+        self.max_batch_size = max_batch_size
+        self.cache = cache
+        self._memo: dict[Any, Any] = {}
+        self._batch: _Batch | None = None
+
+    async def load(self, key: Any) -> Any:
+        """Return the row for ``key`` (None if there is none)."""
+        if self.cache and key in self._memo:
+            return self._memo[key]
+        batch = self._batch
+        if batch is None:
+            batch = self._batch = _Batch()
+            batch.keys[key] = None
+            # Shielded so a cancelled leader still fetches for the tasks waiting on it
+            with anyio.CancelScope(shield=True):
+                await anyio.sleep(0)
+                self._batch = None
+                await self._dispatch(batch)
+        else:
+            batch.keys[key] = None
+            await batch.done.wait()
+        if batch.error is not None:
+            raise batch.error
+        return batch.results.get(_norm_key(key))
+
+    async def load_many(self, keys: Iterable[Any]) -> list[Any]:
+        """Load several keys in one batch; results are in the order of ``keys``."""
+        keys = list(keys)
+        results: list[Any] = [None] * len(keys)
+
+        async def one(i: int, key: Any) -> None:
+            results[i] = await self.load(key)
+
+        async with anyio.create_task_group() as tg:
+            for i, key in enumerate(keys):
+                tg.start_soon(one, i, key)
+        return results
+
+    def prime(self, key: Any, value: Any) -> None:
+        """Seed the memo, e.g. with a row fetched by another query."""
+        self._memo[key] = value
+
+    def clear(self, key: Any | None = None) -> None:
+        """Forget one memoized key, or all of them."""
+        if key is None:
+            self._memo.clear()
+        else:
+            self._memo.pop(key, None)
+
+    async def _dispatch(self, batch: _Batch) -> None:
+        keys = list(batch.keys)
+        try:
+            statements = []
+            for start in range(0, len(keys), self.max_batch_size):
+                chunk = keys[start:start + self.max_batch_size]
+                where = f"{self.key_column} IN ({_in_placeholders(len(chunk))})"
+                sql = select_sql(self.table, f"{self.key_column}, {self.columns}", where)
+                statements.append({"sql": sql, "args": chunk})
+            response = await self.connection.batch(statements)
+            for result in TursoResponseParser.normalize_results(response):
+                columns = tuple(result["columns"][1:])
+                decode = row_decoder(self.as_type, columns) if self.as_type is not None else None
+                for row in result["rows"]:
+                    if row[0] in batch.results:
+                        continue  # first row wins for non-unique keys
+                    values = row[1:]
+                    batch.results[row[0]] = decode(values) if decode else dict(zip(columns, values))
+            if self.cache:
+                for key in keys:
+                    self._memo[key] = batch.results.get(_norm_key(key))
+        except Exception as e:
+            batch.error = e
+        finally:
+            batch.done.set()
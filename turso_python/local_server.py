@@ -0,0 +1,531 @@
+# Local stand-in for the Turso/libsql Hrana-over-HTTP `/v2/pipeline` endpoint, backed by sqlite3.
+# Useful for tests, benchmarks and load tests that must not touch the network or need credentials.
+#
+# In-process (no sockets at all):
+#     server = HranaSQLiteServer()
+#     conn = TursoConnection("http://localhost", "local", transport=LocalTransport(server))
+#
+# Over localhost HTTP (exercises the real requests/aiohttp transports):
+#     with LocalHranaHTTPServer() as srv:
+#         conn = TursoConnection(srv.url, "local")
+#
+# The scalar libSQL vector functions (vector32/vector/vector64, vector_extract,
+# vector_distance_cos/_l2 and libsql_vector_idx for index definitions) are emulated in Python.
+# vector_top_k('idx', v, k) is rewritten into an exact ordered scan of the indexed column, so
+# results are exact, not approximate.
+#
+# Streams are not kept open between pipelines (batons are always null), so every pipeline
+# behaves like a fresh stream: stored SQL is forgotten and an open transaction is rolled back
+# when the pipeline ends.
+
+from __future__ import annotations
+
+import base64
+import json
+import math
+import re
+import sqlite3
+import struct
+import threading
+import time
+from collections.abc import Mapping
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from .compression import accepts, compress, decompress
+from .exceptions import TursoConnectionError
+from .transport import AsyncTransport, Transport, TransportResponse
+
+PIPELINE_PATH = '/v2/pipeline'
+
+
+class _StepError(Exception):
+    def __init__(self, message: str, code: str = 'SQLITE_ERROR'):
+        super().__init__(message)
+        self.message = message
+        self.code = code
+
+    def to_dict(self) -> dict[str, Any]:
+        return {'message': self.message, 'code': self.code}
+
+
+def _decode_value(value: dict[str, Any]) -> Any:
+    t = value.get('type')
+    if t == 'null':
+        return None
+    if t == 'integer':
+        return int(value['value'])
+    if t == 'float':
+        return float(value['value'])
+    if t == 'text':
+        return value['value']
+    if t == 'blob':
+        data = value.get('base64', '')
+        return base64.b64decode(data + '=' * (-len(data) % 4))
+    raise _StepError(f"Unsupported value type: {t!r}", 'ARGS_INVALID')
+
+
+def _encode_value(value: Any) -> dict[str, Any]:
+    if value is None:
+        return {'type': 'null'}
+    if isinstance(value, int):
+        return {'type': 'integer', 'value': str(value)}
+    if isinstance(value, float):
+        return {'type': 'float', 'value': value}
+    if isinstance(value, bytes):
+        return {'type': 'blob', 'base64': base64.b64encode(value).decode('ascii').rstrip('=')}
+    return {'type': 'text', 'value': str(value)}
+
+
+def _header(headers: Mapping[str, str], name: str) -> str | None:
+    value = headers.get(name)
+    if value is not None:
+        return value
+    lname = name.lower()
+    for k, v in headers.items():
+        if k.lower() == lname:
+            return v
+    return None
+
+
+# libSQL stores F32 vectors as bare little-endian floats; other types append a type byte.
+# Only F64 (type 2) is emulated besides F32.
+_F64_TYPE = 2
+
+
+def _vector_values(value: Any) -> tuple[float, ...]:
+    if isinstance(value, bytes):
+        if len(value) % 8 == 1 and value[-1] == _F64_TYPE:
+            return struct.unpack(f'<{len(value) // 8}d', value[:-1])
+        if len(value) % 4:
+            raise ValueError("vector blob length must be a multiple of 4")
+        return struct.unpack(f'<{len(value) // 4}f', value)
+    return tuple(json.loads(value))
+
+
+def _to_f32_blob(value: Any) -> bytes | None:
+    if value is None:
+        return None
+    if isinstance(value, bytes) and len(value) % 4 == 0:
+        return value
+    floats = _vector_values(value)
+    return struct.pack(f'<{len(floats)}f', *floats)
+
+
+def _to_f64_blob(value: Any) -> bytes | None:
+    if value is None:
+        return None
+    floats = _vector_values(value)
+    return struct.pack(f'<{len(floats)}d', *floats) + bytes([_F64_TYPE])
+
+
+def _from_f32_blob(blob: bytes) -> tuple[float, ...]:
+    return struct.unpack(f'<{len(blob) // 4}f', blob)
+
+
+def _vector_extract(blob: bytes | None) -> str | None:
+    if blob is None:
+        return None
+    return '[' + ','.join(f'{v:.9g}' for v in _vector_values(blob)) + ']'
+
+
+def _vector_distance_cos(a: Any, b: Any) -> float | None:
+    va, vb = _to_f32_blob(a), _to_f32_blob(b)
+    if va is None or vb is None:
+        return None
+    xa, xb = _from_f32_blob(va), _from_f32_blob(vb)
+    if len(xa) != len(xb):
+        raise ValueError("vectors must have the same dimensions")
+    dot = sum(x * y for x, y in zip(xa, xb))
+    norm = math.sqrt(sum(x * x for x in xa)) * math.sqrt(sum(y * y for y in xb))
+    return 1.0 - dot / norm if norm else 1.0
+
+
+def _vector_distance_l2(a: Any, b: Any) -> float | None:
+    va, vb = _to_f32_blob(a), _to_f32_blob(b)
+    if va is None or vb is None:
+        return None
+    xa, xb = _from_f32_blob(va), _from_f32_blob(vb)
+    if len(xa) != len(xb):
+        raise ValueError("vectors must have the same dimensions")
+    return math.sqrt(sum((x - y) ** 2 for x, y in zip(xa, xb)))
+
+
+_TOP_K_RE = re.compile(r"\bvector_top_k\s*\(", re.I)
+_VECTOR_IDX_RE = re.compile(r"libsql_vector_idx\s*\(\s*([\w\"]+)(.*?)\)\s*\)", re.I | re.S)
+_METRIC_RE = re.compile(r"metric\s*=\s*(\w+)", re.I)
+
+
+def _split_call_args(sql: str, start: int) -> tuple[list[str], int]:
+    """Split the top-level arguments of a call whose '(' ends right before ``start``."""
+    args: list[str] = []
+    depth, quote, arg_start, i = 1, None, start, start
+    while i < len(sql):
+        c = sql[i]
+        if quote:
+            if c == quote:
+                quote = None
+        elif c in "'\"":
+            quote = c
+        elif c == '(':
+            depth += 1
+        elif c == ')':
+            depth -= 1
+            if depth == 0:
+                args.append(sql[arg_start:i])
+                return args, i + 1
+        elif c == ',' and depth == 1:
+            args.append(sql[arg_start:i])
+            arg_start = i + 1
+        i += 1
+    raise _StepError("Unbalanced parentheses in vector_top_k call", 'SQL_PARSE_ERROR')
+
+
+def _register_vector_functions(conn: sqlite3.Connection) -> None:
+    conn.create_function('vector32', 1, _to_f32_blob, deterministic=True)
+    conn.create_function('vector', 1, _to_f32_blob, deterministic=True)
+    conn.create_function('vector64', 1, _to_f64_blob, deterministic=True)
+    conn.create_function('vector_extract', 1, _vector_extract, deterministic=True)
+    conn.create_function('vector_distance_cos', 2, _vector_distance_cos, deterministic=True)
+    conn.create_function('vector_distance_l2', 2, _vector_distance_l2, deterministic=True)
+    # Index definitions only need the expression to be valid; options are ignored
+    conn.create_function('libsql_vector_idx', -1, lambda v, *opts: v, deterministic=True)
+
+
+class HranaSQLiteServer:
+    """Protocol-level implementation of Hrana `/v2/pipeline` on top of a sqlite3 database.
+
+    Supported request types: execute, batch, sequence, store_sql, close_sql,
+    get_autocommit and close. All pipelines are serialized on a single sqlite3
+    connection, which keeps results deterministic.
+
+    Args:
+        database: sqlite3 database path, ``:memory:`` by default.
+        auth_token: When set, requests must carry ``Authorization: Bearer <token>``.
+        latency: Simulated per-pipeline network latency in seconds, applied by the transports.
+        compressed_requests: Accept gzip/deflate/zstd request bodies (``Content-Encoding``);
+            when False such requests get 415 Unsupported Media Type, like servers without
+            request decompression.
+        compress_responses_above: Gzip responses of at least this many bytes when the
+            request's ``Accept-Encoding`` allows it. None (the default) never compresses.
+    """
+
+    def __init__(
+        self,
+        database: str = ':memory:',
+        *,
+        auth_token: str | None = None,
+        latency: float = 0.0,
+        compressed_requests: bool = True,
+        compress_responses_above: int | None = None,
+    ):
+        self.auth_token = auth_token
+        self.latency = float(latency)
+        self.compressed_requests = compressed_requests
+        self.compress_responses_above = compress_responses_above
+        self.pipeline_count = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(database, check_same_thread=False, isolation_level=None)
+        _register_vector_functions(self._conn)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # HTTP-level entry point shared by the in-process transports and the HTTP server
+    def handle(self, body: bytes, headers: Mapping[str, str]) -> tuple[int, dict[str, str], bytes]:
+        """Handle one POST to /v2/pipeline and return (status, headers, body)."""
+        if self.auth_token is not None:
+            if _header(headers, 'Authorization') != f'Bearer {self.auth_token}':
+                return self._json_reply(401, {'error': 'Unauthorized'})
+        encoding = _header(headers, 'Content-Encoding')
+        if encoding and encoding != 'identity':
+            if not self.compressed_requests:
+                return self._json_reply(415, {'error': f'Unsupported Content-Encoding: {encoding}'})
+            try:
+                body = decompress(body, encoding)
+            except Exception:
+                return self._json_reply(400, {'error': f'Invalid {encoding} body'})
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return self._json_reply(400, {'error': 'Invalid JSON body'})
+        if not isinstance(payload, dict) or not isinstance(payload.get('requests'), list):
+            return self._json_reply(400, {'error': "Body must be an object with a 'requests' list"})
+        status, resp_headers, content = self._json_reply(200, self.execute_pipeline(payload))
+        threshold = self.compress_responses_above
+        if threshold is not None and len(content) >= threshold:
+            if accepts(_header(headers, 'Accept-Encoding'), 'gzip'):
+                content = compress(content, 'gzip')
+                resp_headers['Content-Encoding'] = 'gzip'
+        return status, resp_headers, content
+
+    @staticmethod
+    def _json_reply(status: int, data: dict[str, Any]) -> tuple[int, dict[str, str], bytes]:
+        return status, {'Content-Type': 'application/json'}, json.dumps(data).encode('utf-8')
+
+    def execute_pipeline(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Execute a decoded pipeline payload and return the decoded response."""
+        results: list[dict[str, Any]] = []
+        with self._lock:
+            self.pipeline_count += 1
+            stored_sql: dict[int, str] = {}
+            try:
+                for req in payload.get('requests', []):
+                    try:
+                        response = self._execute_request(req, stored_sql)
+                        results.append({'type': 'ok', 'response': response})
+                    except _StepError as e:
+                        results.append({'type': 'error', 'error': e.to_dict()})
+            finally:
+                # Without batons the stream ends with the pipeline
+                if self._conn.in_transaction:
+                    self._conn.rollback()
+        return {'baton': None, 'base_url': None, 'results': results}
+
+    def _execute_request(self, req: dict[str, Any], stored_sql: dict[int, str]) -> dict[str, Any]:
+        rtype = req.get('type')
+        if rtype == 'execute':
+            return {'type': 'execute', 'result': self._execute_stmt(req.get('stmt') or {}, stored_sql)}
+        if rtype == 'batch':
+            return {'type': 'batch', 'result': self._execute_batch(req.get('batch') or {}, stored_sql)}
+        if rtype == 'sequence':
+            sql = self._resolve_sql(req, stored_sql)
+            try:
+                self._conn.executescript(sql)
+            except sqlite3.Error as e:
+                raise self._step_error(e)
+            return {'type': 'sequence'}
+        if rtype == 'store_sql':
+            stored_sql[int(req['sql_id'])] = req['sql']
+            return {'type': 'store_sql'}
+        if rtype == 'close_sql':
+            stored_sql.pop(int(req['sql_id']), None)
+            return {'type': 'close_sql'}
+        if rtype == 'get_autocommit':
+            return {'type': 'get_autocommit', 'is_autocommit': not self._conn.in_transaction}
+        if rtype == 'close':
+            return {'type': 'close'}
+        raise _StepError(f"Unsupported request type: {rtype!r}", 'PROTOCOL_ERROR')
+
+    @staticmethod
+    def _resolve_sql(obj: dict[str, Any], stored_sql: dict[int, str]) -> str:
+        if obj.get('sql') is not None:
+            return obj['sql']
+        sql_id = obj.get('sql_id')
+        if sql_id is None or int(sql_id) not in stored_sql:
+            raise _StepError(f"SQL text not found for sql_id {sql_id!r}", 'SQL_NOT_FOUND')
+        return stored_sql[int(sql_id)]
+
+    @staticmethod
+    def _step_error(e: sqlite3.Error) -> _StepError:
+        return _StepError(str(e), getattr(e, 'sqlite_errorname', None) or 'SQLITE_ERROR')
+
+    def _vector_index(self, name: str) -> tuple[str, str, str]:
+        row = self._conn.execute(
+            "SELECT tbl_name, sql FROM sqlite_master WHERE type = 'index' AND name = ?", (name,)
+        ).fetchone()
+        match = _VECTOR_IDX_RE.search(row[1] or '') if row else None
+        if match is None:
+            raise _StepError(f"vector index {name!r} not found", 'SQLITE_ERROR')
+        metric = _METRIC_RE.search(match.group(2))
+        return row[0], match.group(1), (metric.group(1).lower() if metric else 'cosine')
+
+    def _rewrite_vector_top_k(self, sql: str) -> str:
+        out: list[str] = []
+        pos = 0
+        for m in _TOP_K_RE.finditer(sql):
+            if m.start() < pos:
+                continue
+            args, end = _split_call_args(sql, m.end())
+            if len(args) != 3:
+                raise _StepError("vector_top_k expects 3 arguments", 'SQLITE_ERROR')
+            table, column, metric = self._vector_index(args[0].strip().strip("'\""))
+            distance = 'vector_distance_l2' if metric == 'l2' else 'vector_distance_cos'
+            out.append(sql[pos:m.start()])
+            out.append(
+                f"(SELECT id FROM (SELECT rowid AS id, {distance}({column}, {args[1]}) AS _d "
+                f"FROM {table} WHERE {column} IS NOT NULL ORDER BY _d LIMIT {args[2]}))"
+            )
+            pos = end
+        out.append(sql[pos:])
+        return ''.join(out)
+
+    def _execute_stmt(self, stmt: dict[str, Any], stored_sql: dict[int, str]) -> dict[str, Any]:
+        sql = self._resolve_sql(stmt, stored_sql)
+        if 'vector_top_k' in sql.lower():
+            sql = self._rewrite_vector_top_k(sql)
+        params: Any = [_decode_value(a) for a in stmt.get('args') or []]
+        named = stmt.get('named_args') or []
+        if named:
+            if params:
+                raise _StepError("Mixing positional and named arguments is not supported", 'ARGS_INVALID')
+            params = {a['name'].lstrip(':@$'): _decode_value(a['value']) for a in named}
+        started = time.perf_counter()
+        changes_before = self._conn.total_changes
+        try:
+            cursor = self._conn.execute(sql, params)
+            raw_rows = cursor.fetchall() if stmt.get('want_rows', True) else []
+        except sqlite3.Error as e:
+            raise self._step_error(e)
+        duration_ms = (time.perf_counter() - started) * 1000.0
+        cols = [{'name': d[0], 'decltype': None} for d in cursor.description or []]
+        rows = [[_encode_value(v) for v in row] for row in raw_rows]
+        written = self._conn.total_changes - changes_before
+        last_rowid = cursor.lastrowid
+        return {
+            'cols': cols,
+            'rows': rows,
+            # total_changes also covers INSERT/UPDATE/DELETE ... RETURNING; reads leave it unchanged
+            'affected_row_count': written,
+            'last_insert_rowid': str(last_rowid) if last_rowid else None,
+            'replication_index': None,
+            'rows_read': len(raw_rows),
+            'rows_written': written,
+            'query_duration_ms': duration_ms,
+        }
+
+    def _execute_batch(self, batch: dict[str, Any], stored_sql: dict[int, str]) -> dict[str, Any]:
+        step_results: list[dict[str, Any] | None] = []
+        step_errors: list[dict[str, Any] | None] = []
+        for step in batch.get('steps', []):
+            cond = step.get('condition')
+            if cond is not None and not self._eval_condition(cond, step_results, step_errors):
+                step_results.append(None)
+                step_errors.append(None)
+                continue
+            try:
+                step_results.append(self._execute_stmt(step.get('stmt') or {}, stored_sql))
+                step_errors.append(None)
+            except _StepError as e:
+                step_results.append(None)
+                step_errors.append(e.to_dict())
+        return {'step_results': step_results, 'step_errors': step_errors}
+
+    def _eval_condition(self, cond: dict[str, Any], results: list, errors: list) -> bool:
+        ctype = cond.get('type')
+        if ctype == 'ok':
+            step = int(cond['step'])
+            return step < len(results) and results[step] is not None
+        if ctype == 'error':
+            step = int(cond['step'])
+            return step < len(errors) and errors[step] is not None
+        if ctype == 'not':
+            return not self._eval_condition(cond['cond'], results, errors)
+        if ctype == 'and':
+            return all(self._eval_condition(c, results, errors) for c in cond.get('conds', []))
+        if ctype == 'or':
+            return any(self._eval_condition(c, results, errors) for c in cond.get('conds', []))
+        if ctype == 'is_autocommit':
+            return not self._conn.in_transaction
+        raise _StepError(f"Unsupported batch condition: {ctype!r}", 'PROTOCOL_ERROR')
+
+
+def _local_response(status: int, headers: dict[str, str], content: bytes) -> TransportResponse:
+    # Decode like an HTTP client would, keeping the compressed size for metrics
+    encoding = headers.get('Content-Encoding')
+    if not encoding:
+        return TransportResponse(status, headers, content)
+    return TransportResponse(status, headers, decompress(content, encoding), len(content))
+
+
+class LocalTransport(Transport):
+    """Sync transport that hands requests straight to a HranaSQLiteServer, without sockets."""
+
+    def __init__(self, server: HranaSQLiteServer | None = None):
+        self.server = server if server is not None else HranaSQLiteServer()
+
+    def post(self, url, body, headers, timeout=None):
+        if not url.endswith(PIPELINE_PATH):
+            raise TursoConnectionError(f"Local server only serves {PIPELINE_PATH}, got {url}")
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        return _local_response(*self.server.handle(body, headers))
+
+
+class AsyncLocalTransport(AsyncTransport):
+    """Async counterpart of LocalTransport; simulated latency uses ``anyio.sleep``."""
+
+    def __init__(self, server: HranaSQLiteServer | None = None):
+        self.server = server if server is not None else HranaSQLiteServer()
+
+    async def post(self, url, body, headers, timeout=None):
+        if not url.endswith(PIPELINE_PATH):
+            raise TursoConnectionError(f"Local server only serves {PIPELINE_PATH}, got {url}")
+        if self.server.latency:
+            import anyio
+
+            await anyio.sleep(self.server.latency)
+        return _local_response(*self.server.handle(body, headers))
+
+
+class _PipelineHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately; without this Nagle adds ~40ms per response
+    disable_nagle_algorithm = True
+    server: _HTTPServer
+
+    def do_POST(self):
+        if self.path.rstrip('/') != PIPELINE_PATH:
+            self._reply(404, {'Content-Type': 'application/json'}, b'{"error":"Not found"}')
+            return
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length)
+        hrana = self.server.hrana
+        if hrana.latency:
+            time.sleep(hrana.latency)
+        self._reply(*hrana.handle(body, self.headers))
+
+    def _reply(self, status: int, headers: dict[str, str], content: bytes) -> None:
+        self.send_response(status)
+        for k, v in headers.items():
+            self.send_header(k, v)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, address, hrana: HranaSQLiteServer):
+        super().__init__(address, _PipelineHandler)
+        self.hrana = hrana
+
+
+class LocalHranaHTTPServer:
+    """Serve a HranaSQLiteServer over plain HTTP on localhost from a background thread."""
+
+    def __init__(self, server: HranaSQLiteServer | None = None, *, host: str = '127.0.0.1', port: int = 0):
+        self.hrana = server if server is not None else HranaSQLiteServer()
+        self._httpd = _HTTPServer((host, port), self.hrana)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> LocalHranaHTTPServer:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> LocalHranaHTTPServer:
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
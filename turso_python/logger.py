@@ -2,16 +2,42 @@
 
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Handlers and levels are left to the application; importing the package must not configure
+# the root logger.
+logger = logging.getLogger("turso_python")
+slow_query_logger = logging.getLogger("turso_python.slow_query")
+
+
+def redact_args(args) -> str:
+    """Describe query arguments (a sequence or a count) without revealing their values."""
+    count = args if isinstance(args, int) else len(args or ())
+    if not count:
+        return "[]"
+    return f"[{count} args redacted]"
+
 
 class TursoLogger:
     @staticmethod
     def log_query(sql, args=None):
-        logging.info(f"Executing SQL: {sql}")
-        if args:
-            logging.info(f"With args: {args}")
+        # Per-query logging is DEBUG-only and never includes argument values;
+        # use QueryStats for slow-query logging in production.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Executing SQL: %s", sql)
+            if args:
+                logger.debug("With args: %s", redact_args(args))
+
+    @staticmethod
+    def log_slow_query(sql, duration_s, *, rows=None, threshold_s=None, args=0):
+        """Log a statement that exceeded the slow-query threshold at WARNING level."""
+        slow_query_logger.warning(
+            "Slow query (%.1f ms > %.1f ms, rows=%s, args=%s): %s",
+            duration_s * 1000,
+            (threshold_s or 0.0) * 1000,
+            rows if rows is not None else "n/a",
+            redact_args(args),
+            sql,
+        )
 
     @staticmethod
     def log_response(response):
-        logging.info(f"Response: {response}")
+        logger.debug("Response: %s", response)
@@ -0,0 +1,123 @@
+# Optional OpenTelemetry integration built on the connection listener hooks.
+# Requires the `opentelemetry-api` package (install with `pip install tursopy[otel]`); when it
+# is missing, instrument() does nothing and the connection keeps its listener-free fast path.
+
+from __future__ import annotations
+
+from typing import Any
+from urllib.parse import urlparse
+
+from .instrumentation import RequestEvent, RequestListener
+
+try:
+    from opentelemetry import metrics as _otel_metrics
+    from opentelemetry import trace as _otel_trace
+
+    OTEL_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    _otel_metrics = None  # type: ignore[assignment]
+    _otel_trace = None  # type: ignore[assignment]
+    OTEL_AVAILABLE = False
+
+_INSTRUMENTATION_NAME = "turso_python"
+_SPAN_KEY = "otel_span"
+
+
+class OpenTelemetryListener(RequestListener):
+    """Emits one CLIENT span per pipeline plus latency and payload-size histograms.
+
+    Span attributes follow the OpenTelemetry database conventions where they apply
+    (``db.system``, ``db.statement``, ``server.address``); Turso-specific values use the
+    ``db.turso.*`` prefix. Long statements are truncated to ``max_statement_length`` characters.
+    """
+
+    def __init__(
+        self,
+        *,
+        tracer_provider: Any = None,
+        meter_provider: Any = None,
+        server_address: str | None = None,
+        max_statement_length: int = 2048,
+    ):
+        if not OTEL_AVAILABLE:
+            raise RuntimeError("opentelemetry-api is not installed; pip install tursopy[otel]")
+        self._tracer = _otel_trace.get_tracer(_INSTRUMENTATION_NAME, tracer_provider=tracer_provider)
+        meter = _otel_metrics.get_meter(_INSTRUMENTATION_NAME, meter_provider=meter_provider)
+        self._duration = meter.create_histogram(
+            "turso.client.duration", unit="s", description="Pipeline request latency"
+        )
+        self._request_size = meter.create_histogram(
+            "turso.client.request.size", unit="By", description="Serialized pipeline request size"
+        )
+        self._response_size = meter.create_histogram(
+            "turso.client.response.size", unit="By", description="Pipeline response size"
+        )
+        self._server_address = server_address
+        self._max_statement_length = max_statement_length
+
+    def _statement(self, event: RequestEvent) -> str:
+        # Batches often repeat one statement; report each distinct statement once
+        sql = '; '.join(dict.fromkeys(event.statements))
+        if len(sql) > self._max_statement_length:
+            sql = sql[: self._max_statement_length] + '...'
+        return sql
+
+    def request_started(self, event: RequestEvent) -> None:
+        attributes: dict[str, Any] = {
+            "db.system": "sqlite",
+            "db.statement": self._statement(event),
+            "db.turso.step_count": event.step_count,
+        }
+        if self._server_address:
+            attributes["server.address"] = self._server_address
+        event.extra[_SPAN_KEY] = self._tracer.start_span(
+            "turso.pipeline", kind=_otel_trace.SpanKind.CLIENT, attributes=attributes
+        )
+
+    def request_finished(self, event: RequestEvent) -> None:
+        span = event.extra.pop(_SPAN_KEY, None)
+        metric_attrs: dict[str, Any] = {"db.system": "sqlite"}
+        if event.status is not None:
+            metric_attrs["http.response.status_code"] = event.status
+        if event.error is not None:
+            metric_attrs["error.type"] = type(event.error).__name__
+        self._duration.record(event.total_s, metric_attrs)
+        self._request_size.record(event.request_bytes, metric_attrs)
+        self._response_size.record(event.response_bytes, metric_attrs)
+        if span is None:
+            return
+        span.set_attribute("db.turso.retry_count", event.retries)
+        span.set_attribute("db.turso.row_count", event.row_count)
+        span.set_attribute("db.turso.request_bytes", event.request_bytes)
+        span.set_attribute("db.turso.response_bytes", event.response_bytes)
+        span.set_attribute("db.turso.network_s", event.network_s)
+        if event.content_encoding is not None:
+            span.set_attribute("db.turso.request_encoding", event.content_encoding)
+            span.set_attribute("db.turso.request_compression_ratio", event.request_compression_ratio)
+        if event.response_wire_bytes and event.response_wire_bytes != event.response_bytes:
+            span.set_attribute("db.turso.response_compression_ratio", event.response_compression_ratio)
+        if event.rate_limit_wait_s:
+            span.set_attribute("db.turso.rate_limit_wait_s", event.rate_limit_wait_s)
+        if event.server_ms is not None:
+            span.set_attribute("db.turso.server_ms", event.server_ms)
+        if event.status is not None:
+            span.set_attribute("http.response.status_code", event.status)
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(_otel_trace.Status(_otel_trace.StatusCode.ERROR, str(event.error)))
+        span.end()
+
+
+def instrument(connection: Any, **kwargs: Any) -> OpenTelemetryListener | None:
+    """Attach an OpenTelemetryListener to a TursoConnection or AsyncTursoConnection.
+
+    Returns the listener, or None (and leaves the connection untouched) when
+    OpenTelemetry is not installed. Keyword arguments go to OpenTelemetryListener.
+    """
+    if not OTEL_AVAILABLE:
+        return None
+    if 'server_address' not in kwargs:
+        kwargs['server_address'] = urlparse(connection.database_url).hostname
+    listener = OpenTelemetryListener(**kwargs)
+    connection.add_listener(listener)
+    return listener
@@ -0,0 +1,152 @@
+# Client-side statement statistics, similar in spirit to pg_stat_statements.
+# QueryStats is a request listener: attach it to a TursoConnection or AsyncTursoConnection
+# and it aggregates latency and row counts per SQL fingerprint, logging slow statements.
+
+from __future__ import annotations
+
+import math
+import re
+import threading
+from collections import OrderedDict, deque
+from functools import lru_cache
+from typing import Any
+
+from .instrumentation import RequestEvent, RequestListener
+from .logger import TursoLogger
+
+_COMMENT_RE = re.compile(r"--[^\n]*|/\*.*?\*/", re.S)
+_BLOB_RE = re.compile(r"\b[xX]'[0-9a-fA-F]*'")
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"(?<![\w.])[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?\b")
+_PLACEHOLDER_RE = re.compile(r"\?\d*|[:@$][A-Za-z_]\w*")
+_WS_RE = re.compile(r"\s+")
+_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_REPEATED_GROUP_RE = re.compile(r"(\([^()]*\))(?:\s*,\s*\1)+")
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(sql: str) -> str:
+    """Normalize SQL so statements differing only in literals/whitespace share one key.
+
+    Literals and placeholders become ``?``, placeholder lists collapse to ``(?, ...)``,
+    repeated VALUES groups collapse to one group, comments are dropped and whitespace
+    is squeezed.
+    """
+    s = _COMMENT_RE.sub(' ', sql)
+    s = _BLOB_RE.sub('?', s)
+    s = _STRING_RE.sub('?', s)
+    s = _NUMBER_RE.sub('?', s)
+    s = _PLACEHOLDER_RE.sub('?', s)
+    s = _WS_RE.sub(' ', s).strip().rstrip(';').strip()
+    s = _LIST_RE.sub('(?, ...)', s)
+    s = _REPEATED_GROUP_RE.sub(r'\1, ...', s)
+    return s
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = max(0, math.ceil(pct / 100.0 * len(sorted_values)) - 1)
+    return sorted_values[k]
+
+
+class _Entry:
+    __slots__ = ('calls', 'errors', 'rows', 'total_s', 'min_s', 'max_s', 'samples')
+
+    def __init__(self, sample_size: int):
+        self.calls = 0
+        self.errors = 0
+        self.rows = 0
+        self.total_s = 0.0
+        self.min_s = math.inf
+        self.max_s = 0.0
+        self.samples: deque[float] = deque(maxlen=sample_size)
+
+
+class QueryStats(RequestListener):
+    """Aggregates per-fingerprint statistics for every pipeline a connection sends.
+
+    A pipeline with several statements is keyed by its distinct fingerprints joined with
+    ``"; "``. At most ``max_entries`` fingerprints are kept (least recently used are evicted);
+    p95 is computed over the last ``sample_size`` latencies of each fingerprint. Requests slower
+    than ``slow_threshold_s`` are logged at WARNING on ``turso_python.slow_query`` with their
+    arguments redacted. Set ``slow_threshold_s=None`` to disable the slow-query log.
+    """
+
+    def __init__(
+        self,
+        *,
+        slow_threshold_s: float | None = 0.5,
+        max_entries: int = 1000,
+        sample_size: int = 256,
+    ):
+        self.slow_threshold_s = slow_threshold_s
+        self.max_entries = max(1, int(max_entries))
+        self.sample_size = max(1, int(sample_size))
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(statements: list[str]) -> str:
+        return '; '.join(dict.fromkeys(fingerprint(s) for s in statements))
+
+    def request_finished(self, event: RequestEvent) -> None:
+        key = self.key_for(event.statements)
+        duration = event.total_s
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _Entry(self.sample_size)
+                if len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            else:
+                self._entries.move_to_end(key)
+            entry.calls += 1
+            entry.rows += event.row_count
+            entry.total_s += duration
+            entry.min_s = min(entry.min_s, duration)
+            entry.max_s = max(entry.max_s, duration)
+            entry.samples.append(duration)
+            if event.error is not None:
+                entry.errors += 1
+        if self.slow_threshold_s is not None and duration >= self.slow_threshold_s:
+            TursoLogger.log_slow_query(
+                key, duration, rows=event.row_count, threshold_s=self.slow_threshold_s,
+                args=event.arg_count,
+            )
+
+    def snapshot(self, *, sort_by: str = 'total_s', limit: int | None = None) -> list[dict[str, Any]]:
+        """Return per-fingerprint statistics, most expensive first."""
+        with self._lock:
+            items = [(k, e, sorted(e.samples)) for k, e in self._entries.items()]
+        stats = [
+            {
+                'fingerprint': key,
+                'calls': e.calls,
+                'errors': e.errors,
+                'rows': e.rows,
+                'total_s': e.total_s,
+                'mean_s': e.total_s / e.calls if e.calls else 0.0,
+                'min_s': e.min_s if e.calls else 0.0,
+                'max_s': e.max_s,
+                'p95_s': _percentile(samples, 95),
+            }
+            for key, e, samples in items
+        ]
+        stats.sort(key=lambda s: s[sort_by], reverse=True)
+        return stats[:limit] if limit is not None else stats
+
+    def get(self, sql: str) -> dict[str, Any] | None:
+        """Statistics for the fingerprint of a single SQL statement, if recorded."""
+        key = fingerprint(sql)
+        for stat in self.snapshot():
+            if stat['fingerprint'] == key:
+                return stat
+        return None
+
+    def reset(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,10 +1,37 @@
 
+import base64
 from typing import Any
 
+from .exceptions import TursoQueryError
+
+
+def strip_stored_sql_results(response: dict[str, Any], n_statements: int) -> dict[str, Any]:
+    """Drop the store_sql/close_sql step results of an execute_many pipeline, so results
+    line up with batch(): one per statement, then the close result."""
+    results = response.get('results') if isinstance(response, dict) else None
+    if isinstance(results, list) and len(results) == n_statements + 3:
+        response['results'] = results[1:n_statements + 1] + results[n_statements + 2:]
+    return response
+
 
 class TursoResponseParser:
     """Helper class to parse Turso database responses"""
 
+    @staticmethod
+    def _cell_value(cell: Any) -> Any:
+        """Unwrap a Hrana value: null -> None, blob -> bytes, others -> their 'value'."""
+        if not isinstance(cell, dict):
+            return cell
+        if 'value' in cell:
+            return cell['value']
+        ctype = cell.get('type')
+        if ctype == 'null':
+            return None
+        if ctype == 'blob':
+            data = cell.get('base64', '')
+            return base64.b64decode(data + '=' * (-len(data) % 4))
+        return cell
+
     @staticmethod
     def _raise_if_error(response: dict[str, Any]) -> None:
         """Inspect the pipeline response and raise an exception if any step indicates error.
@@ -19,10 +46,10 @@ class TursoResponseParser:
                 if item.get('type') == 'error':
                     # Some payloads include an 'error' field directly.
                     err = item.get('error') or item.get('response') or 'Unknown error'
-                    raise Exception(f"Turso execute error: {err}")
+                    raise TursoQueryError(f"Turso execute error: {err}")
                 resp = item.get('response')
                 if isinstance(resp, dict) and resp.get('type') == 'error':
-                    raise Exception(f"Turso execute error: {resp}")
+                    raise TursoQueryError(f"Turso execute error: {resp}")
         except Exception:
             # If parsing itself throws, propagate that exception
             raise
@@ -54,15 +81,8 @@ class TursoResponseParser:
             result = response_data.get('result', {})
             raw_rows = result.get('rows', [])
 
-            parsed_rows = []
-            for raw_row in raw_rows:
-                parsed_row = []
-                for cell in raw_row:
-                    if isinstance(cell, dict) and 'value' in cell:
-                        parsed_row.append(cell['value'])
-                    else:
-                        parsed_row.append(cell)
-                parsed_rows.append(parsed_row)
+            cell_value = TursoResponseParser._cell_value
+            parsed_rows = [[cell_value(cell) for cell in raw_row] for raw_row in raw_rows]
 
             return parsed_rows
 
@@ -96,20 +116,71 @@ class TursoResponseParser:
         except Exception:
             return []
 
+    @staticmethod
+    def _write_info(result: dict[str, Any]) -> tuple[int, int | None]:
+        """(affected_row_count, last_insert_rowid) of one execute result."""
+        rowid = result.get('last_insert_rowid')
+        return int(result.get('affected_row_count') or 0), (int(rowid) if rowid is not None else None)
+
     @staticmethod
     def normalize_response(response: dict[str, Any]) -> dict[str, Any]:
         """
         Convert Turso response to a normalized format that matches expectations
-        Returns: {'rows': [[value1, value2], ...], 'columns': ['col1', 'col2'], 'count': int}
+        Returns: {'rows': [[value1, value2], ...], 'columns': ['col1', 'col2'], 'count': int,
+                  'affected_row_count': int, 'last_insert_rowid': int | None}
         """
         # Raise if any step indicates an error
         TursoResponseParser._raise_if_error(response)
 
         rows = TursoResponseParser.extract_rows(response)
         columns = TursoResponseParser.extract_columns(response)
+        affected, rowid = 0, None
+        try:
+            first = response['results'][0]['response']
+            if first.get('type') == 'execute':
+                affected, rowid = TursoResponseParser._write_info(first.get('result', {}))
+        except (KeyError, IndexError, TypeError, AttributeError, ValueError):
+            pass
 
         return {
             'rows': rows,
             'columns': columns,
-            'count': len(rows)
+            'count': len(rows),
+            'affected_row_count': affected,
+            'last_insert_rowid': rowid
         }
+
+    @staticmethod
+    def affected_row_count(response: dict[str, Any]) -> int:
+        """Sum of affected_row_count over all execute steps of a pipeline response."""
+        total = 0
+        for item in response.get('results', []) if isinstance(response, dict) else []:
+            response_data = item.get('response', {}) if isinstance(item, dict) else {}
+            if response_data.get('type') == 'execute':
+                total += int(response_data.get('result', {}).get('affected_row_count') or 0)
+        return total
+
+    @staticmethod
+    def normalize_results(response: dict[str, Any]) -> list[dict[str, Any]]:
+        """
+        Normalize every execute step of a pipeline response (e.g. from batch()), in order.
+        Returns one dict per statement, shaped like normalize_response().
+        """
+        TursoResponseParser._raise_if_error(response)
+        cell_value = TursoResponseParser._cell_value
+        normalized = []
+        for item in response.get('results', []):
+            response_data = item.get('response', {}) if isinstance(item, dict) else {}
+            if response_data.get('type') != 'execute':
+                continue
+            result = response_data.get('result', {})
+            rows = [[cell_value(cell) for cell in raw_row] for raw_row in result.get('rows', [])]
+            affected, rowid = TursoResponseParser._write_info(result)
+            normalized.append({
+                'rows': rows,
+                'columns': [col.get('name', '') for col in result.get('cols', [])],
+                'count': len(rows),
+                'affected_row_count': affected,
+                'last_insert_rowid': rowid
+            })
+        return normalized
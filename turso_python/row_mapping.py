@@ -0,0 +1,120 @@
+# Maps result rows onto msgspec Structs and dataclasses.
+# A decoder is generated once per (type, column tuple) and cached: it is a plain function that
+# passes the row's cells straight to the type's constructor, converting Hrana's string-encoded
+# integers (and other scalars) per field, without building an intermediate dict per row.
+# msgspec is only imported once a decoder is built.
+
+from __future__ import annotations
+
+import dataclasses
+import types
+import typing
+from collections.abc import Callable, Iterable, Sequence
+from functools import lru_cache
+from typing import Any, TypeVar
+
+T = TypeVar('T')
+
+_PASSTHROUGH = (Any, object, str, bytes)
+
+
+def _as_int(v: Any) -> Any:
+    return None if v is None else int(v)
+
+
+def _as_float(v: Any) -> Any:
+    return None if v is None else float(v)
+
+
+def _as_bool(v: Any) -> Any:
+    if v is None or isinstance(v, bool):
+        return v
+    return bool(int(v))
+
+
+def _unwrap_optional(tp: Any) -> Any:
+    origin = typing.get_origin(tp)
+    if origin is typing.Union or origin is types.UnionType:
+        args = [a for a in typing.get_args(tp) if a is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return tp
+
+
+def _converter(tp: Any) -> Callable[[Any], Any] | None:
+    """Per-field cell converter; None means the cell is passed through unchanged."""
+    base = _unwrap_optional(tp)
+    if base in _PASSTHROUGH:
+        return None
+    if base is bool:
+        return _as_bool
+    if base is int:
+        return _as_int
+    if base is float:
+        return _as_float
+
+    import msgspec
+
+    def convert(v: Any) -> Any:
+        return msgspec.convert(v, tp, strict=False)
+
+    return convert
+
+
+def _fields(cls: type) -> list[tuple[str, Any, bool]]:
+    """(name, type, required) for each constructor field of a Struct or dataclass."""
+    import msgspec
+
+    if isinstance(cls, type) and issubclass(cls, msgspec.Struct):
+        return [(f.name, f.type, f.required) for f in msgspec.structs.fields(cls)]
+    if dataclasses.is_dataclass(cls):
+        hints = typing.get_type_hints(cls)
+        return [
+            (
+                f.name,
+                hints.get(f.name, Any),
+                f.default is dataclasses.MISSING and f.default_factory is dataclasses.MISSING,
+            )
+            for f in dataclasses.fields(cls)
+            if f.init
+        ]
+    raise TypeError(f"as_type must be a msgspec.Struct or a dataclass, got {cls!r}")
+
+
+@lru_cache(maxsize=512)
+def row_decoder(cls: type[T], columns: tuple[str, ...]) -> Callable[[Sequence[Any]], T]:
+    """Returns a compiled function turning one result row (in ``columns`` order) into ``cls``.
+
+    Fields are matched to columns by name; extra columns are ignored and fields missing
+    from the result keep their defaults. Raises ValueError if a required field has no column.
+    """
+    index = {name: i for i, name in enumerate(columns)}
+    namespace: dict[str, Any] = {'_cls': cls}
+    kwargs = []
+    missing = []
+    for name, tp, required in _fields(cls):
+        if name not in index:
+            if required:
+                missing.append(name)
+            continue
+        cell = f"row[{index[name]}]"
+        conv = _converter(tp)
+        if conv is not None:
+            namespace[f"_c_{name}"] = conv
+            cell = f"_c_{name}({cell})"
+        kwargs.append(f"{name}={cell}")
+    if missing:
+        raise ValueError(f"{cls.__name__} field(s) missing from result columns: {', '.join(missing)}")
+    source = f"def decode(row):\n    return _cls({', '.join(kwargs)})\n"
+    exec(compile(source, f"<row_decoder {cls.__name__}>", 'exec'), namespace)
+    return namespace['decode']
+
+
+def map_rows(cls: type[T], columns: Iterable[str], rows: Iterable[Sequence[Any]]) -> list[T]:
+    """Decode ``rows`` (as in a normalized result) into instances of ``cls``."""
+    return list(map(row_decoder(cls, tuple(columns)), rows))
+
+
+def map_result(cls: type[T], result: dict[str, Any]) -> list[T]:
+    """Decode a normalized ``{'rows', 'columns'}`` result into instances of ``cls``."""
+    return map_rows(cls, result['columns'], result['rows'])
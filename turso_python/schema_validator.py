@@ -1,8 +1,86 @@
-import msgspec
+import threading
+from collections import OrderedDict
 from typing import Any
 
+import msgspec
+
+
+class CompiledValidator:
+    """A schema prepared once for repeated validation; see SchemaValidator.compile."""
+
+    def __init__(self, schema: Any):
+        self.schema = schema
+        if isinstance(schema, dict):
+            schema_type = schema.get("type")
+            if schema_type and schema_type != "object":
+                # Basic support only for object schemas here
+                raise ValueError(f"Unsupported schema root type: {schema_type}")
+            properties: dict[str, dict[str, Any]] = schema.get("properties", {}) or {}
+            self._required = tuple(dict.fromkeys(schema.get("required", []) or []))
+            # (key, python type, declared type name), skipping types we don't check
+            self._checks = tuple(
+                (key, expected, prop.get("type"))
+                for key, prop in properties.items()
+                if (expected := SchemaValidator._py_type_for_json_type(prop.get("type", ""))) is not object
+            )
+            self._many_type = None
+        else:
+            self._required = ()
+            self._checks = ()
+            self._many_type = list[schema]
+
+    def _check_dict(self, data: Any) -> None:
+        if not isinstance(data, dict):
+            raise ValueError("Data must be an object/dict for the given schema")
+        for key in self._required:
+            if key not in data:
+                missing = [k for k in self._required if k not in data]
+                raise ValueError(f"Missing required field(s): {', '.join(missing)}")
+        for key, expected, type_name in self._checks:
+            if key in data and not isinstance(data[key], expected):
+                raise ValueError(
+                    f"Field '{key}' expected type {type_name}, got {type(data[key]).__name__}"
+                )
+
+    def _convert(self, data: Any, target: Any) -> None:
+        try:
+            msgspec.convert(data, type=target)
+        except msgspec.ValidationError as e:
+            raise ValueError(f"Schema validation error: {e}")
+        except TypeError as e:
+            # Provided schema isn't a Python type and not a dict
+            raise ValueError(f"Unsupported schema type for msgspec: {e}")
+
+    def validate(self, data: Any) -> bool:
+        """Validate one value; returns True or raises ValueError."""
+        if self._many_type is None:
+            self._check_dict(data)
+        else:
+            self._convert(data, self.schema)
+        return True
+
+    def validate_many(self, rows: Any) -> bool:
+        """Validate a batch of values in one pass; returns True or raises ValueError
+        naming the first offending row."""
+        if self._many_type is not None:
+            self._convert(rows if isinstance(rows, list) else list(rows), self._many_type)
+            return True
+        check = self._check_dict
+        for i, row in enumerate(rows):
+            try:
+                check(row)
+            except ValueError as e:
+                raise ValueError(f"Row {i}: {e}") from None
+        return True
+
 
 class SchemaValidator:
+    # Compiled validators keyed by id(schema); the schema is kept alive alongside so ids
+    # cannot be reused while cached.
+    _compiled: "OrderedDict[int, tuple[Any, CompiledValidator]]" = OrderedDict()
+    _compiled_lock = threading.Lock()
+    _compiled_max = 256
+
     @staticmethod
     def _py_type_for_json_type(t: str):
         t = (t or "").lower()
@@ -25,37 +103,34 @@ class SchemaValidator:
     def _validate_against_schema_dict(data: Any, schema: dict[str, Any]) -> None:
         if not isinstance(schema, dict):
             raise ValueError("Schema must be a dict when using JSON Schema-like validation")
-        schema_type = schema.get("type")
-        if schema_type and schema_type != "object":
-            # Basic support only for object schemas here
-            raise ValueError(f"Unsupported schema root type: {schema_type}")
+        SchemaValidator.compile(schema).validate(data)
 
-        properties: dict[str, dict[str, Any]] = schema.get("properties", {}) or {}
-        required = set(schema.get("required", []) or [])
-
-        if not isinstance(data, dict):
-            raise ValueError("Data must be an object/dict for the given schema")
+    @classmethod
+    def compile(cls, schema: Any) -> CompiledValidator:
+        """Return a reusable validator for ``schema``, cached by schema identity.
 
-        # Check required fields
-        missing = [k for k in required if k not in data]
-        if missing:
-            raise ValueError(f"Missing required field(s): {', '.join(missing)}")
-
-        # Check types for provided properties
-        for key, prop in properties.items():
-            if key not in data:
-                continue  # optional
-            expected_type = SchemaValidator._py_type_for_json_type(prop.get("type", ""))
-            value = data[key]
-            if expected_type is object:
-                # Unknown type, skip strict checking
-                continue
-            if not isinstance(value, expected_type):
-                raise ValueError(
-                    f"Field '{key}' expected type {prop.get('type')}, got {type(value).__name__}"
-                )
+        Compile once and reuse it for every row. The cache is keyed on the schema object
+        itself, so a schema dict mutated after compiling keeps its old rules; pass a new
+        dict instead.
+        """
+        key = id(schema)
+        with cls._compiled_lock:
+            hit = cls._compiled.get(key)
+            if hit is not None and hit[0] is schema:
+                cls._compiled.move_to_end(key)
+                return hit[1]
+        compiled = CompiledValidator(schema)
+        with cls._compiled_lock:
+            cls._compiled[key] = (schema, compiled)
+            cls._compiled.move_to_end(key)
+            while len(cls._compiled) > cls._compiled_max:
+                cls._compiled.popitem(last=False)
+        return compiled
 
-        # Additional properties allowed by default; extend here if needed
+    @staticmethod
+    def validate_many(rows: Any, schema: Any) -> bool:
+        """Validate every row against ``schema`` in one pass (see compile())."""
+        return SchemaValidator.compile(schema).validate_many(rows)
 
     @staticmethod
     def validate_input(data: Any, schema: Any) -> bool:
@@ -64,16 +139,4 @@ class SchemaValidator:
         - a Python type supported by msgspec (e.g., dataclass/Struct) for strict decoding.
         Returns True on success; raises ValueError on validation failure.
         """
-        # Branch on schema shape
-        if isinstance(schema, dict):
-            SchemaValidator._validate_against_schema_dict(data, schema)
-            return True
-        # Fall back to msgspec when given a Python type
-        try:
-            msgspec.json.decode(msgspec.json.encode(data), type=schema)
-            return True
-        except msgspec.ValidationError as e:
-            raise ValueError(f"Schema validation error: {e}")
-        except TypeError as e:
-            # Provided schema isn't a Python type and not a dict
-            raise ValueError(f"Unsupported schema type for msgspec: {e}")
+        return SchemaValidator.compile(schema).validate(data)
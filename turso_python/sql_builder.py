@@ -0,0 +1,219 @@
+# Memoized SQL text for the CRUD helpers.
+# Statements are built once per (operation, table, column tuple, clause) and interned, so hot
+# insert/update/read paths only look up a cached string instead of re-joining it per call.
+
+from __future__ import annotations
+
+import itertools
+import sys
+from collections.abc import Iterable, Iterator, Mapping
+from functools import lru_cache
+from typing import Any
+
+# SQLite's default SQLITE_MAX_VARIABLE_NUMBER, shared by libSQL
+MAX_SQL_PARAMETERS = 32766
+
+
+@lru_cache(maxsize=1024)
+def build_statement(
+    operation: str,
+    table: str,
+    columns: tuple[str, ...],
+    where: str | None = None,
+    joins: tuple[str, ...] = (),
+    returning: str | None = None,
+) -> tuple[str, int]:
+    """Return ``(sql, placeholder_count)`` for a CRUD statement.
+
+    operation is one of:
+      - 'insert': INSERT INTO table (columns) VALUES (?, ...)
+      - 'update': UPDATE table SET col = ?, ... [WHERE where]
+      - 'select': SELECT columns FROM table [joins] [WHERE where]; columns may be ('*',)
+      - 'delete': DELETE FROM table [WHERE where]
+
+    ``returning`` appends a RETURNING clause (e.g. ``'*'`` or ``'id, created_at'``) to
+    insert/update/delete statements.
+
+    placeholder_count is the number of value placeholders the builder generated (one per
+    column for insert/update); placeholders inside ``where`` are the caller's.
+    """
+    if operation == 'insert':
+        sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['?'] * len(columns))})"
+        count = len(columns)
+    elif operation == 'update':
+        sql = f"UPDATE {table} SET {', '.join(f'{c} = ?' for c in columns)}"
+        count = len(columns)
+    elif operation == 'select':
+        sql = f"SELECT {', '.join(columns) or '*'} FROM {table}"
+        if joins:
+            sql += " " + " ".join(joins)
+        count = 0
+    elif operation == 'delete':
+        sql = f"DELETE FROM {table}"
+        count = 0
+    else:
+        raise ValueError(f"Unknown statement operation: {operation!r}")
+    if where:
+        sql += f" WHERE {where}"
+    if returning:
+        if operation == 'select':
+            raise ValueError("RETURNING does not apply to SELECT")
+        sql += f" RETURNING {returning}"
+    return sys.intern(sql), count
+
+
+def returning_clause(returning: str | Iterable[str] | None) -> str | None:
+    """Normalize a RETURNING argument: None, a column string, or an iterable of columns."""
+    if returning is None or isinstance(returning, str):
+        return returning or None
+    return ', '.join(returning) or None
+
+
+def insert_sql(table: str, columns: Iterable[str], returning: str | Iterable[str] | None = None) -> str:
+    return build_statement('insert', table, tuple(columns), returning=returning_clause(returning))[0]
+
+
+def update_sql(
+    table: str, columns: Iterable[str], where: str, returning: str | Iterable[str] | None = None
+) -> str:
+    return build_statement('update', table, tuple(columns), where, returning=returning_clause(returning))[0]
+
+
+def delete_sql(table: str, where: str, returning: str | Iterable[str] | None = None) -> str:
+    return build_statement('delete', table, (), where, returning=returning_clause(returning))[0]
+
+
+def select_sql(
+    table: str, columns: str = '*', where: str | None = None, joins: Iterable[str] | None = None
+) -> str:
+    return build_statement('select', table, (columns,), where, tuple(joins or ()))[0]
+
+
+@lru_cache(maxsize=256)
+def upsert_sql(
+    table: str,
+    columns: tuple[str, ...],
+    conflict_columns: tuple[str, ...],
+    update_columns: tuple[str, ...],
+    n_rows: int = 1,
+) -> str:
+    """INSERT of ``n_rows`` rows with ``ON CONFLICT (...) DO UPDATE`` (or ``DO NOTHING``
+    when there is nothing to update), taking new values from ``excluded``."""
+    row = f"({', '.join(['?'] * len(columns))})"
+    if update_columns:
+        action = "DO UPDATE SET " + ", ".join(f"{c} = excluded.{c}" for c in update_columns)
+    else:
+        action = "DO NOTHING"
+    return sys.intern(
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES {', '.join([row] * n_rows)} "
+        f"ON CONFLICT ({', '.join(conflict_columns)}) {action}"
+    )
+
+
+def upsert_plan(
+    columns: Iterable[str],
+    conflict_columns: Iterable[str],
+    update_columns: Iterable[str] | None,
+) -> tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]:
+    """Normalize upsert arguments; update_columns defaults to every non-conflict column."""
+    columns = tuple(columns)
+    conflict_columns = tuple(conflict_columns)
+    if not conflict_columns:
+        raise ValueError("conflict_columns must name at least one column")
+    missing = [c for c in conflict_columns if c not in columns]
+    if missing:
+        raise ValueError(f"conflict column(s) not in data: {', '.join(missing)}")
+    if update_columns is None:
+        update_columns = tuple(c for c in columns if c not in conflict_columns)
+    return columns, conflict_columns, tuple(update_columns)
+
+
+def rows_per_statement(n_columns: int, chunk_size: int) -> int:
+    """Rows per multi-row statement: ``chunk_size`` capped by the SQL parameter limit."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    return max(1, min(chunk_size, MAX_SQL_PARAMETERS // max(1, n_columns)))
+
+
+def upsert_statements(
+    table: str,
+    rows: Iterable[Mapping[str, Any]],
+    conflict_columns: Iterable[str],
+    update_columns: Iterable[str] | None = None,
+    chunk_size: int = 500,
+) -> Iterator[tuple[str, list[Any]]]:
+    """Yield one multi-row upsert ``(sql, args)`` per chunk of ``rows``.
+
+    Rows are consumed lazily; column order comes from the first row and every row must
+    provide the same keys.
+    """
+    it = iter(rows)
+    first = next(it, None)
+    if first is None:
+        return
+    columns, conflict, update = upsert_plan(first, conflict_columns, update_columns)
+    per_stmt = rows_per_statement(len(columns), chunk_size)
+    it = itertools.chain([first], it)
+    while chunk := list(itertools.islice(it, per_stmt)):
+        args = [row[c] for row in chunk for c in columns]
+        yield upsert_sql(table, columns, conflict, update, len(chunk)), args
+
+
+@lru_cache(maxsize=256)
+def bulk_delete_sql(table: str, key_column: str, n_keys: int) -> str:
+    return sys.intern(f"DELETE FROM {table} WHERE {key_column} IN ({', '.join(['?'] * n_keys)})")
+
+
+@lru_cache(maxsize=256)
+def bulk_update_sql(table: str, key_column: str, update_columns: tuple[str, ...], n_rows: int) -> str:
+    """``UPDATE ... FROM (VALUES ...)``: one row of (key, *update_columns) per updated row."""
+    row = f"({', '.join(['?'] * (len(update_columns) + 1))})"
+    assignments = ", ".join(f"{c} = v.column{i + 2}" for i, c in enumerate(update_columns))
+    return sys.intern(
+        f"UPDATE {table} SET {assignments} FROM (VALUES {', '.join([row] * n_rows)}) AS v "
+        f"WHERE {table}.{key_column} = v.column1"
+    )
+
+
+def bulk_delete_statements(
+    table: str, key_column: str, keys: Iterable[Any], chunk_size: int = 1000
+) -> Iterator[tuple[str, list[Any]]]:
+    """Yield one ``DELETE ... WHERE key IN (...)`` per chunk of ``keys``."""
+    per_stmt = rows_per_statement(1, chunk_size)
+    it = iter(keys)
+    while chunk := list(itertools.islice(it, per_stmt)):
+        yield bulk_delete_sql(table, key_column, len(chunk)), chunk
+
+
+def bulk_update_statements(
+    table: str, key_column: str, rows: Iterable[Mapping[str, Any]], chunk_size: int = 500
+) -> Iterator[tuple[str, list[Any]]]:
+    """Yield one multi-row ``UPDATE ... FROM (VALUES ...)`` per chunk of ``rows``.
+
+    Each row maps ``key_column`` and the columns to set; the columns come from the first
+    row and every row must provide the same keys.
+    """
+    it = iter(rows)
+    first = next(it, None)
+    if first is None:
+        return
+    if key_column not in first:
+        raise ValueError(f"rows must include the key column {key_column!r}")
+    update_columns = tuple(c for c in first if c != key_column)
+    if not update_columns:
+        raise ValueError("rows must include at least one column to update")
+    columns = (key_column,) + update_columns
+    per_stmt = rows_per_statement(len(columns), chunk_size)
+    it = itertools.chain([first], it)
+    while chunk := list(itertools.islice(it, per_stmt)):
+        args = [row[c] for row in chunk for c in columns]
+        yield bulk_update_sql(table, key_column, update_columns, len(chunk)), args
+
+
+def pipelined(
+    statements: Iterable[tuple[str, list[Any]]], per_request: int
+) -> Iterator[list[dict[str, Any]]]:
+    """Group ``(sql, args)`` statements into batch() query lists of ``per_request`` statements."""
+    it = iter(statements)
+    while group := list(itertools.islice(it, max(1, per_request))):
+        yield [{'sql': sql, 'args': args} for sql, args in group]
@@ -0,0 +1,259 @@
+# HTTP transport layer used by TursoConnection and AsyncTursoConnection.
+# The connection classes build the Hrana pipeline body and interpret the response;
+# a transport only moves bytes to the server and back. Swap in another transport
+# (e.g. the in-process one from local_server.py) to run without network access.
+# The httpx transports are optional (install with `pip install tursopy[http2]`) and multiplex
+# concurrent pipelines over one HTTP/2 connection per host.
+
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping
+from typing import Any
+
+from .exceptions import TursoConnectionError
+
+
+class TransportResponse:
+    """Minimal, client-agnostic view of an HTTP response.
+
+    Attribute names mirror ``requests.Response`` so response handling code works
+    the same regardless of which transport produced the response. ``content`` is always
+    the decoded body; ``wire_bytes`` is the size it had on the wire when the server sent
+    it compressed (None when it was not compressed or the size is unknown).
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: Mapping[str, str] | None,
+        content: bytes,
+        wire_bytes: int | None = None,
+    ):
+        self.status_code = status_code
+        self.headers = headers if headers is not None else {}
+        self.content = content
+        self.wire_bytes = wire_bytes
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+def compressed_size(headers: Mapping[str, str]) -> int | None:
+    """Body size on the wire for a response the HTTP client decompressed transparently."""
+    encoding = headers.get('Content-Encoding')
+    length = headers.get('Content-Length')
+    if not encoding or encoding == 'identity' or length is None:
+        return None
+    try:
+        return int(length)
+    except ValueError:
+        return None
+
+
+class Transport:
+    """Base class for synchronous transports.
+
+    Responses must be returned decoded: a transport whose HTTP client does not undo
+    ``Content-Encoding`` itself decodes the body before returning it.
+    """
+
+    def post(
+        self,
+        url: str,
+        body: bytes,
+        headers: Mapping[str, str],
+        timeout: float | None = None,
+    ) -> TransportResponse:
+        """POST ``body`` to ``url``. Raise TursoConnectionError on network failures."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class AsyncTransport:
+    """Base class for asynchronous transports; responses are returned decoded, as for Transport."""
+
+    async def open(self) -> None:
+        pass
+
+    async def post(
+        self,
+        url: str,
+        body: bytes,
+        headers: Mapping[str, str],
+        timeout: float | None = None,
+    ) -> TransportResponse:
+        """POST ``body`` to ``url``. Raise TursoConnectionError on network failures."""
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+
+class RequestsTransport(Transport):
+    """Default sync transport backed by a persistent ``requests.Session``."""
+
+    def __init__(self, session=None):
+        import requests
+
+        self._requests = requests
+        self.session = session if session is not None else requests.Session()
+
+    def post(self, url, body, headers, timeout=None):
+        try:
+            response = self.session.post(url, data=body, headers=headers, timeout=timeout)
+        except self._requests.exceptions.RequestException as e:
+            raise TursoConnectionError(str(e)) from e
+        # requests decodes gzip/deflate bodies and keeps the original headers
+        headers = response.headers
+        return TransportResponse(response.status_code, headers, response.content, compressed_size(headers))
+
+    def close(self) -> None:
+        try:
+            self.session.close()
+        except Exception:
+            pass
+
+
+class AiohttpTransport(AsyncTransport):
+    """Default async transport backed by an ``aiohttp.ClientSession``.
+
+    The session is created lazily unless one is passed in; an external session is
+    never closed by the transport.
+    """
+
+    def __init__(self, session=None, *, timeout=None):
+        import asyncio
+
+        import aiohttp
+
+        self._aiohttp = aiohttp
+        # aiohttp reports its own timeouts as asyncio.TimeoutError, not ClientError
+        self._errors = (aiohttp.ClientError, asyncio.TimeoutError)
+        self._timeout = timeout
+        self._external_session = session is not None
+        self._session = session
+
+    @property
+    def session(self):
+        if self._session is None:
+            self._session = self._aiohttp.ClientSession(timeout=self._timeout)
+        return self._session
+
+    async def open(self) -> None:
+        # Touch the property so the session exists before the first request
+        _ = self.session
+
+    async def post(self, url, body, headers, timeout=None):
+        kwargs: dict[str, Any] = {}
+        if timeout is not None:
+            kwargs['timeout'] = self._aiohttp.ClientTimeout(total=timeout)
+        try:
+            async with self.session.post(url, data=body, headers=headers, **kwargs) as resp:
+                content = await resp.read()
+                return TransportResponse(resp.status, resp.headers, content, compressed_size(resp.headers))
+        except self._errors as e:
+            raise TursoConnectionError(str(e)) from e
+
+    async def close(self) -> None:
+        if self._session is not None and not self._external_session:
+            await self._session.close()
+            self._session = None
+
+
+def _httpx_client(factory, http2: bool, limits, timeout):
+    try:
+        return factory(http2=http2, limits=limits, timeout=timeout)
+    except ImportError as e:
+        raise ImportError("HTTP/2 requires the h2 package; install it with `pip install tursopy[http2]`") from e
+
+
+class HttpxTransport(Transport):
+    """Sync transport backed by an ``httpx.Client``, speaking HTTP/2 by default.
+
+    HTTP/2 is negotiated over TLS (ALPN); plain-http URLs such as a local server fall back
+    to HTTP/1.1. An external ``client`` is used as is and never closed by the transport.
+    """
+
+    def __init__(self, client=None, *, http2: bool = True, limits=None, timeout: float | None = 30.0):
+        import httpx
+
+        self._httpx = httpx
+        self._external_client = client is not None
+        if client is None:
+            client = _httpx_client(httpx.Client, http2, limits or httpx.Limits(), timeout)
+        self.client = client
+
+    def post(self, url, body, headers, timeout=None):
+        httpx = self._httpx
+        try:
+            response = self.client.post(
+                url,
+                content=body,
+                headers=headers,
+                timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+            )
+        except httpx.HTTPError as e:
+            raise TursoConnectionError(str(e)) from e
+        headers = response.headers
+        return TransportResponse(response.status_code, headers, response.content, compressed_size(headers))
+
+    def close(self) -> None:
+        if not self._external_client:
+            try:
+                self.client.close()
+            except Exception:
+                pass
+
+
+class AsyncHttpxTransport(AsyncTransport):
+    """Async transport backed by an ``httpx.AsyncClient``, speaking HTTP/2 by default.
+
+    All concurrent pipelines to a host share one HTTP/2 connection instead of one
+    HTTP/1.1 connection each. Runs on any anyio backend (asyncio or trio). The client is
+    created lazily unless one is passed in; an external client is never closed.
+    """
+
+    def __init__(self, client=None, *, http2: bool = True, limits=None, timeout: float | None = 30.0):
+        import httpx
+
+        self._httpx = httpx
+        self._http2 = http2
+        self._limits = limits or httpx.Limits()
+        self._timeout = timeout
+        self._external_client = client is not None
+        self._client = client
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = _httpx_client(self._httpx.AsyncClient, self._http2, self._limits, self._timeout)
+        return self._client
+
+    async def open(self) -> None:
+        _ = self.client
+
+    async def post(self, url, body, headers, timeout=None):
+        httpx = self._httpx
+        try:
+            response = await self.client.post(
+                url,
+                content=body,
+                headers=headers,
+                timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+            )
+        except httpx.HTTPError as e:
+            raise TursoConnectionError(str(e)) from e
+        headers = response.headers
+        return TransportResponse(response.status_code, headers, response.content, compressed_size(headers))
+
+    async def close(self) -> None:
+        if self._client is not None and not self._external_client:
+            await self._client.aclose()
+            self._client = None
@@ -1,70 +1,332 @@
+import itertools
 import json
+import sys
+from array import array
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
+from typing import Any
 
 from turso_python.connection import TursoConnection
+from turso_python.response_parser import TursoResponseParser
+from turso_python.sql_builder import MAX_SQL_PARAMETERS
+
+_LITTLE_ENDIAN = sys.byteorder == 'little'
+_VECTOR_OUTPUTS = ('array', 'numpy', 'list')
+
+
+def pack_vector(vector: Any) -> bytes:
+    """Pack a float vector as little-endian float32 bytes (the libSQL F32_BLOB layout).
+
+    Accepts lists/tuples of numbers, ``array.array`` and NumPy arrays; bytes-like
+    input is assumed to be packed already and is passed through.
+    """
+    if isinstance(vector, bytes):
+        return vector
+    if isinstance(vector, bytearray | memoryview):
+        return bytes(vector)
+    if hasattr(vector, '__array__') and hasattr(vector, 'astype'):
+        # NumPy (or compatible) array: no-op cast when already float32 little-endian
+        return vector.astype('<f4', copy=False).tobytes()
+    if not (isinstance(vector, array) and vector.typecode == 'f'):
+        vector = array('f', vector)
+    if not _LITTLE_ENDIAN:
+        vector = array('f', vector)
+        vector.byteswap()
+    return vector.tobytes()
+
+
+def decode_vector(value: Any, output: str = 'array') -> Any:
+    """Decode a vector cell into ``output``: 'array' (``array('f')``), 'numpy' or 'list'.
+
+    Accepts the raw float32 blob of an F32_BLOB column or vector_extract() text.
+    None is returned unchanged.
+    """
+    if value is None:
+        return None
+    if output not in _VECTOR_OUTPUTS:
+        raise ValueError(f"output must be one of {_VECTOR_OUTPUTS}")
+    if isinstance(value, bytes | bytearray | memoryview):
+        if output == 'numpy':
+            import numpy as np
+
+            return np.frombuffer(value, dtype='<f4')
+        vec = array('f')
+        vec.frombytes(value)
+        if not _LITTLE_ENDIAN:
+            vec.byteswap()
+    else:
+        values = json.loads(value)
+        if output == 'numpy':
+            import numpy as np
+
+            return np.asarray(values, dtype=np.float32)
+        vec = array('f', values)
+    return vec.tolist() if output == 'list' else vec
+
+
+def _chunked(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    it = iter(items)
+    while chunk := list(itertools.islice(it, size)):
+        yield chunk
+
+
+@lru_cache(maxsize=256)
+def _multi_row_insert_sql(table: str, columns: tuple[str, ...], vector_column: str, n_rows: int) -> str:
+    row = '(' + ', '.join(['?'] * len(columns) + ['vector32(?)']) + ')'
+    return (
+        f"INSERT INTO {table} ({', '.join(columns + (vector_column,))}) VALUES "
+        + ', '.join([row] * n_rows)
+    )
+
+
+_DISTANCE_FUNCTIONS = {'cosine': 'vector_distance_cos', 'l2': 'vector_distance_l2'}
+_COMPRESS_NEIGHBORS = frozenset({'float1bit', 'float8', 'float16', 'floatb16', 'float32'})
+# Index candidates fetched per requested row when a search has a WHERE filter
+_FILTER_OVERFETCH = 4
+
+
+@lru_cache(maxsize=256)
+def _top_k_sql(
+    table: str,
+    index: str,
+    columns: tuple[str, ...],
+    vector_column: str,
+    distance: str,
+    where: str | None,
+    candidates: int,
+    top_k: int,
+) -> str:
+    # ?1 is the query vector, bound once and reused for the distance; plain ? placeholders
+    # in the filter continue the numbering from ?2. Row counts are validated ints. The index
+    # ids are renamed to _rowid inside a subquery so a table column called id (or any other
+    # unqualified name in the filter) binds to the table, never to vector_top_k's output.
+    selected = ''.join(f", {table}.{c}" for c in columns)
+    filter_sql = f" WHERE {where}" if where else ''
+    return (
+        f"SELECT v._rowid{selected}, {distance}({table}.{vector_column}, vector32(?1)) AS distance "
+        f"FROM (SELECT id AS _rowid FROM vector_top_k('{index}', vector32(?1), {candidates})) AS v "
+        f"JOIN {table} ON {table}.rowid = v._rowid{filter_sql} ORDER BY distance LIMIT {top_k};"
+    )
+
+
+_DEFAULT_METADATA_COLUMNS = {'title': 'TEXT', 'year': 'INT'}
+
 
 """
 -   Vector embeddings
 -   This client is used for creating vector embeddings, vector search and more
 """
 class TursoVector:
-    def __init__(self, connection: TursoConnection, table_name: str):
+    def __init__(
+        self,
+        connection: TursoConnection,
+        table_name: str,
+        *,
+        vector_encoding: str = 'blob',
+        metadata_columns: dict[str, str] | None = None,
+        index_name: str | None = None,
+        metric: str = 'cosine',
+    ):
+        """
+        :param vector_encoding: 'blob' sends embeddings as packed float32 blob arguments
+            (compact and fast to build); 'json' sends them as JSON text like earlier versions.
+        :param metadata_columns: column name -> SQL type of the non-vector columns, in order.
+            Defaults to ``{'title': 'TEXT', 'year': 'INT'}``.
+        :param index_name: name of the vector index, ``{table_name}_idx`` by default.
+        :param metric: 'cosine' or 'l2'; used for the index and for the distances returned by searches.
+        """
+        if vector_encoding not in ('blob', 'json'):
+            raise ValueError("vector_encoding must be 'blob' or 'json'")
+        if metric not in _DISTANCE_FUNCTIONS:
+            raise ValueError(f"metric must be one of {sorted(_DISTANCE_FUNCTIONS)}")
         self.connection = connection
         self.table_name = table_name
+        self.vector_encoding = vector_encoding
+        self.metadata_columns = dict(metadata_columns or _DEFAULT_METADATA_COLUMNS)
+        self.index_name = index_name or f"{table_name}_idx"
+        self.metric = metric
+
+    def _require_columns(self, method: str, *names: str, alternative: str) -> None:
+        missing = [n for n in names if n not in self.metadata_columns]
+        if missing:
+            raise ValueError(
+                f"{method} needs the default {', '.join(names)} metadata columns, which this table "
+                f"does not have (missing: {', '.join(missing)}); use {alternative} instead"
+            )
+
+    def encode_vector(self, vector: Any) -> bytes | str:
+        """Encode a vector as the argument passed to vector32(?)."""
+        if self.vector_encoding == 'json':
+            if hasattr(vector, 'tolist'):
+                vector = vector.tolist()
+            return json.dumps(list(vector))
+        return pack_vector(vector)
 
     def create_table(self, vector_column: str, vector_type: str, dimensions: int):
-        """Creates a table with a vector column."""
+        """Creates a table with the metadata columns and a vector column."""
+        columns = ''.join(f"{name} {sql_type},\n            " for name, sql_type in self.metadata_columns.items())
         query = f"""
         CREATE TABLE {self.table_name} (
-            title TEXT,
-            year INT,
-            {vector_column} {vector_type}({dimensions})  -- vector column
+            {columns}{vector_column} {vector_type}({dimensions})  -- vector column
         );
         """
         return self.connection.execute_query(query)
 
-    def insert_embedding(self, title: str, year: int, vector_column: str, embedding: list):
-        """Inserts embeddings into the table."""
+    def insert_embedding(self, title: str, year: int, vector_column: str, embedding: Any):
+        """Inserts embeddings into a table with the default title/year columns (see insert_row)."""
+        self._require_columns('insert_embedding', 'title', 'year', alternative='insert_row()')
         query = f"""
         INSERT INTO {self.table_name} (title, year, {vector_column})
         VALUES (?, ?, vector32(?));
         """
-        # Convert list to a JSON string representation of the vector
-        embedding_str = json.dumps(embedding)
-        params = (title, year, embedding_str)
+        params = (title, year, self.encode_vector(embedding))
+        return self.connection.execute_query(query, params)
+
+    def insert_row(self, vector_column: str, metadata: dict[str, Any], embedding: Any):
+        """Inserts one row with arbitrary metadata columns and its embedding."""
+        columns = tuple(metadata)
+        query = _multi_row_insert_sql(self.table_name, columns, vector_column, 1)
+        params = [*metadata.values(), self.encode_vector(embedding)]
         return self.connection.execute_query(query, params)
 
-    def create_index(self, vector_column: str):
-        """Creates a vector index on the table."""
+    def create_index(
+        self,
+        vector_column: str,
+        *,
+        compress_neighbors: str | None = None,
+        max_neighbors: int | None = None,
+        **options: Any,
+    ):
+        """Creates a vector index on the table.
+
+        ``compress_neighbors`` (e.g. 'float8', 'float1bit') and ``max_neighbors`` trade recall
+        for index size and insert/search speed; other libSQL index settings such as
+        ``search_l`` or ``alpha`` can be passed as keyword arguments. The metric is the one
+        the instance was created with.
+        """
+        settings: dict[str, Any] = {'metric': self.metric}
+        if compress_neighbors is not None:
+            if compress_neighbors not in _COMPRESS_NEIGHBORS:
+                raise ValueError(f"compress_neighbors must be one of {sorted(_COMPRESS_NEIGHBORS)}")
+            settings['compress_neighbors'] = compress_neighbors
+        if max_neighbors is not None:
+            settings['max_neighbors'] = int(max_neighbors)
+        settings.update(options)
+        settings_sql = ''.join(f", '{key}={value}'" for key, value in settings.items())
         query = f"""
-        CREATE INDEX {self.table_name}_idx ON {self.table_name} (libsql_vector_idx({vector_column}));
+        CREATE INDEX {self.index_name} ON {self.table_name} (libsql_vector_idx({vector_column}{settings_sql}));
         """
         return self.connection.execute_query(query)
 
-    def vector_similarity_search(self, vector_column: str, query_vector: list, top_k: int = 5):
-        """Performs a vector similarity search using cosine distance."""
+    def vector_similarity_search(self, vector_column: str, query_vector: Any, top_k: int = 5):
+        """Returns the metadata columns of the ``top_k`` nearest rows according to the index."""
+        selected = ', '.join(f"{self.table_name}.{c}" for c in self.metadata_columns)
         query = f"""
-        SELECT title, year
-        FROM vector_top_k('{self.table_name}_idx', vector32(?), ?)
-        JOIN {self.table_name} ON {self.table_name}.rowid = id;
+        SELECT {selected}
+        FROM vector_top_k('{self.index_name}', vector32(?), ?) AS v
+        JOIN {self.table_name} ON {self.table_name}.rowid = v.id;
         """
-        # Convert list to a JSON string representation of the query vector
-        query_vector_str = json.dumps(query_vector)
-        params = (query_vector_str, top_k)
+        params = (self.encode_vector(query_vector), top_k)
         return self.connection.execute_query(query, params)
 
-    def vector_distance_cos(self, vector_column: str, query_vector: list):
-        """Calculates the cosine distance between vectors."""
+    def _search_sql(self, vector_column: str, top_k: int, where: str | None, candidates: int | None) -> str:
+        if top_k < 1:
+            raise ValueError("top_k must be at least 1")
+        if candidates is None:
+            candidates = top_k if where is None else top_k * _FILTER_OVERFETCH
+        return _top_k_sql(
+            self.table_name, self.index_name, tuple(self.metadata_columns), vector_column,
+            _DISTANCE_FUNCTIONS[self.metric], where, int(max(candidates, top_k)), int(top_k),
+        )
+
+    def search(
+        self,
+        vector_column: str,
+        query_vector: Any,
+        top_k: int = 5,
+        *,
+        where: str | None = None,
+        where_args: Iterable[Any] = (),
+        candidates: int | None = None,
+    ):
+        """Top-k search returning _rowid, the metadata columns and the distance, nearest first.
+
+        ``where`` is an SQL predicate on the table's columns (e.g. ``"year >= ? AND genre = ?"``)
+        applied to the index candidates, with ``?`` placeholders bound from ``where_args``.
+        Because the index is searched before filtering, ``candidates`` rows are fetched from
+        it (``top_k`` without a filter, ``4 * top_k`` with one); raise it when the filter is
+        selective to improve recall, lower it to cut latency.
+        """
+        query = self._search_sql(vector_column, top_k, where, candidates)
+        return self.connection.execute_query(query, [self.encode_vector(query_vector), *where_args])
+
+    def _batch_search_statements(
+        self,
+        vector_column: str,
+        query_vectors: Iterable[Any],
+        top_k: int,
+        where: str | None = None,
+        where_args: Iterable[Any] = (),
+        candidates: int | None = None,
+    ) -> list[dict[str, Any]]:
+        sql = self._search_sql(vector_column, top_k, where, candidates)
+        where_args = list(where_args)
+        return [{'sql': sql, 'args': [self.encode_vector(q), *where_args]} for q in query_vectors]
+
+    def batch_similarity_search(
+        self,
+        vector_column: str,
+        query_vectors: Iterable[Any],
+        top_k: int = 5,
+        *,
+        where: str | None = None,
+        where_args: Iterable[Any] = (),
+        candidates: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Runs one top-k search per query vector in a single pipeline request.
+
+        Returns one normalized result per query vector, in order, with the same columns
+        as search(). ``where``, ``where_args`` and ``candidates`` apply to every query.
+        """
+        statements = self._batch_search_statements(vector_column, query_vectors, top_k, where, where_args, candidates)
+        if not statements:
+            return []
+        return TursoResponseParser.normalize_results(self.connection.batch(statements))
+
+    def vector_cache(self, vector_column: str, *, page_size: int = 5000):
+        """Returns a VectorCache: a local NumPy copy of the column for exact and re-ranked search.
+
+        Call ``refresh()`` on it to load rows; see turso_python.vector_cache.
+        """
+        from turso_python.vector_cache import VectorCache
+
+        return VectorCache(self, vector_column, page_size=page_size)
+
+    def vector_distance_cos(self, vector_column: str, query_vector: Any, limit: int | None = None):
+        """Calculates the cosine distance between vectors, nearest first.
+
+        The distance is computed once per row, and vector_extract() only runs for the
+        rows that are returned (at most ``limit`` when given). Needs a ``title`` column;
+        search() works with any metadata columns.
+        """
+        self._require_columns('vector_distance_cos', 'title', alternative="search() with metric='cosine'")
         query = f"""
-        SELECT title, vector_extract({vector_column}), vector_distance_cos({vector_column}, vector32(?))
-        FROM {self.table_name}
-        ORDER BY vector_distance_cos({vector_column}, vector32(?)) ASC;
+        SELECT title, vector_extract({vector_column}), distance
+        FROM (
+            SELECT title, {vector_column}, vector_distance_cos({vector_column}, vector32(?)) AS distance
+            FROM {self.table_name}
+            ORDER BY distance ASC
+            LIMIT ?
+        )
+        ORDER BY distance ASC;
         """
-        query_vector_str = json.dumps(query_vector)
-        params = (query_vector_str, query_vector_str)
+        params = (self.encode_vector(query_vector), -1 if limit is None else int(limit))
         return self.connection.execute_query(query, params)
 
     def create_partial_index(self, vector_column: str, year_threshold: int):
         """Creates a partial index based on a condition (e.g., year >= threshold)."""
+        self._require_columns('create_partial_index', 'year', alternative='create_index()')
         query = f"""
         CREATE INDEX {self.table_name}_partial_idx ON {self.table_name} 
         (libsql_vector_idx({vector_column})) 
@@ -74,12 +336,12 @@ class TursoVector:
 
     def reindex(self):
         """Rebuilds the index."""
-        query = f"REINDEX {self.table_name}_idx;"
+        query = f"REINDEX {self.index_name};"
         return self.connection.execute_query(query)
 
     def drop_index(self):
         """Drops the index."""
-        query = f"DROP INDEX {self.table_name}_idx;"
+        query = f"DROP INDEX {self.index_name};"
         return self.connection.execute_query(query)
 
     def extract_vector(self, vector_column: str, row_id: int):
@@ -87,16 +349,151 @@ class TursoVector:
         query = f"SELECT vector_extract({vector_column}) FROM {self.table_name} WHERE rowid = ?;"
         return self.connection.execute_query(query, (row_id,))
 
-    def update_embedding(self, vector_column: str, row_id: int, new_embedding: list):
+    def get_vector(self, vector_column: str, row_id: int, output: str = 'array'):
+        """Returns the vector of one row decoded as ``array('f')``, a NumPy array or a list (None if missing)."""
+        return self.extract_vectors(vector_column, [row_id], output=output).get(row_id)
+
+    def _extract_vectors_statements(self, vector_column: str, row_ids: list[int]) -> list[dict[str, Any]]:
+        # vector32() instead of vector_extract(): a float32 blob with no float formatting on the
+        # server, and F64/F16/F8/F1BIT columns are converted to the layout decode_vector expects
+        statements = []
+        for chunk in _chunked(row_ids, MAX_SQL_PARAMETERS):
+            placeholders = ', '.join(['?'] * len(chunk))
+            sql = (
+                f"SELECT rowid, vector32({vector_column}) FROM {self.table_name} "
+                f"WHERE rowid IN ({placeholders});"
+            )
+            statements.append({'sql': sql, 'args': chunk})
+        return statements
+
+    @staticmethod
+    def _decode_extracted(row_ids: list[int], response: dict[str, Any], output: str) -> dict[int, Any]:
+        found = {}
+        for result in TursoResponseParser.normalize_results(response):
+            for row_id, value in result['rows']:
+                found[int(row_id)] = decode_vector(value, output)
+        return {row_id: found[row_id] for row_id in row_ids if row_id in found}
+
+    def extract_vectors(self, vector_column: str, row_ids: Iterable[int], output: str = 'array') -> dict[int, Any]:
+        """Fetches the vectors of many rows in one request.
+
+        Returns ``{row_id: vector}`` in the order of ``row_ids``; missing rows are omitted.
+        """
+        row_ids = [int(r) for r in row_ids]
+        if output not in _VECTOR_OUTPUTS:
+            raise ValueError(f"output must be one of {_VECTOR_OUTPUTS}")
+        if not row_ids:
+            return {}
+        response = self.connection.batch(self._extract_vectors_statements(vector_column, row_ids))
+        return self._decode_extracted(row_ids, response, output)
+
+    def update_embedding(self, vector_column: str, row_id: int, new_embedding: Any):
         """Updates the vector for a given row."""
         query = f"""
         UPDATE {self.table_name} SET {vector_column} = vector32(?)
         WHERE rowid = ?;
         """
-        embedding_str = json.dumps(new_embedding)
-        return self.connection.execute_query(query, (embedding_str, row_id))
+        return self.connection.execute_query(query, (self.encode_vector(new_embedding), row_id))
 
     def delete_row(self, row_id: int):
         """Deletes a row from the table."""
         query = f"DELETE FROM {self.table_name} WHERE rowid = ?;"
-        return self.connection.execute_query(query, (row_id,))
\ No newline at end of file
+        return self.connection.execute_query(query, (row_id,))
+
+    def _bulk_insert_statements(
+        self, vector_column: str, columns: tuple[str, ...], chunk: list[tuple[dict[str, Any], Any]]
+    ) -> list[dict[str, Any]]:
+        """Build multi-row INSERT statements for one chunk, split to stay under the parameter limit."""
+        rows_per_stmt = max(1, MAX_SQL_PARAMETERS // (len(columns) + 1))
+        statements = []
+        for start in range(0, len(chunk), rows_per_stmt):
+            part = chunk[start:start + rows_per_stmt]
+            args: list[Any] = []
+            for metadata, vector in part:
+                args.extend(metadata[c] for c in columns)
+                args.append(self.encode_vector(vector))
+            sql = _multi_row_insert_sql(self.table_name, columns, vector_column, len(part))
+            statements.append({'sql': sql, 'args': args})
+        return statements
+
+    @staticmethod
+    def _check_metadata(columns: tuple[str, ...], chunk: list[tuple[dict[str, Any], Any]]) -> None:
+        expected = set(columns)
+        for metadata, _ in chunk:
+            if metadata.keys() != expected:
+                raise ValueError(
+                    f"bulk_insert_embeddings: item metadata has columns {sorted(metadata)}, "
+                    f"expected {sorted(expected)} like the first item"
+                )
+
+    def _insert_chunk(self, vector_column: str, columns: tuple[str, ...], chunk: list) -> int:
+        statements = self._bulk_insert_statements(vector_column, columns, chunk)
+        TursoResponseParser._raise_if_error(self.connection.batch(statements))
+        return len(chunk)
+
+    def _drop_index_statements(self) -> list[dict[str, Any]]:
+        # Read the index definition and drop it in one pipeline, so the index can be rebuilt
+        # exactly as it was (settings included) even if another instance created it
+        return [
+            {'sql': "SELECT sql FROM sqlite_master WHERE type = 'index' AND name = ?;", 'args': [self.index_name]},
+            {'sql': f"DROP INDEX IF EXISTS {self.index_name};"},
+        ]
+
+    @staticmethod
+    def _dropped_index_sql(response: dict[str, Any]) -> str | None:
+        rows = TursoResponseParser.normalize_results(response)[0]['rows']
+        return rows[0][0] if rows and rows[0][0] else None
+
+    def bulk_insert_embeddings(
+        self,
+        vector_column: str,
+        items: Iterable[tuple[dict[str, Any], Any]],
+        *,
+        chunk_size: int = 500,
+        concurrency: int = 1,
+        defer_index: bool = False,
+    ) -> int:
+        """Stream (metadata, vector) pairs into the table with multi-row INSERTs.
+
+        Items are consumed lazily in chunks of ``chunk_size`` rows; each chunk is sent as
+        one pipeline. Column names come from the first item's metadata dict and every item
+        must provide the same keys (ValueError otherwise). With ``concurrency > 1`` up to that
+        many chunks are in flight at once on worker threads. With ``defer_index=True`` the
+        table's vector index is dropped when the first chunk is ready and recreated from its
+        stored definition after the load, instead of being maintained row by row. The index
+        is recreated even if the load fails; rows inserted before the failure are kept.
+
+        Returns the number of rows inserted.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        it = iter(items)
+        first = next(it, None)
+        if first is None:
+            return 0
+        columns = tuple(first[0].keys())
+        chunks = _chunked(itertools.chain([first], it), chunk_size)
+
+        index_sql = None
+        if defer_index:
+            index_sql = self._dropped_index_sql(self.connection.batch(self._drop_index_statements()))
+        total = 0
+        try:
+            if concurrency <= 1:
+                for chunk in chunks:
+                    self._check_metadata(columns, chunk)
+                    total += self._insert_chunk(vector_column, columns, chunk)
+            else:
+                with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                    pending: set = set()
+                    for chunk in chunks:
+                        self._check_metadata(columns, chunk)
+                        if len(pending) >= concurrency:
+                            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                            total += sum(f.result() for f in done)
+                        pending.add(pool.submit(self._insert_chunk, vector_column, columns, chunk))
+                    total += sum(f.result() for f in pending)
+        finally:
+            if index_sql is not None:
+                self.connection.execute_query(index_sql)
+        return total
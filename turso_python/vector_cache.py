@@ -0,0 +1,192 @@
+# Memory-resident exact vector search for small collections.
+# Requires NumPy (install with `pip install tursopy[numpy]`). The table's vectors are copied into
+# a float32 matrix and kept current by fetching only rows above the highest rowid seen so far.
+
+from __future__ import annotations
+
+from typing import Any
+
+from .response_parser import TursoResponseParser
+from .turso_vector import TursoVector, decode_vector
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    np = None  # type: ignore[assignment]
+    NUMPY_AVAILABLE = False
+
+
+class VectorCache:
+    """Exact top-k search over a local float32 copy of a TursoVector table.
+
+    ``refresh()`` appends rows whose rowid is above the current watermark, ``page_size`` rows
+    per request, so repeated refreshes only transfer new rows. Updates and deletes of rows
+    that are already cached are not detected; call ``refresh(full=True)`` after those.
+
+    Distances use the TursoVector's metric: cosine distance (1 - cosine similarity) or L2.
+    """
+
+    def __init__(self, vectors: TursoVector, vector_column: str, *, page_size: int = 5000):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("VectorCache requires numpy; install it with `pip install tursopy[numpy]`")
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        self.vectors = vectors
+        self.vector_column = vector_column
+        self.page_size = page_size
+        self.watermark = 0
+        self._ids = np.empty(0, dtype=np.int64)
+        self._matrix: Any = None
+        self._sq_norms = np.empty(0, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def ids(self) -> Any:
+        """Cached rowids in ascending order."""
+        return self._ids
+
+    @property
+    def matrix(self) -> Any:
+        """Cached vectors as an (n, dims) float32 array; rows are unit length for cosine."""
+        return self._matrix
+
+    # -- refresh -------------------------------------------------------------------------
+
+    def _page_query(self) -> tuple[str, list[Any]]:
+        v = self.vectors
+        # vector32() has the server convert F64/F16/F8/... columns to the float32 layout decoded here
+        sql = (
+            f"SELECT rowid, vector32({self.vector_column}) FROM {v.table_name} "
+            f"WHERE rowid > ? AND {self.vector_column} IS NOT NULL ORDER BY rowid LIMIT ?;"
+        )
+        return sql, [self.watermark, self.page_size]
+
+    def _reset(self) -> None:
+        self.watermark = 0
+        self._ids = np.empty(0, dtype=np.int64)
+        self._matrix = None
+        self._sq_norms = np.empty(0, dtype=np.float32)
+
+    def _apply_page(self, response: dict[str, Any]) -> int:
+        """Append one page of (rowid, vector) rows; returns the number of rows added."""
+        rows = TursoResponseParser.normalize_response(response)['rows']
+        if not rows:
+            return 0
+        ids = np.fromiter((int(r[0]) for r in rows), dtype=np.int64, count=len(rows))
+        block = np.vstack([decode_vector(r[1], 'numpy') for r in rows]).astype(np.float32, copy=False)
+        sq_norms = np.einsum('ij,ij->i', block, block)
+        if self.vectors.metric == 'cosine':
+            norms = np.sqrt(sq_norms)
+            norms[norms == 0] = 1.0
+            block = block / norms[:, None]
+        self._ids = np.concatenate([self._ids, ids])
+        self._matrix = block if self._matrix is None else np.vstack([self._matrix, block])
+        self._sq_norms = np.concatenate([self._sq_norms, sq_norms])
+        self.watermark = int(ids[-1])
+        return len(rows)
+
+    def refresh(self, *, full: bool = False) -> int:
+        """Fetch rows added since the last refresh (all rows with ``full=True``).
+
+        Returns the number of rows added to the cache.
+        """
+        if full:
+            self._reset()
+        added = 0
+        while True:
+            sql, args = self._page_query()
+            n = self._apply_page(self.vectors.connection.execute_query(sql, args))
+            added += n
+            if n < self.page_size:
+                return added
+
+    # -- search --------------------------------------------------------------------------
+
+    def _query(self, query_vector: Any) -> Any:
+        q = np.asarray(query_vector, dtype=np.float32).reshape(-1)
+        if self._matrix is not None and q.shape[0] != self._matrix.shape[1]:
+            raise ValueError(f"query has {q.shape[0]} dimensions, cached vectors have {self._matrix.shape[1]}")
+        return q
+
+    def _distances(self, q: Any, rows: Any = None) -> Any:
+        matrix = self._matrix if rows is None else self._matrix[rows]
+        if self.vectors.metric == 'cosine':
+            norm = float(np.linalg.norm(q)) or 1.0
+            return 1.0 - matrix @ (q / norm)
+        sq_norms = self._sq_norms if rows is None else self._sq_norms[rows]
+        return np.sqrt(np.maximum(sq_norms - 2.0 * (matrix @ q) + float(q @ q), 0.0))
+
+    @staticmethod
+    def _top(ids: Any, distances: Any, top_k: int) -> list[tuple[int, float]]:
+        if top_k < len(distances):
+            part = np.argpartition(distances, top_k - 1)[:top_k]
+        else:
+            part = np.arange(len(distances))
+        order = part[np.argsort(distances[part], kind='stable')]
+        return [(int(ids[i]), float(distances[i])) for i in order]
+
+    def search(self, query_vector: Any, top_k: int = 5) -> list[tuple[int, float]]:
+        """Exact top-k over the cached rows as (rowid, distance) pairs, nearest first."""
+        if top_k < 1:
+            raise ValueError("top_k must be at least 1")
+        if self._matrix is None:
+            return []
+        q = self._query(query_vector)
+        return self._top(self._ids, self._distances(q), top_k)
+
+    def rerank(self, query_vector: Any, row_ids: Any, top_k: int | None = None) -> list[tuple[int, float]]:
+        """Exact distances for the given rowids (e.g. approximate index hits), nearest first.
+
+        Rowids that are not cached are skipped.
+        """
+        if self._matrix is None:
+            return []
+        wanted = np.asarray(list(row_ids), dtype=np.int64)
+        pos = np.searchsorted(self._ids, wanted)
+        pos = pos[pos < len(self._ids)]
+        pos = np.unique(pos[np.isin(self._ids[pos], wanted)])
+        if not len(pos):
+            return []
+        q = self._query(query_vector)
+        return self._top(self._ids[pos], self._distances(q, pos), top_k or len(pos))
+
+    def _candidates_query(self, query_vector: Any, candidates: int) -> tuple[str, list[Any]]:
+        v = self.vectors
+        sql = f"SELECT id FROM vector_top_k('{v.index_name}', vector32(?), ?);"
+        return sql, [v.encode_vector(query_vector), candidates]
+
+    def rerank_search(self, query_vector: Any, top_k: int = 5, *, candidates: int | None = None) -> list[tuple[int, float]]:
+        """Fetch ``candidates`` rowids from the approximate index and re-rank them exactly.
+
+        Only ids cross the wire; distances are computed locally. Call refresh() first so new
+        rows returned by the index are cached.
+        """
+        sql, args = self._candidates_query(query_vector, candidates or top_k * 4)
+        rows = TursoResponseParser.normalize_response(self.vectors.connection.execute_query(sql, args))['rows']
+        return self.rerank(query_vector, (int(r[0]) for r in rows), top_k)
+
+
+class AsyncVectorCache(VectorCache):
+    """VectorCache for AsyncTursoVector; refresh() and rerank_search() are coroutines."""
+
+    async def refresh(self, *, full: bool = False) -> int:  # type: ignore[override]
+        if full:
+            self._reset()
+        added = 0
+        while True:
+            sql, args = self._page_query()
+            n = self._apply_page(await self.vectors.connection.execute_query(sql, args))
+            added += n
+            if n < self.page_size:
+                return added
+
+    async def rerank_search(  # type: ignore[override]
+        self, query_vector: Any, top_k: int = 5, *, candidates: int | None = None
+    ) -> list[tuple[int, float]]:
+        sql, args = self._candidates_query(query_vector, candidates or top_k * 4)
+        rows = TursoResponseParser.normalize_response(await self.vectors.connection.execute_query(sql, args))['rows']
+        return self.rerank(query_vector, (int(r[0]) for r in rows), top_k)